@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+
+"""Benchmarks for easy_config.
+
+Run them with ``tox -e benchmark``, which saves the results of every run under ``.benchmarks/``. To see whether a
+change made anything slower, compare against the most recent saved run with
+``tox -e benchmark -- --benchmark-compare --benchmark-group-by=group,param``, or list the history of one benchmark
+with ``pytest-benchmark compare --storage .benchmarks``.
+
+The results of each release are committed under ``benchmarks/results/``: when releasing, save them with
+``tox -e benchmark-release -- 1.1.0``. To see what changed since a release, compare its results with a saved run, e.g.
+``pytest-benchmark compare benchmarks/results/*/*_1.1.0.json .benchmarks/*/0007_*.json --group-by=group,param``.
+Timings are only comparable between runs on similar machines; the machine of each run is recorded in its results.
+"""
+
+import tracemalloc
+from typing import Any, Callable, Sequence, Tuple, TypeVar
+
+from easy_config import EasyConfig
+
+T = TypeVar('T')
+
+
+def make_config_class(name: str, field_count: int, field_types: Sequence[Any], **class_variables: Any) -> type:
+    """Create an :class:`EasyConfig` subclass with fields named ``field_<i>``, cycling through field_types.
+
+    :param class_variables: the class variables of the class, such as ``NAME``, ``FILES``, and ``FORMAT``
+    """
+    annotations = {f'field_{i}': field_types[i % len(field_types)] for i in range(field_count)}
+    return type(EasyConfig)(name, (EasyConfig,), dict(class_variables, __annotations__=annotations))
+
+
+def trace_memory(fn: Callable[[], T]) -> Tuple[T, int, int]:
+    """Call fn while :mod:`tracemalloc` traces memory allocations.
+
+    :returns: the result of fn, the number of bytes it allocated that are still in use when it returns, and the peak
+     number of bytes in use while it ran
+    """
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        result = fn()
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, current - before, peak
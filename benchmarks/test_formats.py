@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+
+"""Compare the cost of parsing and coercing the same values from INI, JSON, and TOML files.
+
+The files are read from memory, so that neither disk access nor :data:`easy_config.file_cache` is measured.
+"""
+
+import json
+import sys
+from io import StringIO
+
+import pytest
+
+from benchmarks import make_config_class
+
+FIELD_COUNT = 150
+FIELD_TYPES = [int, float, bool, str]
+VALUES = {int: 3, float: 5.5, bool: True, str: 'hello'}
+
+
+VALUES_BY_NAME = {f'field_{i}': VALUES[FIELD_TYPES[i % len(FIELD_TYPES)]] for i in range(FIELD_COUNT)}
+TEXTS = {
+    'ini': '[Bench]\n' + ''.join(f'{name} = {value}\n' for name, value in VALUES_BY_NAME.items()),
+    'json': json.dumps({'Bench': VALUES_BY_NAME}),
+    'toml': '[Bench]\n' + ''.join(f'{name} = {json.dumps(value)}\n' for name, value in VALUES_BY_NAME.items()),
+}
+
+
+@pytest.mark.parametrize(
+    'file_format',
+    [
+        'ini',
+        'json',
+        pytest.param('toml', marks=pytest.mark.skipif(sys.version_info < (3, 11), reason='tomllib is new in 3.11')),
+    ],
+)
+@pytest.mark.benchmark(group='file_formats')
+def test_read_format(benchmark, file_format):
+    """Benchmark parsing a file and coercing its values."""
+    cls = make_config_class(
+        f'{file_format.upper()}Config', FIELD_COUNT, FIELD_TYPES, NAME='Bench', FILES=None, FORMAT=file_format
+    )
+    text = TEXTS[file_format]
+    assert benchmark(lambda: cls._read_file(StringIO(text))) == VALUES_BY_NAME
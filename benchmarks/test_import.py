@@ -0,0 +1,18 @@
+# -*- coding: utf-8 -*-
+
+"""Measure how long ``import easy_config`` takes in a fresh interpreter, including the modules it imports.
+
+The ``import_microseconds`` extra info is the cumulative import time reported by ``python -X importtime``. The import
+time is checked against a budget by ``tests/test_import_time.py``, which runs with the unit tests.
+"""
+
+import pytest
+
+from tests.test_import_time import import_times
+
+
+@pytest.mark.benchmark(group='import')
+def test_import_time(benchmark):
+    """Benchmark importing easy_config in a new interpreter."""
+    times = benchmark.pedantic(lambda: [import_times('import easy_config')['easy_config'] for _ in range(5)], rounds=1)
+    benchmark.extra_info['import_microseconds'] = min(times)
@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+
+"""Compare the memory used by instances of configuration classes with and without ``SLOTS``.
+
+The ``bytes_per_instance`` extra info of each result is measured with :mod:`tracemalloc`; the timings are for
+creating the instances. Instances returned by :meth:`easy_config.EasyConfig.load` are measured separately, so that
+anything a load keeps alive along with its instance counts towards it.
+"""
+
+from typing import Any, List
+
+import pytest
+
+from benchmarks import trace_memory
+from easy_config import EasyConfig
+
+INSTANCE_COUNT = 10000
+LOADED_COUNT = 1000
+
+
+class TenantConfig(EasyConfig):
+    """A small per-tenant configuration, stored in a ``__dict__`` on every instance."""
+
+    FILES = None
+    NAME = 'Tenant'
+
+    tenant_id: int
+    name: str
+    quota: float = 1.0
+    enabled: bool = True
+
+
+class SlottedTenantConfig(EasyConfig):
+    """The same configuration, stored in ``__slots__``."""
+
+    FILES = None
+    NAME = 'Tenant'
+    SLOTS = True
+
+    tenant_id: int
+    name: str
+    quota: float = 1.0
+    enabled: bool = True
+
+
+def create(cls: type) -> List[Any]:
+    """Create many instances of cls."""
+    return [cls(tenant_id=i, name='tenant', quota=2.0, enabled=False) for i in range(INSTANCE_COUNT)]
+
+
+@pytest.mark.parametrize('cls', [TenantConfig, SlottedTenantConfig], ids=['dict', 'slots'])
+@pytest.mark.benchmark(group='instance_layout')
+def test_instance_layout(benchmark, cls):
+    """Benchmark creating many instances and record how much memory each one takes."""
+    instances, allocated, _ = trace_memory(lambda: create(cls))
+    # the list holding the instances is the same size for both layouts
+    benchmark.extra_info['bytes_per_instance'] = allocated / len(instances)
+    benchmark(create, cls)
+
+
+@pytest.fixture
+def tenant_ini(tmp_path):
+    """Create an INI file with the values of a tenant, and parse it once so that loads reuse the cached contents."""
+    path = tmp_path / 'tenant.ini'
+    path.write_text('[Tenant]\ntenant_id = 1\nname = tenant\nquota = 2.0\nenabled = false\n')
+    TenantConfig.load([path], _parse_environment=False)
+    return path
+
+
+def load(cls: Any, path: Any) -> List[Any]:
+    """Load many instances of cls from the file at path."""
+    return [cls.load([path], _parse_environment=False) for _ in range(LOADED_COUNT)]
+
+
+@pytest.mark.parametrize('cls', [TenantConfig, SlottedTenantConfig], ids=['dict', 'slots'])
+@pytest.mark.benchmark(group='loaded_layout')
+def test_loaded_layout(benchmark, cls, tenant_ini):
+    """Benchmark loading many instances and record how much memory each one takes, with whatever its load kept."""
+    instances, allocated, _ = trace_memory(lambda: load(cls, tenant_ini))
+    assert instances[0] == cls(tenant_id=1, name='tenant', quota=2.0, enabled=False)
+    benchmark.extra_info['bytes_per_instance'] = allocated / len(instances)
+    benchmark(load, cls, tenant_ini)
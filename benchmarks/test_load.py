@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+
+"""Benchmarks for :meth:`easy_config.EasyConfig.load`."""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from easy_config import EasyConfig
+
+LAYERED_FILE_COUNT = 8
+FILE_LATENCY = 0.002  # seconds; roughly one open() on a network filesystem
+
+
+class SlowFilesConfig(EasyConfig):
+    """A configuration whose files take a fixed time to open."""
+
+    FILES = [f'layer_{i}.ini' for i in range(LAYERED_FILE_COUNT)]
+    NAME = 'Slow'
+
+    number: int = 0
+
+    @classmethod
+    def _read_file(cls, config_file):
+        """Simulate the latency of opening a file on a network filesystem."""
+        time.sleep(FILE_LATENCY)
+        return {'number': int(config_file[len('layer_'):-len('.ini')])}
+
+
+@pytest.mark.benchmark(group='layered_files')
+def test_load_layered_serial(benchmark):
+    """Benchmark loading layered files one after another; later files in FILES take precedence."""
+    assert benchmark(SlowFilesConfig.load, _parse_environment=False).number == LAYERED_FILE_COUNT - 1
+
+
+@pytest.mark.benchmark(group='layered_files')
+def test_load_layered_executor(benchmark):
+    """Benchmark loading layered files concurrently in a reused thread pool."""
+    with ThreadPoolExecutor(max_workers=LAYERED_FILE_COUNT) as executor:
+        config = benchmark(SlowFilesConfig.load, _parse_environment=False, _executor=executor)
+    assert config.number == LAYERED_FILE_COUNT - 1
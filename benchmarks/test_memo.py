@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+
+"""Compare the memory used by many tenant configurations loaded from rows with and without ``MEMOIZE``.
+
+The rows repeat a few regions, database URLs, and networks, as tenant configurations do. The ``bytes_per_instance``
+extra info of each result is measured with :mod:`tracemalloc`, after the rows are created, so it only counts the
+instances and the values coerced for them; the timings are for loading the instances. The ``memo_load`` group loads a
+smaller number of instances with :meth:`easy_config.EasyConfig.load`, one row of keyword arguments at a time.
+"""
+
+import ipaddress
+from typing import Any, Dict, List
+
+import pytest
+
+from benchmarks import trace_memory
+from easy_config import EasyConfig, coercion_memo
+
+ROW_COUNT = 10000
+LOADED_COUNT = 1000
+
+ROWS: List[Dict[str, Any]] = [
+    {
+        'region': f'us-east-{i % 3}',
+        'database_url': f'postgres://db{i % 5}.internal:5432/tenants',
+        'network': f'10.{i % 4}.0.0/16',
+        'replicas': str(i % 3 + 1),
+        'enabled': 'true',
+    }
+    for i in range(ROW_COUNT)
+]
+
+
+class TenantConfig(EasyConfig):
+    """A per-tenant configuration, coerced anew for every instance."""
+
+    FILES = None
+    NAME = 'Tenant'
+    SLOTS = True
+
+    region: str
+    database_url: str
+    network: ipaddress.IPv4Network
+    replicas: int
+    enabled: bool
+
+
+class MemoizedTenantConfig(TenantConfig):
+    """The same configuration, sharing the coerced values between instances."""
+
+    MEMOIZE = True
+
+
+def from_rows(cls: Any) -> List[Any]:
+    """Load an instance of cls for each row."""
+    return list(cls.from_rows(ROWS))
+
+
+@pytest.mark.parametrize('cls', [TenantConfig, MemoizedTenantConfig], ids=['plain', 'memoized'])
+@pytest.mark.benchmark(group='memo')
+def test_memo(benchmark, cls):
+    """Benchmark loading many instances and record how much memory each one takes with its values."""
+    coercion_memo.clear()
+    instances, allocated, _ = trace_memory(lambda: from_rows(cls))
+    assert instances[1].network == ipaddress.IPv4Network('10.1.0.0/16')
+    if cls.MEMOIZE:
+        assert instances[0].network is instances[4].network
+        assert coercion_memo.info().misses == 3 + 5 + 4 + 3 + 1  # the distinct raw values of each field
+    benchmark.extra_info['bytes_per_instance'] = allocated / len(instances)
+    benchmark(from_rows, cls)
+
+
+def load(cls: Any) -> List[Any]:
+    """Load an instance of cls for each of the first rows, passing its values as keyword arguments."""
+    return [cls.load(_parse_files=False, _parse_environment=False, **row) for row in ROWS[:LOADED_COUNT]]
+
+
+@pytest.mark.parametrize('cls', [TenantConfig, MemoizedTenantConfig], ids=['plain', 'memoized'])
+@pytest.mark.benchmark(group='memo_load')
+def test_memo_load(benchmark, cls):
+    """Benchmark loading instances with load() and record how much memory each one takes with its values."""
+    coercion_memo.clear()
+    instances, allocated, _ = trace_memory(lambda: load(cls))
+    if cls.MEMOIZE:
+        assert instances[0].network is instances[4].network
+    benchmark.extra_info['bytes_per_instance'] = allocated / len(instances)
+    benchmark(load, cls)
@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+
+"""Compare the compiled reader functions against the per-call field loops they replaced.
+
+Run with ``tox -e benchmark`` or ``pytest benchmarks``.
+"""
+
+import configparser
+import dataclasses
+import os
+from io import StringIO
+from typing import Any, Dict, Mapping
+
+import pytest
+
+from benchmarks import make_config_class
+from easy_config import ConfigValueCoercionError, _environment_boolean, file_cache
+
+FIELD_COUNT = 150
+FIELD_TYPES = [int, float, bool, str]
+RAW_VALUES = {int: '3', float: '5.5', bool: 'true', str: 'hello'}
+
+
+BenchConfig = make_config_class('BenchConfig', FIELD_COUNT, FIELD_TYPES, NAME='Bench', FILES=None)
+RAW = {field.name: RAW_VALUES[field.type] for field in dataclasses.fields(BenchConfig)}
+INI = '[Bench]\n' + ''.join(f'{name} = {value}\n' for name, value in RAW.items())
+
+
+def legacy_read_file(cls, config_file) -> Dict[str, Any]:
+    """Read a file the way ``EasyConfig._read_file`` did before the readers were compiled."""
+    config = configparser.ConfigParser()
+    config.read_file(config_file)
+    values = {}
+    for field in dataclasses.fields(cls):
+        try:
+            if field.type is int:
+                value = config.getint(cls.NAME, field.name)
+            elif field.type is float:
+                value = config.getfloat(cls.NAME, field.name)
+            elif field.type is bool:
+                value = config.getboolean(cls.NAME, field.name)
+            else:
+                value = field.type(config.get(cls.NAME, field.name))
+            values[field.name] = value
+        except (configparser.NoSectionError, configparser.NoOptionError):
+            pass
+        except (TypeError, ValueError) as e:
+            raise ConfigValueCoercionError('<UNKNOWN>') from e
+    return values
+
+
+def legacy_read_environment(cls) -> Dict[str, Any]:
+    """Read the environment the way ``EasyConfig._read_environment`` did before the readers were compiled."""
+    values = {}
+    for field in dataclasses.fields(cls):
+        prefixed_field_name = f'{cls.NAME}_{field.name}'.upper()
+        try:
+            if field.type is bool:
+                values[field.name] = field.type(_environment_boolean(os.environ[prefixed_field_name]))
+            else:
+                values[field.name] = field.type(os.environ[prefixed_field_name])
+        except KeyError:
+            pass
+        except (TypeError, ValueError) as e:
+            raise ConfigValueCoercionError(prefixed_field_name) from e
+    return values
+
+
+def legacy_read_dict(cls, d: Mapping[str, Any]) -> Dict[str, Any]:
+    """Read a mapping the way ``EasyConfig._read_dict`` did before the readers were compiled."""
+    values = {}
+    for field in dataclasses.fields(cls):
+        if field.name in d:
+            try:
+                values[field.name] = field.type(d[field.name])
+            except (TypeError, ValueError) as e:
+                raise ConfigValueCoercionError(field.name) from e
+    return values
+
+
+@pytest.fixture
+def bench_env():
+    """Put a value for every other benchmark field into the environment."""
+    names = [f'BENCH_{name}'.upper() for name in list(RAW)[::2]]
+    for name, value in zip(names, list(RAW.values())[::2]):
+        os.environ[name] = value
+    yield
+    for name in names:
+        del os.environ[name]
+
+
+@pytest.mark.benchmark(group='read_file')
+def test_read_file_legacy(benchmark):
+    """Benchmark the legacy file reader."""
+    assert benchmark(lambda: legacy_read_file(BenchConfig, StringIO(INI))) == BenchConfig._read_file(StringIO(INI))
+
+
+@pytest.mark.benchmark(group='read_file')
+def test_read_file_compiled(benchmark):
+    """Benchmark the compiled file reader."""
+    benchmark(lambda: BenchConfig._read_file(StringIO(INI)))
+
+
+@pytest.mark.benchmark(group='read_environment')
+def test_read_environment_legacy(benchmark, bench_env):
+    """Benchmark the legacy environment reader."""
+    assert benchmark(legacy_read_environment, BenchConfig) == BenchConfig._read_environment()
+
+
+@pytest.mark.benchmark(group='read_environment')
+def test_read_environment_compiled(benchmark, bench_env):
+    """Benchmark the compiled environment reader."""
+    benchmark(BenchConfig._read_environment)
+
+
+@pytest.mark.benchmark(group='read_dict')
+def test_read_dict_legacy(benchmark):
+    """Benchmark the legacy mapping reader."""
+    assert benchmark(legacy_read_dict, BenchConfig, RAW) == BenchConfig._read_dict(RAW)
+
+
+@pytest.mark.benchmark(group='read_dict')
+def test_read_dict_compiled(benchmark):
+    """Benchmark the compiled mapping reader."""
+    benchmark(BenchConfig._read_dict, RAW)
+
+
+@pytest.fixture
+def bench_ini(tmp_path):
+    """Write the benchmark INI to a file and reset the parsed file cache around the benchmark."""
+    path = tmp_path / 'bench.ini'
+    path.write_text(INI)
+    file_cache.clear()
+    yield path
+    file_cache.maxsize = 128
+    file_cache.clear()
+
+
+@pytest.mark.benchmark(group='read_path')
+def test_read_path_uncached(benchmark, bench_ini):
+    """Benchmark reading a file by path with the parsed file cache disabled."""
+    file_cache.maxsize = 0
+    benchmark(BenchConfig._read_file, bench_ini)
+
+
+@pytest.mark.benchmark(group='read_path')
+def test_read_path_cached(benchmark, bench_ini):
+    """Benchmark reading an unchanged file by path through the parsed file cache."""
+    benchmark(BenchConfig._read_file, bench_ini)
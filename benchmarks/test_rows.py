@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+
+"""Compare creating many configuration instances from rows one load at a time, by row, and by column."""
+
+from typing import Any, Dict, List
+
+import pytest
+
+from easy_config import EasyConfig
+
+ROW_COUNT = 10000
+
+
+class TenantConfig(EasyConfig):
+    """A small per-tenant configuration, as stored in a database table."""
+
+    FILES = None
+    NAME = 'Tenant'
+
+    tenant_id: int
+    name: str
+    quota: float = 1.0
+    enabled: bool = True
+
+
+ROWS: List[Dict[str, Any]] = [
+    {'tenant_id': str(i), 'name': f'tenant{i}', 'quota': '2.5', 'enabled': bool(i % 2)} for i in range(ROW_COUNT)
+]
+COLUMNS: Dict[str, List[Any]] = {name: [row[name] for row in ROWS] for name in ROWS[0]}
+
+
+def load_each() -> List[TenantConfig]:
+    """Create the instances with one call to :meth:`easy_config.EasyConfig.load` per row."""
+    return [TenantConfig.load(_parse_files=False, _parse_environment=False, **row) for row in ROWS]
+
+
+def from_rows() -> List[TenantConfig]:
+    """Create the instances with :meth:`easy_config.EasyConfig.from_rows`."""
+    return list(TenantConfig.from_rows(ROWS))
+
+
+def from_columns() -> List[TenantConfig]:
+    """Create the instances with :meth:`easy_config.EasyConfig.from_columns`."""
+    return TenantConfig.from_columns(COLUMNS)
+
+
+@pytest.mark.parametrize('create', [load_each, from_rows, from_columns], ids=['load', 'rows', 'columns'])
+@pytest.mark.benchmark(group='rows')
+def test_rows(benchmark, create):
+    """Benchmark creating an instance for each of many rows; the extra info records instances per second."""
+    instances = benchmark(create)
+    last = ROW_COUNT - 1
+    assert instances[-1] == TenantConfig(tenant_id=last, name=f'tenant{last}', quota=2.5, enabled=True)
+    if benchmark.stats is not None:  # None with --benchmark-disable, which runs create once without timing it
+        benchmark.extra_info['rows_per_second'] = ROW_COUNT / benchmark.stats.stats.mean
@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+
+"""Measure how loading, reading, and dumping scale with the size of the configuration and its sources.
+
+Besides timing, the ``memory`` benchmarks record the peak memory allocated while loading, as measured by
+:mod:`tracemalloc`, in the ``peak_memory`` extra info of each result.
+"""
+
+import dataclasses
+import os
+from decimal import Decimal
+from io import StringIO
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+from benchmarks import make_config_class, trace_memory
+from easy_config import file_cache
+
+FIELD_COUNTS = [10, 100, 1000]
+LAYER_COUNTS = [1, 4, 16]
+ENVIRONMENT_SIZES = [0, 1000, 10000]
+FIELD_TYPES = [int, float, bool, str]
+RAW_VALUES: Dict[Any, str] = {int: '3', float: '5.5', bool: 'true', str: 'hello', Decimal: '1.10'}
+
+
+class Version(tuple):
+    """A custom type that parses dotted version strings, standing in for user-defined field types."""
+
+    def __new__(cls, value: str) -> 'Version':
+        """Parse a version such as ``'1.2.3'``."""
+        return super().__new__(cls, (int(part) for part in value.split('.')))
+
+
+RAW_VALUES[Version] = '1.2.3'
+
+
+def scaled_class(field_count: int, field_types: List[Any] = FIELD_TYPES, files: Optional[List[str]] = None) -> type:
+    """Create a configuration class with ``field_count`` fields cycling through ``field_types``."""
+    return make_config_class(f'Scaled{field_count}', field_count, field_types, NAME='Scaled', FILES=files)
+
+
+def raw_values(cls: type) -> Dict[str, str]:
+    """Get a raw string value for every field of a configuration class."""
+    return {field.name: RAW_VALUES[field.type] for field in dataclasses.fields(cls)}
+
+
+def ini(cls: type) -> str:
+    """Get an INI file with a value for every field of a configuration class."""
+    return '[Scaled]\n' + ''.join(f'{name} = {value}\n' for name, value in raw_values(cls).items())
+
+
+@pytest.fixture
+def environment(request):
+    """Fill the environment with the given number of variables unrelated to the configuration."""
+    names = [f'UNRELATED_VARIABLE_{i}' for i in range(request.param)]
+    for name in names:
+        os.environ[name] = 'value'
+    yield
+    for name in names:
+        del os.environ[name]
+
+
+@pytest.fixture
+def clean_file_cache():
+    """Clear the parsed file cache before and after the benchmark."""
+    file_cache.clear()
+    yield
+    file_cache.clear()
+
+
+@pytest.mark.parametrize('field_count', FIELD_COUNTS)
+@pytest.mark.benchmark(group='scaling_read_file')
+def test_read_file(benchmark, field_count):
+    """Benchmark reading an open file that has a value for every field."""
+    cls = scaled_class(field_count)
+    text = ini(cls)
+    assert len(benchmark(lambda: cls._read_file(StringIO(text)))) == field_count
+
+
+@pytest.mark.parametrize('field_count', FIELD_COUNTS)
+@pytest.mark.benchmark(group='scaling_read_environment')
+def test_read_environment(benchmark, field_count, monkeypatch):
+    """Benchmark reading the environment when it has a value for every field."""
+    cls = scaled_class(field_count)
+    for name, value in raw_values(cls).items():
+        monkeypatch.setenv(f'SCALED_{name}'.upper(), value)
+    assert len(benchmark(cls._read_environment)) == field_count
+
+
+@pytest.mark.parametrize('field_count', FIELD_COUNTS)
+@pytest.mark.benchmark(group='scaling_read_dict')
+def test_read_dict(benchmark, field_count):
+    """Benchmark reading a mapping that has a value for every field."""
+    cls = scaled_class(field_count)
+    assert len(benchmark(cls._read_dict, raw_values(cls))) == field_count
+
+
+@pytest.mark.parametrize('field_count', FIELD_COUNTS)
+@pytest.mark.benchmark(group='scaling_load')
+def test_load(benchmark, field_count, tmp_path, clean_file_cache):
+    """Benchmark loading from an unchanged file by path, half of the values overridden by keyword arguments."""
+    path = tmp_path / 'scaled.ini'
+    cls = scaled_class(field_count, files=[str(path)])
+    path.write_text(ini(cls))
+    overrides = dict(list(raw_values(cls).items())[::2])
+    benchmark(cls.load, _parse_environment=False, **overrides)
+
+
+@pytest.mark.parametrize('field_count', FIELD_COUNTS)
+@pytest.mark.benchmark(group='scaling_dump')
+def test_dump(benchmark, field_count):
+    """Benchmark dumping a configuration."""
+    cls = scaled_class(field_count)
+    config = cls.load(_parse_environment=False, **raw_values(cls))
+    benchmark(lambda: config.dump(StringIO()))
+
+
+@pytest.mark.parametrize('layer_count', LAYER_COUNTS)
+@pytest.mark.benchmark(group='scaling_layers')
+def test_load_layers(benchmark, layer_count, tmp_path, clean_file_cache):
+    """Benchmark loading from several files by path, each with a value for every field."""
+    paths = [str(tmp_path / f'layer_{i}.ini') for i in range(layer_count)]
+    cls = scaled_class(100, files=paths)
+    for path in paths:
+        with open(path, 'w') as f:
+            f.write(ini(cls))
+    benchmark(cls.load, _parse_environment=False)
+
+
+@pytest.mark.parametrize('environment', ENVIRONMENT_SIZES, indirect=True)
+@pytest.mark.benchmark(group='scaling_environment_size')
+def test_load_environment_size(benchmark, environment):
+    """Benchmark loading from an environment crowded with variables unrelated to the configuration."""
+    cls = scaled_class(100)
+    values = raw_values(cls)
+    benchmark(cls.load, **values)
+
+
+@pytest.mark.parametrize('field_type', [str, Decimal, Version], ids=lambda field_type: field_type.__name__)
+@pytest.mark.benchmark(group='scaling_custom_types')
+def test_custom_type_coercion(benchmark, field_type):
+    """Benchmark reading a file whose fields all have the same type, comparing built-in and custom types."""
+    cls = scaled_class(100, field_types=[field_type])
+    text = ini(cls)
+    assert benchmark(lambda: cls._read_file(StringIO(text)))['field_0'] == field_type(RAW_VALUES[field_type])
+
+
+@pytest.mark.parametrize('field_count', FIELD_COUNTS)
+@pytest.mark.benchmark(group='scaling_memory')
+def test_load_memory(benchmark, field_count):
+    """Benchmark loading from an open file and record the peak memory it allocates."""
+    cls = scaled_class(field_count)
+    text = ini(cls)
+
+    def load() -> Any:
+        return cls.load([StringIO(text)], _parse_environment=False)
+
+    benchmark.extra_info['peak_memory'] = trace_memory(load)[2]
+    benchmark(load)
@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+
+"""Compare reading one section of a large shared INI file with parsing the whole file."""
+
+import configparser
+
+import pytest
+
+from easy_config import ParsedFileCache
+
+SECTION_COUNT = 500
+OPTION_COUNT = 20
+
+
+@pytest.fixture(scope='module')
+def large_ini(tmp_path_factory):
+    """Write an INI file with many sections of many options."""
+    path = tmp_path_factory.mktemp('sections') / 'large.ini'
+    with open(path, 'w') as f:
+        for section in range(SECTION_COUNT):
+            f.write(f'[section_{section}]\n')
+            f.writelines(f'option_{option} = value {option}\n' for option in range(OPTION_COUNT))
+    return path
+
+
+def parse_whole(path, section):
+    """Parse the whole file with ConfigParser, as reading the section did before."""
+    config = configparser.ConfigParser()
+    config.read(path)
+    return dict(config[section])
+
+
+def parse_section(path, section):
+    """Read only the section, without caching."""
+    return dict(ParsedFileCache(maxsize=0).parse_section(path, section))
+
+
+@pytest.mark.parametrize('read', [parse_whole, parse_section], ids=['configparser', 'scanner'])
+@pytest.mark.parametrize('position', ['first', 'middle', 'last'])
+@pytest.mark.benchmark(group='large_ini')
+def test_read_section(benchmark, large_ini, read, position):
+    """Benchmark reading a section near the start, in the middle, or at the end of the file."""
+    section = {'first': 'section_0', 'middle': f'section_{SECTION_COUNT // 2}', 'last': f'section_{SECTION_COUNT - 1}'}
+    values = benchmark(read, large_ini, section[position])
+    assert len(values) == OPTION_COUNT
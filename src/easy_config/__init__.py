@@ -2,21 +2,30 @@
 
 """Parse configuration values from files, the environment, and elsewhere all in one place."""
 
-import configparser
 import dataclasses
-import logging
 import os
-from collections import ChainMap
-from distutils.util import strtobool
-from pathlib import Path
+import sys
+import threading
+import time
+import weakref
+from collections import ChainMap, OrderedDict
+from functools import lru_cache, partial
 from typing import (
     Any,
+    Callable,
+    ClassVar,
     Dict,
+    FrozenSet,
     Generator,
     Iterable,
+    Iterator,
     List,
     Mapping,
+    NamedTuple,
     Optional,
+    Sequence,
+    Set,
+    TYPE_CHECKING,
     TextIO,
     Tuple,
     Type,
@@ -24,6 +33,14 @@ from typing import (
     Union,
 )
 
+if TYPE_CHECKING:
+    import configparser  # noqa: F401
+    from concurrent.futures import Executor  # noqa: F401
+    from pathlib import Path  # noqa: F401
+
+    from easy_config.lazy import LazyConfig  # noqa: F401
+    from easy_config.metrics import MetricsSink  # noqa: F401
+    from easy_config.refresh import FieldChange  # noqa: F401
 
 # metadata
 __version__ = '1.0.0'
@@ -39,9 +56,17 @@ __email__ = 'scolby33@gmail.com'
 __license__ = 'MIT'
 __copyright__ = 'Copyright (c) 2018 Scott Colby'
 
-logger = logging.getLogger(__name__)
-
 EasyConfigOrSubclass = TypeVar('EasyConfigOrSubclass', bound='EasyConfig')
+T = TypeVar('T')
+
+# the kinds of sources whose reads block on I/O, which are read in an executor when one is given
+_BLOCKING_KINDS = ('file', 'plugin')
+
+# sentinel for "this source has no value for this field"; distinct from None, which can be a real value
+_MISSING = object()
+
+# where loading reports its metrics; set with easy_config.metrics.set_metrics_sink, and None to skip measuring at all
+_metrics_sink: Optional['MetricsSink'] = None
 
 
 class ConfigValueCoercionError(ValueError):
@@ -50,6 +75,1281 @@ class ConfigValueCoercionError(ValueError):
     Example: field type is ``int`` and the value is ``None`` or ``'apple'``.
     """
 
+    #: the name of the field whose value could not be coerced, when known
+    field: Optional[str] = None
+
+
+# the same as configparser.ConfigParser.BOOLEAN_STATES
+_INI_BOOLEAN_STATES = {
+    '1': True, 'yes': True, 'true': True, 'on': True,
+    '0': False, 'no': False, 'false': False, 'off': False,
+}
+# the same as distutils.util.strtobool, which accepts a few more spellings than INI files do
+_ENVIRONMENT_BOOLEAN_STATES = dict(_INI_BOOLEAN_STATES, y=True, t=True, n=False, f=False)
+
+
+def _debug(message: str, *args: Any) -> None:
+    """Log a debug message, but only if :mod:`logging` is already imported.
+
+    Until something imports logging, nothing can have configured a handler that would show the message.
+    """
+    logging = sys.modules.get('logging')
+    if logging is not None:
+        logging.getLogger(__name__).debug(message, *args)
+
+
+def __getattr__(name: str) -> Any:
+    """Create the ``logger`` of the module when it is first used, so that importing easy_config does not import logging."""
+    if name == 'logger':
+        import logging
+
+        return logging.getLogger(__name__)
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
+def _ini_boolean(value: str) -> bool:
+    """Convert an INI value to a boolean the same way :meth:`configparser.ConfigParser.getboolean` does."""
+    try:
+        return _INI_BOOLEAN_STATES[value.lower()]
+    except KeyError:
+        raise ValueError(f'Not a boolean: {value}') from None
+
+
+def _environment_boolean(value: str) -> bool:
+    """Convert an environment variable value to a boolean the same way :func:`distutils.util.strtobool` does."""
+    try:
+        return _ENVIRONMENT_BOOLEAN_STATES[value.lower()]
+    except KeyError:
+        raise ValueError(f'invalid truth value {value!r}') from None
+
+
+class _FieldPlan(NamedTuple):
+    """What the readers of a configuration class know about one of its fields."""
+
+    name: str
+    type: Any
+    environment_name: str
+    #: whether the field is a ``Dict[str, T]`` gathered from all of the keys that start with its name
+    mapping: bool
+    coerce_section: Callable[[Any], Any]
+    coerce_environment: Callable[[Any], Any]
+    coerce_dict: Callable[[Any], Any]
+    #: coerces values from files whose values are already typed, such as JSON
+    coerce_typed: Callable[[Any], Any]
+    #: the readers of the field's type, when it is a configuration class of its own, read from its own INI section and
+    #: environment variables
+    nested: Optional['_ReaderPlan'] = None
+
+    def key(self, kind: str) -> str:
+        """Get the key this field is looked up by in a kind of source, or the prefix of its keys for mapping fields.
+
+        :param kind: the kind of source
+        """
+        if kind == 'environment':
+            return self.environment_name + '_' if self.mapping else self.environment_name
+        if kind == 'file' and self.mapping:
+            return self.name.lower() + '_'  # ConfigParser lowercases option names
+        return self.name
+
+    def error(self, kind: str, description: str) -> ConfigValueCoercionError:
+        """Build the error raised for a value of this field that cannot be coerced.
+
+        :param kind: the kind of source the value came from
+        :param description: the description of the source, used for files and plugin sources
+        """
+        if kind == 'file':
+            location = f'the configuration file `{description}`'
+        elif kind == 'plugin':
+            location = f'the configuration source `{description}`'
+        elif kind == 'environment' and self.mapping:
+            location = f'environment variables `{self.environment_name}_*`'
+        elif kind == 'environment':
+            location = f'environment variable `{self.environment_name}`'
+        else:
+            location = 'a dictionary'
+        error = ConfigValueCoercionError(
+            f'While reading {location}, could not coerce value for field `{self.name}` to type `{self.type}`'
+        )
+        error.field = self.name
+        return error
+
+    def coerce(self, kind: str, raw: Any, description: str) -> Any:
+        """Coerce a single raw value, raising the same error as the compiled reader for its kind of source would.
+
+        :param kind: the kind of source the value came from
+        :param raw: the value as it appears in the source
+        :param description: the description of the source, used in error messages for files
+        :raises ConfigValueCoercionError: when an error occurs calling the type constructor on the value
+        """
+        if kind == 'file':
+            coerce = self.coerce_section
+        elif kind == 'environment':
+            coerce = self.coerce_environment
+        else:
+            coerce = self.coerce_dict
+        try:
+            return coerce(raw)
+        except (TypeError, ValueError) as e:
+            raise self.error(kind, description) from e
+
+
+class _ReaderPlan(NamedTuple):
+    """The specialized reader functions compiled for a configuration class."""
+
+    fields: Dict[str, _FieldPlan]
+    field_names: FrozenSet[str]
+    #: the INI section the class reads, e.g. ``'myprogram'``, or ``'myprogram.db'`` for a nested class
+    section: str
+    #: the INI sections of the class and all of its nested classes
+    sections: Tuple[str, ...]
+    #: the fields whose types are configuration classes
+    nested_fields: Tuple[_FieldPlan, ...]
+    #: the start of the names of all environment variables the class reads, e.g. ``'MYPROGRAM_'``
+    environment_prefix: str
+    #: whether any field is a mapping field, which needs the environment to be scanned
+    has_mappings: bool
+    #: called as ``read_section(section, source, kind='file')``, where source describes the file or other source of the
+    #: section in error messages, and kind is the kind of that source
+    read_section: Callable[..., Dict[str, Any]]
+    read_environment: Callable[[Mapping[str, str]], Dict[str, Any]]
+    read_dict: Callable[[Mapping[str, Any]], Dict[str, Any]]
+    #: called like read_section
+    read_typed: Callable[..., Dict[str, Any]]
+
+
+def _scan(mapping: Mapping[str, Any], prefix: str, lower: bool = False) -> Any:
+    """Gather the values of a mapping field: all entries whose keys start with prefix, keyed by the rest of their key.
+
+    :param lower: lowercase the rest of the keys, as for environment variables, so that they are the same as those
+     of INI options, which ConfigParser lowercases
+    :returns: the gathered values, or ``_MISSING`` if there are none
+    """
+    start = len(prefix)
+    if lower:
+        values = {key[start:].lower(): mapping[key] for key in mapping if key.startswith(prefix) and key != prefix}
+    else:
+        values = {key[start:]: mapping[key] for key in mapping if key.startswith(prefix) and key != prefix}
+    return values or _MISSING
+
+
+class _RawView(Mapping[str, Any]):
+    """A read-only view of the uncoerced values in the environment or an INI section, keyed by field name."""
+
+    def __init__(self, fields: Dict[str, _FieldPlan], mapping: Mapping[str, Any], kind: str) -> None:
+        self._fields = fields
+        self._mapping = mapping
+        self._kind = kind
+
+    def __getitem__(self, name: str) -> Any:
+        field = self._fields[name]
+        if not field.mapping:
+            key = field.key(self._kind)
+            if self._kind == 'file' and key.lower() in self._mapping:
+                return self._mapping[key.lower()]
+            return self._mapping[key]
+        values = _scan(self._mapping, field.key(self._kind), self._kind == 'environment')
+        if values is _MISSING:
+            raise KeyError(name)
+        return values
+
+    def __iter__(self) -> Iterator[str]:
+        return (name for name in self._fields if name in self)
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+
+def _create_fn(name: str, args: List[str], body: List[str], globals_: Dict[str, Any]) -> Callable[..., Any]:
+    """Compile a function from lines of source, in the same manner as :mod:`dataclasses` creates ``__init__``."""
+    body_text = '\n'.join(f'    {line}' for line in body)
+    text = f'def {name}({", ".join(args)}):\n{body_text}\n'
+    namespace: Dict[str, Any] = {}
+    exec(text, globals_, namespace)  # noqa: S102
+    fn: Callable[..., Any] = namespace[name]
+    return fn
+
+
+def _coercion_lines(index: int, field_name: str, lookup: str, error: str) -> List[str]:
+    """Build the source lines that look up, coerce, and store the value of a single field.
+
+    :param index: the position of the field, used to name the per-field global ``_coerce_<index>``
+    :param field_name: the name of the field the coerced value is stored under
+    :param lookup: an expression evaluating to the raw value, or ``_MISSING``
+    :param error: an expression evaluating to the exception raised when coercion fails
+    """
+    return [
+        f'raw = {lookup}',
+        'if raw is not _MISSING:',
+        '    try:',
+        f'        values[{field_name!r}] = _coerce_{index}(raw)',
+        '    except (TypeError, ValueError) as e:',
+        f'        raise {error} from e',
+    ]
+
+
+def _coerce_items(coerce: Callable[[Any], Any], raw: Any) -> Dict[str, Any]:
+    """Coerce each of the values of a mapping field."""
+    return {key: coerce(value) for key, value in dict(raw).items()}
+
+
+# the (value type, field type) pairs of typed values that can be converted without losing anything
+_TYPED_WIDENINGS = frozenset({(int, float)})
+
+
+def _coerce_typed(value_type: Any, coerce_string: Callable[[str], Any], raw: Any) -> Any:
+    """Coerce a value from a typed file: keep it if it already has the right type, and parse it if it is a string.
+
+    Other values are only converted when nothing is lost, such as an ``int`` for a ``float`` field; a ``float`` for an
+    ``int`` field or a list for a ``str`` field is an error, as it would be in an INI file.
+    """
+    if type(raw) is value_type:
+        return raw
+    if isinstance(raw, str):
+        return coerce_string(raw)
+    if (type(raw), value_type) in _TYPED_WIDENINGS:
+        return value_type(raw)
+    raise TypeError(f'expected {value_type}, not {type(raw).__name__}')
+
+
+def _coerce_nested(
+    config_class: Type['EasyConfig'], read: Callable[[Mapping[str, Any]], Dict[str, Any]], raw: Any
+) -> Dict[str, Any]:
+    """Read the values of a nested configuration class from a mapping, or take them from an instance of the class."""
+    if isinstance(raw, config_class):
+        return {name: getattr(raw, name) for name in config_class.__easy_config_plan__.fields}
+    if not isinstance(raw, Mapping):
+        raise TypeError(f'expected a mapping, not {type(raw).__name__}')
+    return read(raw)
+
+
+def _plan_nested_field(field: 'dataclasses.Field[Any]', nested: '_ReaderPlan', environment_name: str) -> _FieldPlan:
+    """Decide how each kind of source reads a field whose type is a configuration class.
+
+    Its values are read into a dictionary, which :meth:`EasyConfig._create` merges with those of the other sources.
+    """
+    config_class: Any = field.type
+    return _FieldPlan(
+        name=field.name,
+        type=config_class,
+        environment_name=environment_name,
+        mapping=False,
+        coerce_section=partial(_coerce_nested, config_class, lambda section: nested.read_section(section, '')),
+        coerce_environment=partial(_coerce_nested, config_class, nested.read_environment),
+        coerce_dict=partial(_coerce_nested, config_class, nested.read_dict),
+        coerce_typed=partial(_coerce_nested, config_class, lambda section: nested.read_typed(section, '')),
+        nested=nested,
+    )
+
+
+def _memoized(coerce: Callable[[Any], Any], raw: Any) -> Any:
+    """Coerce a value through :data:`coercion_memo`."""
+    return coercion_memo.coerce(coerce, raw)
+
+
+def _plan_field(
+    field: 'dataclasses.Field[Any]', section: str, environment_name: str, memoize: bool = False
+) -> _FieldPlan:
+    """Decide how each kind of source reads a field.
+
+    :param section: the INI section of the field's class, under which a nested class gets its own section
+    :param environment_name: the name of the field's environment variable
+    :param memoize: whether to coerce values through :data:`coercion_memo`; ignored for mutable types
+    """
+    field_type: Any = field.type
+    config_class = isinstance(field_type, _InheritDataclassForConfig) and hasattr(field_type, '__easy_config_plan__')
+    if config_class:
+        nested = _compile_readers(field_type, f'{section}.{field.name}', environment_name)
+        return _plan_nested_field(field, nested, environment_name)
+
+    args: Any = getattr(field_type, '__args__', None)
+    mapping = getattr(field_type, '__origin__', None) in (dict, Dict) and bool(args) and args[0] is str
+    value_type = args[1] if mapping else field_type
+
+    if value_type is int:
+        coerce_section: Callable[[Any], Any] = int
+    elif value_type is float:
+        coerce_section = float
+    elif value_type is bool:
+        coerce_section = _ini_boolean
+    else:
+        coerce_section = value_type
+    coerce_environment = _environment_boolean if value_type is bool else value_type
+    coerce_dict = value_type
+    coerce_typed: Callable[[Any], Any] = partial(_coerce_typed, value_type, coerce_section)
+    if memoize and not _mutable(value_type):
+        coerce_section = partial(_memoized, coerce_section)
+        coerce_environment = partial(_memoized, coerce_environment)
+        coerce_dict = partial(_memoized, coerce_dict)
+        coerce_typed = partial(_memoized, coerce_typed)
+    if mapping:
+        coerce_section = partial(_coerce_items, coerce_section)
+        coerce_environment = partial(_coerce_items, coerce_environment)
+        coerce_dict = partial(_coerce_items, coerce_dict)
+        coerce_typed = partial(_coerce_items, coerce_typed)
+
+    return _FieldPlan(
+        name=field.name,
+        type=field_type,
+        environment_name=environment_name,
+        mapping=mapping,
+        coerce_section=coerce_section,
+        coerce_environment=coerce_environment,
+        coerce_dict=coerce_dict,
+        coerce_typed=coerce_typed,
+    )
+
+
+def _nested_lines(index: int, field_name: str) -> Tuple[List[str], List[str]]:
+    """Build the source lines that read a nested configuration class from an INI section and from the environment.
+
+    Nested classes have INI sections of their own, so only files whose sections hold mappings, such as those of
+    formats registered as untyped, have their values in the section of the class. In the environment, they have
+    variables of their own under the prefix of the field.
+
+    :returns: the lines for the section reader and those for the environment reader
+    """
+    section_lines = [
+        f'raw = get({field_name!r}, _MISSING)',
+        'if isinstance(raw, Mapping):',
+        f'    values[{field_name!r}] = _field_{index}.nested.read_section(raw, source, kind)',
+    ]
+    environment_lines = [
+        f'nested = _field_{index}.nested.read_environment(environ)',
+        'if nested:',
+        f'    values[{field_name!r}] = nested',
+    ]
+    return section_lines, environment_lines
+
+
+def _compile_readers(
+    cls: Type['EasyConfig'], section: Optional[str] = None, environment_name: Optional[str] = None
+) -> _ReaderPlan:
+    """Generate the reader functions for a configuration class.
+
+    Everything that only depends on the class--the environment variable names and the coercion function for each
+    field--is computed once here instead of on every read. The readers of nested configuration classes are compiled
+    along with those of the class that contains them, so that a single pass over each source reads the whole tree.
+
+    :param section: the INI section to read, by default the NAME of the class
+    :param environment_name: the start of the names of the environment variables to read, by default the NAME of the
+     class
+    """
+    if section is None:
+        section = cls.NAME
+    if environment_name is None:
+        environment_name = cls.NAME
+    section_globals: Dict[str, Any] = {
+        '_MISSING': _MISSING,
+        '_scan': _scan,
+        'Mapping': Mapping,
+    }
+    environment_globals = dict(section_globals)
+    dict_globals = dict(section_globals)
+    typed_globals = dict(section_globals)
+    section_body = ['values = {}', 'get = section.get']
+    environment_body = ['values = {}', 'get = environ.get']
+    dict_body = ['values = {}', 'get = d.get']
+    typed_body = ['values = {}', 'get = section.get']
+
+    fields = {
+        field.name: _plan_field(field, section, f'{environment_name}_{field.name}'.upper(), cls.MEMOIZE)
+        for field in dataclasses.fields(cls)
+    }
+    for index, field in enumerate(fields.values()):
+        coerce_name = f'_coerce_{index}'
+        field_name = f'_field_{index}'
+        for globals_ in section_globals, environment_globals, dict_globals, typed_globals:
+            globals_[field_name] = field
+        lookup = '_scan({}, {!r}, {})' if field.mapping else 'get({1!r}, _MISSING)'
+
+        if field.nested is not None:
+            section_lines, environment_lines = _nested_lines(index, field.name)
+            section_body += section_lines
+            environment_body += environment_lines
+        else:
+            section_lookup = lookup.format('section', field.key('file'), False)
+            if not field.mapping and field.name != field.name.lower():
+                # INI option names are lowercased, like ConfigParser does, but other untyped sources keep their case
+                section_lookup = f'get({field.name.lower()!r}, {section_lookup})'
+            section_globals[coerce_name] = field.coerce_section
+            section_body += _coercion_lines(index, field.name, section_lookup, f"{field_name}.error(kind, source)")
+
+            environment_globals[coerce_name] = field.coerce_environment
+            environment_body += _coercion_lines(
+                index,
+                field.name,
+                lookup.format('environ', field.key('environment'), True),
+                f"{field_name}.error('environment', '')",
+            )
+
+        dict_globals[coerce_name] = field.coerce_dict
+        dict_body += _coercion_lines(
+            index, field.name, f'get({field.name!r}, _MISSING)', f"{field_name}.error('kwargs', '')"
+        )
+
+        # typed files nest the values of mapping fields, e.g. as a JSON object, instead of prefixing their keys
+        typed_globals[coerce_name] = field.coerce_typed
+        typed_body += _coercion_lines(
+            index, field.name, f'get({field.name!r}, _MISSING)', f"{field_name}.error(kind, source)"
+        )
+
+    nested_plans = [field.nested for field in fields.values() if field.nested is not None]
+    return _ReaderPlan(
+        fields=fields,
+        field_names=frozenset(fields),
+        section=section,
+        sections=(section, *(name for nested in nested_plans for name in nested.sections)),
+        nested_fields=tuple(field for field in fields.values() if field.nested is not None),
+        environment_prefix=f'{environment_name}_'.upper(),
+        has_mappings=any(field.mapping for field in fields.values()) or any(n.has_mappings for n in nested_plans),
+        read_section=_create_fn(
+            'read_section', ['section', 'source', "kind='file'"], section_body + ['return values'], section_globals
+        ),
+        read_environment=_create_fn(
+            'read_environment', ['environ'], environment_body + ['return values'], environment_globals
+        ),
+        read_dict=_create_fn('read_dict', ['d'], dict_body + ['return values'], dict_globals),
+        read_typed=_create_fn(
+            'read_typed', ['section', 'source', "kind='file'"], typed_body + ['return values'], typed_globals
+        ),
+    )
+
+
+class CacheInfo(NamedTuple):
+    """Statistics about a :class:`ParsedFileCache` or :class:`CoercionMemo`, like :func:`functools.lru_cache` gives."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class _UnsupportedIni(Exception):
+    """Raised by :class:`_IniSectionScanner` for files that only ConfigParser can read correctly."""
+
+
+class _IniSectionScanner:
+    """Read some sections of an INI file line by line, giving the same values as :class:`configparser.ConfigParser`.
+
+    Options in other sections are not parsed, only checked for whether the next lines continue them, and scanning stops
+    once every section has been read when no ``[DEFAULT]`` section can follow. This covers files that ConfigParser reads
+    without errors and without interpolation. For others, :class:`_UnsupportedIni` is raised so that ConfigParser can
+    read them, and raise its errors, instead. Errors in the options of other sections, and duplicates of the sections
+    after the end of the scan, are not detected.
+    """
+
+    def __init__(self, sections: Iterable[str]) -> None:
+        """Prepare to read sections.
+
+        :param sections: the names of the sections to read
+        """
+        import configparser
+
+        self._match_header = configparser.ConfigParser.SECTCRE.match
+        self._match_option = configparser.ConfigParser.OPTCRE.match
+        self._default_section = configparser.DEFAULTSECT
+        self.sections = tuple(sections)
+        self._wanted = set(self.sections) - {self._default_section}
+        self._defaults: Dict[str, List[str]] = {}
+        self._found: Dict[str, Dict[str, List[str]]] = {}
+        # where the options of the current section go: the defaults, a section, or None to skip them
+        self._current: Optional[Dict[str, List[str]]] = None
+        self._seen: Set[str] = set()
+        # the option that lines indented further than _indent_level continue, if any
+        self._option = ''
+        self._indent_level = 0
+        # in a skipped section, the last option line, which is only parsed if the next line may continue it
+        self._skipped: Optional[str] = None
+
+    def scan(self, lines: Iterable[str], last_default: int) -> Dict[str, Optional[Mapping[str, str]]]:
+        """Read the sections.
+
+        :param lines: the lines of the file
+        :param last_default: the index of the last line that may be a ``[DEFAULT]`` header; scanning stops once every
+         section has been read after it
+        :returns: for each section, its options followed by the defaults, like a ConfigParser section, or None if there
+         is no such section
+        :raises _UnsupportedIni: when the file has errors or one of the sections uses interpolation
+        """
+        if not self._wanted:
+            return dict.fromkeys(self.sections)
+        for index, line in enumerate(lines):
+            value = line.strip()
+            if not value:
+                if self._option and self._current is not None:
+                    self._current[self._option].append('')
+            elif value[0] not in '#;' and not self._continues(line, value):
+                header = self._match_header(value)
+                if header is None:
+                    self._option_line(value, index)
+                elif len(self._found) == len(self._wanted) and index > last_default:
+                    break  # every section has ended, and no more defaults follow
+                else:
+                    self._header(header.group('header'))
+        return {section: self._values(section) for section in self.sections}
+
+    def _continues(self, line: str, value: str) -> bool:
+        """Add a line to the value of the previous option if it is indented further; otherwise, note its indentation."""
+        indent = len(line) - len(line.lstrip())
+        if indent > self._indent_level:
+            if self._skipped is not None:
+                match = self._match_option(self._skipped)
+                self._option = match.group('option').rstrip().lower() if match else ''
+                self._skipped = None
+            if self._option:
+                if self._current is not None:
+                    self._current[self._option].append(value)
+                return True
+        self._indent_level = indent
+        return False
+
+    def _header(self, name: str) -> None:
+        """Start a section."""
+        if name == self._default_section:
+            self._current = self._defaults
+        elif name in self._seen:
+            raise _UnsupportedIni(f'duplicate section {name}')
+        else:
+            self._seen.add(name)
+            if name in self._wanted:
+                self._current = self._found[name] = {}
+            else:
+                self._current = None
+        self._option, self._skipped = '', None
+
+    def _option_line(self, value: str, index: int) -> None:
+        """Start an option."""
+        if not self._seen and self._current is None:
+            raise _UnsupportedIni('missing section header')
+        if self._current is None:
+            self._option, self._skipped = '', value
+            return
+        match = self._match_option(value)
+        if match is None:
+            raise _UnsupportedIni(f'bad option on line {index + 1}')
+        name = match.group('option').rstrip().lower()
+        if not name or name in self._current:
+            raise _UnsupportedIni(f'bad or duplicate option on line {index + 1}')
+        self._option = name
+        self._current[name] = [match.group('value').strip()]
+
+    def _values(self, section: str) -> Optional[Dict[str, str]]:
+        """Join the lines of the values of a section, and add the defaults."""
+        found = self._found.get(section)
+        if found is None:
+            return None
+        values = {name: '\n'.join(lines).rstrip() for name, lines in found.items()}
+        for name, lines in self._defaults.items():
+            values.setdefault(name, '\n'.join(lines).rstrip())
+        if any('%' in value for value in values.values()):
+            raise _UnsupportedIni('interpolation')
+        return values
+
+
+def _file_version(path: Union[str, 'Path']) -> Optional[Tuple[int, int, int]]:
+    """Identify the version of a file by its inode, modification time, and size, or None if it does not exist.
+
+    A file has changed when its version has, both for :class:`ParsedFileCache` and for
+    :class:`easy_config.watch.ConfigWatcher`.
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+
+def _replace_file(path: Union[str, 'Path'], *chunks: bytes) -> None:
+    """Write chunks to a file at once, so that readers of path see either its old contents or the new ones.
+
+    The chunks are written to a temporary file in the same directory, which can be renamed over path atomically;
+    mkstemp makes it private to the user.
+    """
+    import tempfile  # deferred: only saving snapshots and shared configurations needs it
+
+    fd, temporary_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), prefix='.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            for chunk in chunks:
+                f.write(chunk)
+        os.replace(temporary_path, path)
+    except BaseException:
+        os.remove(temporary_path)
+        raise
+
+
+class _CacheEntry:
+    """What a :class:`ParsedFileCache` knows about one version of a file."""
+
+    __slots__ = ('fingerprint', 'config', 'sections')
+
+    def __init__(self, fingerprint: Tuple[int, int, int]) -> None:
+        self.fingerprint = fingerprint
+        #: the whole file parsed by ConfigParser, once something needed it
+        self.config: Optional['configparser.ConfigParser'] = None
+        #: section name -> its options, or None if there is no such section
+        self.sections: Dict[str, Optional[Mapping[str, str]]] = {}
+
+
+class ParsedFileCache:
+    """A bounded, least-recently-used cache of parsed INI files shared by all configuration classes.
+
+    Entries are keyed by the absolute path of the file and validated against its inode, modification time (in
+    nanoseconds), and size, so loading an unchanged file costs a single ``stat()`` call instead of a full parse. A file
+    that is modified without changing any of these will not be re-read until it is invalidated explicitly.
+
+    Files can be parsed whole with :meth:`parse`, or a few sections at a time with :meth:`parse_section` and
+    :meth:`parse_sections`, which only parse the options of the requested sections. Both are cached.
+
+    The parsed :class:`configparser.ConfigParser` objects and sections are shared between callers and must not be
+    modified.
+    """
+
+    def __init__(self, maxsize: int = 128) -> None:
+        """Create a new cache.
+
+        :param maxsize: the maximum number of parsed files to keep; 0 disables caching
+        """
+        self._maxsize = maxsize
+        self._entries: 'OrderedDict[str, _CacheEntry]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def maxsize(self) -> int:
+        """The maximum number of parsed files to keep. Lowering it evicts the least recently used files."""
+        return self._maxsize
+
+    @maxsize.setter
+    def maxsize(self, maxsize: int) -> None:
+        with self._lock:
+            self._maxsize = maxsize
+            self._evict()
+
+    def parse(self, path: Union[str, 'Path']) -> 'configparser.ConfigParser':
+        """Parse the INI file at path, reusing the previously parsed contents if the file has not changed.
+
+        Like :meth:`configparser.ConfigParser.read`, a file that cannot be opened results in an empty parser.
+
+        :param path: the file to parse
+        :returns: the parsed file
+        """
+        # imported here instead of at the top of the module so `import easy_config` stays fast for short-lived programs
+        # that only read the environment
+        import configparser
+
+        key = os.path.abspath(path)
+        fingerprint = _file_version(key)
+        if fingerprint is None:
+            return configparser.ConfigParser()
+        entry = self._lookup(key, fingerprint, lambda entry: entry.config is not None)
+        if entry is not None and entry.config is not None:
+            return entry.config
+        return self._parse_whole(key, fingerprint)
+
+    def parse_section(self, path: Union[str, 'Path'], section: str) -> Optional[Mapping[str, str]]:
+        """Parse one section of the INI file at path, reusing the parsed contents if the file has not changed.
+
+        Only the lines of the requested section are parsed, and reading stops at its end when no ``[DEFAULT]`` section
+        follows, so this is much faster than :meth:`parse` for large files with many sections. The options are the same
+        as those of the section parsed by ConfigParser, including the defaults. Files that ConfigParser cannot read
+        without errors, or whose section uses interpolation, are parsed whole by :meth:`parse` instead.
+
+        :param path: the file to parse
+        :param section: the name of the section to read
+        :returns: the options in the section, or None if the file has no such section or cannot be opened
+        """
+        return self.parse_sections(path, [section])[section]
+
+    def parse_sections(
+        self, path: Union[str, 'Path'], sections: Iterable[str]
+    ) -> Dict[str, Optional[Mapping[str, str]]]:
+        """Parse some sections of the INI file at path in a single pass, like :meth:`parse_section` does for one.
+
+        :param path: the file to parse
+        :param sections: the names of the sections to read
+        :returns: the options in each section, or None for sections the file does not have or if it cannot be opened
+        """
+        sections = list(sections)
+        key = os.path.abspath(path)
+        fingerprint = _file_version(key)
+        if fingerprint is None:
+            return dict.fromkeys(sections)
+        entry = self._lookup(
+            key, fingerprint, lambda entry: entry.config is not None or entry.sections.keys() >= set(sections)
+        )
+        if entry is not None:
+            if entry.sections.keys() >= set(sections):
+                return {section: entry.sections[section] for section in sections}
+            assert entry.config is not None
+            return _config_sections(entry.config, sections)
+
+        try:
+            with open(key) as f:  # the same encoding as ConfigParser.read
+                text = f.read()
+        except OSError:
+            return dict.fromkeys(sections)
+        lines = text.split('\n')
+        # scanning can stop at the end of the sections if no [DEFAULT] section follows them
+        last_default = text.count('\n', 0, text.rfind('[DEFAULT]')) if '[DEFAULT]' in text else -1
+        try:
+            options = _IniSectionScanner(sections).scan(lines, last_default)
+        except _UnsupportedIni:
+            return _config_sections(self._parse_whole(key, fingerprint), sections)
+        with self._lock:
+            entry = self._entry(key, fingerprint)
+            if entry is not None:
+                entry.sections.update(options)
+        return dict(options)
+
+    def invalidate(self, path: Union[str, 'Path']) -> None:
+        """Forget the parsed contents of a single file.
+
+        :param path: the file to forget
+        """
+        with self._lock:
+            self._entries.pop(os.path.abspath(path), None)
+
+    def clear(self) -> None:
+        """Forget all parsed files and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+    def info(self) -> CacheInfo:
+        """Report the cache statistics.
+
+        :returns: the number of hits and misses, the maximum size, and the current size of the cache
+        """
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self._maxsize, len(self._entries))
+
+    def _lookup(
+        self, key: str, fingerprint: Tuple[int, int, int], usable: Callable[[_CacheEntry], bool]
+    ) -> Optional[_CacheEntry]:
+        """Get the entry for the current version of a file if it has what the caller needs, counting a hit or a miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.fingerprint == fingerprint and usable(entry):
+                self._entries.move_to_end(key)
+                self.hits += 1
+                hit = True
+            else:
+                self.misses += 1
+                hit = False
+        if _metrics_sink is not None:
+            _metrics_sink.increment(f'easy_config_file_cache_{"hits" if hit else "misses"}_total', {})
+        return entry if hit else None
+
+    def _parse_whole(self, key: str, fingerprint: Tuple[int, int, int]) -> 'configparser.ConfigParser':
+        """Parse a whole file with ConfigParser and cache it."""
+        import configparser
+
+        config = configparser.ConfigParser()
+        config.read(key)
+        with self._lock:
+            entry = self._entry(key, fingerprint)
+            if entry is not None:
+                entry.config = config
+        return config
+
+    def _entry(self, key: str, fingerprint: Tuple[int, int, int]) -> Optional[_CacheEntry]:
+        """Get the entry to add the parsed contents of a version of a file to, or None if caching is disabled.
+
+        An entry for an older version is replaced. Call with the lock held.
+        """
+        if self._maxsize <= 0:
+            return None
+        entry = self._entries.get(key)
+        if entry is None or entry.fingerprint != fingerprint:
+            entry = self._entries[key] = _CacheEntry(fingerprint)
+        self._entries.move_to_end(key)
+        self._evict()
+        return entry
+
+    def _evict(self) -> None:
+        """Drop the least recently used entries until the cache fits in its maximum size. Call with the lock held."""
+        while len(self._entries) > max(self._maxsize, 0):
+            self._entries.popitem(last=False)
+
+
+#: The process-wide cache used by :meth:`EasyConfig._read_file` when it is given a path.
+file_cache = ParsedFileCache()
+
+
+# the types of raw values that are memoized; others may be unhashable, or equal to values of another type
+_MEMOIZED_RAW_TYPES = frozenset({str, int, float, bool, bytes})
+# the types whose values are never shared between instances, because changing one would change them all
+_MUTABLE_TYPES = (list, dict, set, bytearray, List, Dict, Set)
+
+
+def _mutable(value_type: Any) -> bool:
+    """Whether the values of a field type can be modified in place."""
+    return value_type in _MUTABLE_TYPES or getattr(value_type, '__origin__', None) in _MUTABLE_TYPES
+
+
+def _call(coerce: Callable[[Any], Any], raw_type: type, raw: Any) -> Any:
+    """Coerce a raw value; the type of the raw value is only part of the key of the memo."""
+    return coerce(raw)
+
+
+class CoercionMemo:
+    """A bounded, least-recently-used memo of coerced values shared by all configuration classes that set MEMOIZE.
+
+    Entries are keyed by the coercion function of a field, which depends on its type and the kind of source, and the
+    raw value, so loading the same raw string, e.g. ``'us-east-1'``, into many instances coerces it once and gives
+    every instance the same object. Only raw strings, bytes, and numbers are memoized, and fields of mutable types
+    such as ``list`` never are. Values that cannot be coerced are not remembered.
+
+    The memoized values are shared between instances and must not be modified, so only set MEMOIZE on classes whose
+    field types are immutable, such as numbers, strings, :mod:`ipaddress` addresses, and compiled regular expressions.
+    """
+
+    def __init__(self, maxsize: int = 4096) -> None:
+        """Create a new memo.
+
+        :param maxsize: the maximum number of coerced values to keep
+        """
+        self._maxsize = maxsize
+        self._cached = lru_cache(maxsize)(_call)
+
+    @property
+    def maxsize(self) -> int:
+        """The maximum number of coerced values to keep. Changing it forgets all values and resets the statistics."""
+        return self._maxsize
+
+    @maxsize.setter
+    def maxsize(self, maxsize: int) -> None:
+        self._maxsize = maxsize
+        self._cached = lru_cache(maxsize)(_call)
+
+    def coerce(self, coerce: Callable[[Any], Any], raw: Any) -> Any:
+        """Coerce a raw value, reusing the value coerced before from an equal raw value of the same type.
+
+        :param coerce: the coercion function of the field
+        :param raw: the value as it appears in the source
+        :returns: the coerced value
+        """
+        raw_type: Any = type(raw)
+        if raw_type in _MEMOIZED_RAW_TYPES:
+            return self._cached(coerce, raw_type, raw)
+        return coerce(raw)
+
+    def clear(self) -> None:
+        """Forget all coerced values and reset the statistics."""
+        self._cached.cache_clear()
+
+    def info(self) -> CacheInfo:
+        """Report the memo statistics.
+
+        :returns: the number of hits and misses, the maximum size, and the current size of the memo
+        """
+        hits, misses, _, currsize = self._cached.cache_info()
+        return CacheInfo(hits, misses, self._maxsize, currsize)
+
+
+#: The process-wide memo of coerced values used by the configuration classes that set MEMOIZE.
+coercion_memo = CoercionMemo()
+
+
+def _parse_ini(config_file: Union[str, 'Path', Iterable[str]]) -> Tuple['configparser.ConfigParser', str]:
+    """Parse a ConfigParser-style INI file.
+
+    :param config_file: the path to the file, or an Iterable[str] such as an open file
+    :returns: the parsed file and a description of it for error messages
+    """
+    if isinstance(config_file, (str, os.PathLike)):
+        return file_cache.parse(config_file), str(config_file)
+    import configparser
+
+    config = configparser.ConfigParser()
+    config.read_file(config_file)
+    return config, '<UNKNOWN>'
+
+
+def _config_sections(
+    config: 'configparser.ConfigParser', sections: Iterable[str]
+) -> Dict[str, Optional[Mapping[str, str]]]:
+    """Get some sections of a file parsed by ConfigParser, with None for those it does not have."""
+    return {section: config[section] if config.has_section(section) else None for section in sections}
+
+
+def _parse_ini_sections(
+    config_file: Union[str, 'Path', Iterable[str]], sections: Iterable[str]
+) -> Tuple[Dict[str, Optional[Mapping[str, str]]], str]:
+    """Parse some sections of a ConfigParser-style INI file, without parsing the options of the other sections.
+
+    :param config_file: the path to the file, or an Iterable[str] such as an open file
+    :param sections: the names of the sections
+    :returns: the options in each section, or None for sections the file does not have, and a description of the file
+     for error messages
+    """
+    if isinstance(config_file, (str, os.PathLike)):
+        return file_cache.parse_sections(config_file, sections), str(config_file)
+    import configparser
+
+    lines = list(config_file)
+    try:
+        return _IniSectionScanner(sections).scan(lines, len(lines)), '<UNKNOWN>'
+    except _UnsupportedIni:
+        config = configparser.ConfigParser()
+        config.read_file(lines, source=getattr(config_file, 'name', None))
+        return _config_sections(config, sections), '<UNKNOWN>'
+
+
+class FileFormat(NamedTuple):
+    """A format of configuration file other than INI, registered with :func:`register_format`."""
+
+    #: the name of the format, for the FORMAT class variable
+    name: str
+    #: parses the text of a file into a mapping from section names to the options in each section
+    loads: Callable[[str], Mapping[str, Any]]
+    #: whether values are already typed, like JSON numbers, rather than strings to parse, like INI values
+    typed: bool
+
+
+# format name -> format, and file extension -> format name; INI is built in and handled separately
+_formats: Dict[str, FileFormat] = {}
+_extensions: Dict[str, str] = {'.ini': 'ini', '.cfg': 'ini', '.conf': 'ini'}
+
+
+def register_format(
+    name: str, loads: Callable[[str], Mapping[str, Any]], *, extensions: Iterable[str] = (), typed: bool = True
+) -> None:
+    """Teach :meth:`EasyConfig.load` to read another format of configuration file.
+
+    Files are read in a format when the FORMAT class variable of the configuration class names it, or when their
+    extension is one of the extensions of the format. All other files are read as INI.
+
+    The values of each configuration class are read from the section (a top-level mapping) named by its NAME class
+    variable. Typed values that already have the type of their field are used as they are, and strings are parsed the
+    same way as INI values. Values of any other type are an error, raised as :class:`ConfigValueCoercionError`, except
+    an ``int`` for a ``float`` field, which is converted since nothing is lost. ``Dict[str, T]`` fields are read from a
+    nested mapping.
+
+    :param name: the name of the format
+    :param loads: parses the text of a file, like :func:`json.loads`
+    :param extensions: the file extensions of the format, including the leading dot, such as ``'.json'``
+    :param typed: whether the values are already typed; if False, they are all parsed like INI values
+    """
+    _formats[name] = FileFormat(name, loads, typed)
+    for extension in extensions:
+        _extensions[extension.lower()] = name
+
+
+def _loads_json(text: str) -> Mapping[str, Any]:
+    """Parse a JSON file."""
+    import json  # deferred, like configparser
+
+    document: Mapping[str, Any] = json.loads(text)
+    return document
+
+
+def _loads_toml(text: str) -> Mapping[str, Any]:
+    """Parse a TOML file with :mod:`tomllib`, or :mod:`tomli` before Python 3.11.
+
+    :raises ImportError: when neither is available
+    """
+    try:
+        import tomllib
+    except ImportError:
+        try:
+            import tomli as tomllib  # type: ignore
+        except ImportError:
+            raise ImportError('reading TOML files needs Python 3.11 or later, or the tomli package') from None
+    document: Mapping[str, Any] = tomllib.loads(text)
+    return document
+
+
+register_format('json', _loads_json, extensions=['.json'])
+register_format('toml', _loads_toml, extensions=['.toml'])
+
+
+def _file_format(format_name: Optional[str], config_file: Any) -> Optional[FileFormat]:
+    """Find the format of a file, or None for INI.
+
+    :param format_name: the FORMAT of the configuration class, which takes priority over the extension of the file
+    :param config_file: the path to the file, or an open file
+    :raises ValueError: when the format is not registered
+    """
+    if format_name is None:
+        if not isinstance(config_file, (str, os.PathLike)):
+            return None
+        format_name = _extensions.get(os.path.splitext(config_file)[1].lower(), 'ini')
+    if format_name == 'ini':
+        return None
+    try:
+        return _formats[format_name]
+    except KeyError:
+        raise ValueError(f'unknown configuration file format `{format_name}`') from None
+
+
+def _parse_document(
+    file_format: FileFormat, config_file: Union[str, 'Path', Iterable[str]]
+) -> Tuple[Mapping[str, Any], str]:
+    """Parse a file in a registered format.
+
+    Like INI files, a file that cannot be opened is treated as empty.
+
+    :param config_file: the path to the file, or an Iterable[str] such as an open file
+    :returns: the parsed file and a description of it for error messages
+    """
+    if isinstance(config_file, (str, os.PathLike)):
+        try:
+            with open(config_file, encoding='utf-8') as f:
+                text = f.read()
+        except OSError:
+            return {}, str(config_file)
+        return file_format.loads(text), str(config_file)
+    return file_format.loads(''.join(config_file)), '<UNKNOWN>'
+
+
+class ConfigSource:
+    """A place to read configuration values from other than files, the environment, and keyword arguments.
+
+    Subclass it to read values from somewhere else, such as a configuration service, and list instances in the SOURCES
+    class variable of a configuration class. :meth:`EasyConfig.load` reads them after the files and before the
+    environment, so their values override those of files, and later sources override earlier ones.
+
+    Sources are shared between loads, and may be used from several threads at once.
+    """
+
+    #: whether the values are already typed, as in JSON, or strings to be coerced, as in INI files
+    typed: bool = True
+
+    @property
+    def description(self) -> str:
+        """Describe the source for humans, e.g. in error messages."""
+        return self.__class__.__qualname__
+
+    def fetch(self, config_class: Type['EasyConfig']) -> Optional[Mapping[str, Any]]:
+        """Get the uncoerced values for a configuration class.
+
+        :param config_class: the configuration class being loaded
+        :returns: the values keyed by field name, with a mapping for each nested configuration class, or None if the
+         source has no values for the class
+        """
+        raise NotImplementedError
+
+
+class _Source(NamedTuple):
+    """One of the places :meth:`EasyConfig.load` reads configuration values from."""
+
+    #: ``'kwargs'``, ``'environment'``, ``'file'``, or ``'plugin'``
+    kind: str
+    #: the file (a path or an open file) for ``'file'`` sources, the :class:`ConfigSource` for ``'plugin'`` sources,
+    #: otherwise None
+    location: Any
+    #: reads and coerces the configuration values from this source
+    read: Callable[[], Dict[str, Any]]
+    #: gets the uncoerced values from this source keyed by field name, or None if it can only be read whole
+    raw: Optional[Callable[[], Mapping[str, Any]]]
+
+    @property
+    def description(self) -> str:
+        """Describe the source for humans: its kind, the path of a file, or the description of a plugin source."""
+        if self.kind == 'plugin':
+            return str(self.location.description)
+        if self.kind != 'file':
+            return self.kind
+        return str(self.location) if isinstance(self.location, (str, os.PathLike)) else '<UNKNOWN>'
+
+
+class _EnvironmentSnapshot(Mapping[str, str]):
+    """A copy of the environment, indexed by the part of each variable name before its first underscore.
+
+    Configuration classes only read variables starting with their NAME, so :meth:`prefixed` lets each class look
+    through its own variables instead of the whole environment.
+    """
+
+    def __init__(self, environ: Mapping[str, str]) -> None:
+        self._environ = dict(environ)
+        self._index: Dict[str, Dict[str, str]] = {}
+        for key, value in self._environ.items():
+            self._index.setdefault(key.split('_', 1)[0], {})[key] = value
+        self._prefixed: Dict[str, Dict[str, str]] = {}
+
+    def __getitem__(self, key: str) -> str:
+        return self._environ[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._environ)
+
+    def __len__(self) -> int:
+        return len(self._environ)
+
+    def prefixed(self, prefix: str) -> Dict[str, str]:
+        """Get the variables whose names start with prefix, computing them the first time."""
+        try:
+            return self._prefixed[prefix]
+        except KeyError:
+            pass
+        bucket = self._index.get(prefix.split('_', 1)[0], {})
+        variables = {key: value for key, value in bucket.items() if key.startswith(prefix)}
+        self._prefixed[prefix] = variables
+        return variables
+
+
+class _SourceSnapshot:
+    """Sources that are read once and then shared by every configuration class in a :func:`load_many` call."""
+
+    def __init__(self) -> None:
+        self._environ: Optional[_EnvironmentSnapshot] = None
+        self._parsed: 'Dict[Any, Tuple[configparser.ConfigParser, str]]' = {}
+
+    @property
+    def environ(self) -> _EnvironmentSnapshot:
+        """A copy of the environment, taken the first time it is needed."""
+        if self._environ is None:
+            self._environ = _EnvironmentSnapshot(os.environ)
+        return self._environ
+
+    def parse(
+        self, config_file: Union[str, 'Path', Iterable[str]], sections: Iterable[str]
+    ) -> Tuple[Dict[str, Optional[Mapping[str, str]]], str]:
+        """Get some sections of a file, parsing the whole file the first time so that every class can share it."""
+        # open files can only be read once, so they are remembered by identity
+        key = os.path.abspath(config_file) if isinstance(config_file, (str, os.PathLike)) else id(config_file)
+        if key not in self._parsed:
+            self._parsed[key] = _parse_ini(config_file)
+        config, description = self._parsed[key]
+        return _config_sections(config, sections), description
+
+
+def _read_nested_sections(
+    plan: _ReaderPlan, values: Dict[str, Any], sections: Mapping[str, Optional[Mapping[str, str]]], source: str
+) -> Dict[str, Any]:
+    """Add the values of the nested configuration classes of a plan, read from their own INI sections, to values."""
+    for field in plan.nested_fields:
+        nested = field.nested
+        assert nested is not None
+        section = sections.get(nested.section)
+        nested_values = {} if section is None else nested.read_section(section, source)
+        nested_values = _read_nested_sections(nested, nested_values, sections, source)
+        if nested_values:
+            values[field.name] = nested_values
+    return values
+
+
+def _merge_nested(plan: _ReaderPlan, values: Mapping[str, Any]) -> Dict[str, Any]:
+    """Create the instances of the nested configuration classes of a plan from the merged configuration values.
+
+    Each source only has some of the values of a nested class, so the values from all sources are merged with the same
+    priority as the values of the class containing it, instead of the highest-priority source replacing the others.
+
+    :param values: a mapping from string configuration value names to their values, usually a ChainMap of the values
+     from each source
+    """
+    maps = values.maps if isinstance(values, ChainMap) else [values]
+    merged = dict(values)
+    for field in plan.nested_fields:
+        if field.name not in merged or isinstance(merged[field.name], field.type):
+            continue
+        merged[field.name] = field.type._create(ChainMap(*(m[field.name] for m in maps if field.name in m)))
+    return merged
+
+
+def _dump_section(config: 'configparser.ConfigParser', plan: _ReaderPlan, values: Dict[str, Any]) -> None:
+    """Add the values of a configuration to its INI section, and those of its nested configurations to their own."""
+    nested = {field.name: values.pop(field.name) for field in plan.nested_fields}
+    for name, field in plan.fields.items():
+        if field.mapping:
+            values.update((f'{name}_{key}', value) for key, value in values.pop(name).items())
+    config[plan.section] = values
+    for field in plan.nested_fields:
+        assert field.nested is not None
+        _dump_section(config, field.nested, nested[field.name])
+
+
+class _LoadRecord:
+    """How an instance was loaded, so that :meth:`EasyConfig.refresh` can load it again."""
+
+    __slots__ = ('additional_files', 'load_kwargs', 'kwargs', 'winners')
+
+    def __init__(
+        self,
+        additional_files: Optional[List[Any]],
+        load_kwargs: Dict[str, Any],
+        kwargs: Dict[str, Any],
+        winners: Dict[str, Any],
+    ) -> None:
+        self.additional_files = additional_files
+        #: the other parameters of the load, such as ``_parse_files``
+        self.load_kwargs = load_kwargs
+        self.kwargs = kwargs
+        #: field name -> the description of the source of its value and the raw value there, as of the load or the last
+        #: refresh; coerced values stand in for the raw values of sources that do not keep them
+        self.winners = winners
+
+
+# id of an instance -> how it was loaded, and a weak reference to the instance that removes the entry when the instance
+# is gone, before its id can be reused; instances are keyed by id because dataclasses that compare equal are unhashable
+_load_records: Dict[int, Tuple[_LoadRecord, 'weakref.ref[Any]']] = {}
+
+
+def _remember_load(config: Any, record: _LoadRecord) -> None:
+    """Remember how an instance was loaded for as long as it exists."""
+    key = id(config)
+    # weakref.finalize would do the same, but costs several times more
+    _load_records[key] = record, weakref.ref(config, lambda _: _load_records.pop(key, None))
+
+
+def _record_load(
+    config: Any,
+    additional_files: Optional[List[Any]],
+    load_kwargs: Dict[str, Any],
+    kwargs: Dict[str, Any],
+    read: Iterable[Tuple[_Source, Mapping[str, Any]]] = (),
+) -> None:
+    """Remember how a refreshable instance was loaded, and where the value of each of its fields comes from.
+
+    :param read: the sources read by the load and the values read from each; without them, the first refresh coerces
+     every value again
+    :raises ValueError: when additional_files has open files, which cannot be read again
+    """
+    from easy_config.refresh import loaded_winners  # noqa: F811; deferred to avoid a circular import
+
+    if additional_files and not all(isinstance(f, (str, os.PathLike)) for f in additional_files):
+        raise ValueError('configurations loaded from open files cannot be refreshed')
+    winners = loaded_winners(type(config).__easy_config_plan__.fields, read)
+    _remember_load(config, _LoadRecord(additional_files, load_kwargs, kwargs, winners))
+
+
+def _once(fn: Callable[[], T]) -> Callable[[], T]:
+    """Wrap fn so that it is only called the first time, and later calls return the same result."""
+    results: List[T] = []
+
+    def wrapper() -> T:
+        if not results:
+            results.append(fn())
+        return results[0]
+
+    return wrapper
+
+
+def _measured(cls: Type['EasyConfig'], kind: str, read: Callable[[], Dict[str, Any]]) -> Callable[[], Dict[str, Any]]:
+    """Wrap the read function of a source to report how long it takes and which values fail to coerce.
+
+    When no metrics sink is set, read is returned unchanged, so loading costs nothing extra.
+    """
+    sink = _metrics_sink
+    if sink is None:
+        return read
+    labels = {'config': cls.__qualname__, 'kind': kind}
+
+    def measured_read() -> Dict[str, Any]:
+        start = time.perf_counter()
+        try:
+            return read()
+        except ConfigValueCoercionError as e:
+            sink.increment('easy_config_coercion_errors_total', dict(labels, field=e.field or ''))
+            raise
+        finally:
+            sink.observe('easy_config_source_seconds', labels, time.perf_counter() - start)
+
+    return measured_read
+
 
 class _InheritDataclassForConfig(type):
     REQUIRED_CLASS_VARIABLES = ['FILES', 'NAME']
@@ -59,24 +1359,96 @@ class _InheritDataclassForConfig(type):
     ) -> Type[type]:
         for varname in mcs.REQUIRED_CLASS_VARIABLES:
             if varname not in attrs:
-                logger.debug(
+                _debug(
                     'required class variable `%s` not present for new class `%s`; not decorating as dataclass',
                     varname,
                     name,
                 )
+                # did break--something was missing
+                cls = super().__new__(mcs, name, bases, attrs)
                 break
         else:  # nobreak--nothing was missing
-            return dataclasses.dataclass(super().__new__(mcs, name, bases, attrs))
+            cls = super().__new__(mcs, name, bases, attrs)
+            cls = dataclasses.dataclass(frozen=getattr(cls, 'FROZEN', False))(cls)
+            if getattr(cls, 'SLOTS', False):
+                cls = mcs._add_slots(cls)
+
+        # subclasses that only override class variables inherit their fields, but still need readers of their own
+        if dataclasses.is_dataclass(cls) and isinstance(getattr(cls, 'NAME', None), str):
+            cls.__easy_config_plan__ = _compile_readers(cls)
+        return cls
+
+    @staticmethod
+    def _add_slots(cls: Any) -> Any:
+        """Rebuild a dataclass so that its fields are stored in ``__slots__`` instead of a per-instance ``__dict__``.
+
+        This is what ``dataclasses.dataclass(slots=True)`` does on Python 3.10 and later.
+        """
+        inherited: Set[str] = set()
+        for base in cls.__mro__[1:]:
+            base_slots = vars(base).get('__slots__', ())
+            inherited.update((base_slots,) if isinstance(base_slots, str) else base_slots)
+        names = [field.name for field in dataclasses.fields(cls)]
+        slots = [name for name in names if name not in inherited]
+        # keep instances weakly referenceable, like those of classes without slots
+        if not any(base.__weakrefoffset__ for base in cls.__bases__):
+            slots.append('__weakref__')
 
-        # did break--something was missing
-        return super().__new__(mcs, name, bases, attrs)
+        attrs = dict(vars(cls))
+        for name in names:
+            attrs.pop(name, None)  # defaults are already part of __init__, and would conflict with the slots
+        attrs.pop('__dict__', None)
+        attrs.pop('__weakref__', None)
+        attrs['__slots__'] = tuple(slots)
+        # without a __dict__, pickling needs help, especially when frozen instances refuse __setattr__
+        attrs.setdefault('__getstate__', _slotted_getstate)
+        attrs.setdefault('__setstate__', _slotted_setstate)
+        # type.__new__ instead of calling the metaclass, which would decorate the class all over again
+        slotted = type.__new__(type(cls), cls.__name__, cls.__bases__, attrs)
+
+        # methods that use super() or __class__ refer to the original class through a closure cell
+        for value in attrs.values():
+            for function in (getattr(value, '__func__', value), getattr(value, 'fget', None)):
+                for cell in getattr(function, '__closure__', None) or ():
+                    if cell.cell_contents is cls:
+                        cell.cell_contents = slotted
+        return slotted
+
+
+def _slotted_getstate(self: Any) -> List[Any]:
+    """Get the state of an instance of a slotted configuration class for pickling."""
+    return [getattr(self, field.name) for field in dataclasses.fields(self)]
+
+
+def _slotted_setstate(self: Any, state: List[Any]) -> None:
+    """Restore the state of an instance of a slotted configuration class, even if it is frozen."""
+    for field, value in zip(dataclasses.fields(self), state):
+        object.__setattr__(self, field.name, value)
 
 
 class EasyConfig(metaclass=_InheritDataclassForConfig):
     """The parent class of all configuration classes."""
 
     NAME: str
-    FILES: List[Union[str, Path]]
+    FILES: List[Union[str, 'Path']]
+    #: store the values of each instance in ``__slots__`` instead of a ``__dict__``, which saves memory when there are
+    #: many instances; set to True in a subclass to opt in
+    SLOTS: ClassVar[bool] = False
+    #: make instances immutable, like ``dataclasses.dataclass(frozen=True)``; set to True in a subclass to opt in
+    FROZEN: ClassVar[bool] = False
+    #: coerce values through :data:`coercion_memo`, so that equal raw values are coerced once and instances share the
+    #: coerced objects, which saves time and memory when there are many instances; set to True in a subclass to opt in,
+    #: but only when the field types are immutable
+    MEMOIZE: ClassVar[bool] = False
+    #: the format of all files read by the class, as registered with :func:`register_format`; by default, the format
+    #: of each file is chosen by its extension, and files with other extensions and open files are read as INI
+    FORMAT: ClassVar[Optional[str]] = None
+    #: other places to read values from, such as :class:`easy_config.remote.HTTPSource`, in increasing priority
+    SOURCES: ClassVar[Sequence[ConfigSource]] = ()
+    __easy_config_plan__: ClassVar[_ReaderPlan]
+
+    # so that the instances of subclasses that set SLOTS have no __dict__ at all
+    __slots__ = ()
 
     def __init__(self, **_kwargs: Any) -> None:
         """Do not instantiate the base class.
@@ -91,12 +1463,15 @@ class EasyConfig(metaclass=_InheritDataclassForConfig):
 
     @classmethod
     def _read_file(
-        cls: Type[EasyConfigOrSubclass], config_file: Union[str, Path, Iterable[str]]
+        cls: Type[EasyConfigOrSubclass], config_file: Union[str, 'Path', Iterable[str]]
     ) -> Dict[str, Any]:
         """Read configuration values from a file.
 
-        This method parses ConfigParser-style INI files.
-        To parse other formats, subclass EasyConfig and override this method.
+        This method parses ConfigParser-style INI files, and the other formats registered with
+        :func:`register_format`, such as JSON and TOML, chosen by the FORMAT class variable or the file extension.
+        To parse other formats, register them or subclass EasyConfig and override this method.
+
+        INI files given by path are parsed through :data:`file_cache`, so an unchanged file is only parsed once.
 
         :param config_file: the file from which configuration will be read. Note that this can be an Iterable[str],
             which includes open files and TextIO objects.
@@ -104,64 +1479,94 @@ class EasyConfig(metaclass=_InheritDataclassForConfig):
         :returns: a mapping from string configuration value names to their values
         :raises ConfigValueCoercionError: when an error occurs calling the type constructor on an input value
         """
-        config = configparser.ConfigParser()
-        if isinstance(config_file, (str, Path, os.PathLike)):
-            given_path = True
-            config.read(config_file)
-        else:
-            given_path = False
-            config.read_file(config_file)
+        file_format = _file_format(cls.FORMAT, config_file)
+        if file_format is None:
+            return cls._read_sections(*_parse_ini_sections(config_file, cls.__easy_config_plan__.sections))
 
-        values = {}
-        for field in dataclasses.fields(cls):
-            try:
-                value: Any
-                if field.type is int:
-                    value = config.getint(cls.NAME, field.name)
-                elif field.type is float:
-                    value = config.getfloat(cls.NAME, field.name)
-                elif field.type is bool:
-                    value = config.getboolean(cls.NAME, field.name)
-                else:
-                    value = field.type(config.get(cls.NAME, field.name))
+        document, source = _parse_document(file_format, config_file)
+        section = document.get(cls.NAME)
+        if not isinstance(section, Mapping):
+            return {}
+        plan = cls.__easy_config_plan__
+        return (plan.read_typed if file_format.typed else plan.read_section)(section, source)
 
-                values[field.name] = value
-            except (configparser.NoSectionError, configparser.NoOptionError):
-                pass
-            except (TypeError, ValueError) as e:
-                raise ConfigValueCoercionError(f'While reading the configuration file `{config_file if given_path else "<UNKNOWN>"}`, could not coerce value for field `{field.name}` to type `{field.type}`') from e
+    @classmethod
+    def _read_sections(
+        cls: Type[EasyConfigOrSubclass], sections: Mapping[str, Optional[Mapping[str, str]]], source: str
+    ) -> Dict[str, Any]:
+        """Read configuration values from the INI sections of the class and of its nested configuration classes.
 
-        return values
+        The class reads the section corresponding to the class value NAME, and the section of a field ``db`` whose type
+        is a configuration class is named after that of the class containing it, e.g. ``[myprogram.db]``.
+
+        :param sections: the options in each section, or None for sections the file does not have
+        :param source: a description of the file to use in error messages, usually its path
+
+        :returns: a mapping from string configuration value names to their values, with a mapping of its own for each
+         nested configuration class
+        :raises ConfigValueCoercionError: when an error occurs calling the type constructor on an input value
+        """
+        plan = cls.__easy_config_plan__
+        return _read_nested_sections(plan, cls._read_section(sections.get(plan.section), source), sections, source)
 
     @classmethod
-    def _read_environment(cls: Type[EasyConfigOrSubclass]) -> Dict[str, Any]:
+    def _read_section(
+        cls: Type[EasyConfigOrSubclass], section: Optional[Mapping[str, str]], source: str
+    ) -> Dict[str, Any]:
+        """Read configuration values from the section of an INI file corresponding to the class value NAME.
+
+        :param section: the options in the section, or None if the file has no such section
+        :param source: a description of the file to use in error messages, usually its path
+
+        :returns: a mapping from string configuration value names to their values
+        :raises ConfigValueCoercionError: when an error occurs calling the type constructor on an input value
+        """
+        if section is None:
+            return {}
+        return cls.__easy_config_plan__.read_section(section, source)
+
+    @classmethod
+    def _read_plugin(cls: Type[EasyConfigOrSubclass], config_source: ConfigSource) -> Dict[str, Any]:
+        """Read configuration values from a plugin source listed in the SOURCES class variable.
+
+        :param config_source: the source to fetch the values from
+
+        :returns: a mapping from string configuration value names to their values
+        :raises ConfigValueCoercionError: when an error occurs calling the type constructor on an input value
+        """
+        values = config_source.fetch(cls)
+        if not values:
+            return {}
+        plan = cls.__easy_config_plan__
+        read = plan.read_typed if config_source.typed else plan.read_section
+        return read(values, config_source.description, 'plugin')
+
+    @classmethod
+    def _read_environment(
+        cls: Type[EasyConfigOrSubclass], environ: Optional[Mapping[str, str]] = None
+    ) -> Dict[str, Any]:
         """Read configuration values from the environment.
 
         Configuration values are looked up in the environment by the concatenation of the value name and the NAME class
         variable with an underscore separator.
 
         For example, the configuration value "number" for an instance with the NAME "myprogram" will be read from the
-        environment variable "MYPROGRAM_NUMBER".
+        environment variable "MYPROGRAM_NUMBER". A ``Dict[str, T]`` field gathers every variable that starts with its
+        name: "MYPROGRAM_HEADERS_ACCEPT" is read as the key "ACCEPT" of the field "headers". A field "db" whose type is
+        a configuration class reads its own fields under its name: "MYPROGRAM_DB_HOST" is read as its field "host".
+
+        :param environ: the environment to read from instead of :data:`os.environ`, such as a snapshot of it
 
         :returns: a mapping from string configuration value names to their values
         :raises ConfigValueCoercionError: when an error occurs calling the type constructor on an input value
         """
-        values = {}
-        for field in dataclasses.fields(cls):
-            prefixed_field_name = f'{cls.NAME}_{field.name}'.upper()
-            try:
-                if field.type is bool:
-                    values[field.name] = field.type(
-                        strtobool(os.environ[prefixed_field_name])
-                    )
-                else:
-                    values[field.name] = field.type(os.environ[prefixed_field_name])
-            except KeyError:  # the variable was not in the environment
-                pass
-            except (TypeError, ValueError) as e:
-                raise ConfigValueCoercionError(f'While reading environment variable `{prefixed_field_name}`, could not coerce value for field `{field.name}` to type `{field.type}`') from e
-
-        return values
+        plan = cls.__easy_config_plan__
+        if environ is None:
+            environ = os.environ
+        if plan.has_mappings and not isinstance(environ, dict):
+            # mapping fields scan every variable; narrow the environment to this class's variables only once
+            environ = {key: value for key, value in environ.items() if key.startswith(plan.environment_prefix)}
+        return plan.read_environment(environ)
 
     @classmethod
     def _read_dict(
@@ -176,24 +1581,18 @@ class EasyConfig(metaclass=_InheritDataclassForConfig):
         :returns: a mapping from string configuration value names to their values
         :raises ConfigValueCoercionError: when an error occurs calling the type constructor on an input value
         """
-        values = {}
-        for field in dataclasses.fields(cls):
-            if field.name in d:
-                try:
-                    values[field.name] = field.type(d[field.name])
-                except (TypeError, ValueError) as e:
-                    raise ConfigValueCoercionError(f'While reading a dictionary, could not coerce value for field `{field.name}` to type `{field.type}`') from e
-
-        return values
+        return cls.__easy_config_plan__.read_dict(d)
 
     @classmethod
     def load(
         cls: Type[EasyConfigOrSubclass],
-        _additional_files: Optional[Iterable[Union[str, Path, TextIO]]] = None,
+        _additional_files: Optional[Iterable[Union[str, 'Path', TextIO]]] = None,
         *,
         _parse_files: bool = True,
         _parse_environment: bool = True,
         _lookup_config_envvar: Optional[str] = None,
+        _executor: Optional['Executor'] = None,
+        _refreshable: bool = False,
         **kwargs: Any,
     ) -> EasyConfigOrSubclass:
         """Load configuration values from multiple locations and create a new instance of the configuration class with those values.
@@ -203,8 +1602,9 @@ class EasyConfig(metaclass=_InheritDataclassForConfig):
         1. values from the files listed in the FILES class variable, in order
         2. values from files passed in the additional_files parameter, in order
         3. values from the file specified by the config file specified by the environment variable _lookup_config_envvar
-        4. values from the environment
-        5. values passed as keyword arguments to this method (useful for values specified on the command line)
+        4. values from the sources listed in the SOURCES class variable, in order
+        5. values from the environment
+        6. values passed as keyword arguments to this method (useful for values specified on the command line)
 
         :param _additional_files: files to be parsed in addition to those named in the FILES class variable;
          always parsed, no matter the value of the parse_files flag
@@ -214,24 +1614,281 @@ class EasyConfig(metaclass=_InheritDataclassForConfig):
          from the environment, this value will be uppercased and appended to the program name. For example, the
          _lookup_config_envvar "config" for an instance with the NAME "myprogram" will result in a search for the
          environment variable "MYPROGRAM_CONFIG" for the path to the configuration file.
+        :param _executor: if given, all files and SOURCES are read and parsed concurrently in this
+         :class:`concurrent.futures.Executor`, such as a :class:`concurrent.futures.ThreadPoolExecutor` that is reused
+         between loads. The values are merged in the same order as when the files are read one after another.
+        :param _refreshable: whether to remember how the instance was loaded, so that it can be loaded again with
+         :meth:`refresh`; loads that are never refreshed do not pay for this
         :param kwargs: additional keyword arguments are passed through unchanged to the final configuration object
 
         :returns: an instance of the configuration class loaded with the parsed values
+        :raises ValueError: when _refreshable is true and _additional_files has open files, which cannot be read again
         """
+        if _metrics_sink is not None:
+            _metrics_sink.increment('easy_config_loads_total', {'config': cls.__qualname__})
+        load_kwargs: Dict[str, Any] = {
+            '_parse_files': _parse_files,
+            '_parse_environment': _parse_environment,
+            '_lookup_config_envvar': _lookup_config_envvar,
+        }
+        if not _refreshable:
+            return cls._create(
+                ChainMap(*cls._load_helper(_additional_files, _executor=_executor, **load_kwargs, **kwargs))
+            )
+
+        additional_files = None if _additional_files is None else list(_additional_files)
+        sources: List[_Source] = []
         values = ChainMap(
-            *cls._load_helper(
-                _additional_files=_additional_files,
+            *cls._load_helper(additional_files, _executor=_executor, _read_sources=sources, **load_kwargs, **kwargs)
+        )
+        config = cls._create(values)
+        _record_load(config, additional_files, load_kwargs, kwargs, zip(sources, values.maps))
+        return config
+
+    @classmethod
+    async def aload(
+        cls: Type[EasyConfigOrSubclass],
+        _additional_files: Optional[Iterable[Union[str, 'Path', TextIO]]] = None,
+        *,
+        _parse_files: bool = True,
+        _parse_environment: bool = True,
+        _lookup_config_envvar: Optional[str] = None,
+        _executor: Optional['Executor'] = None,
+        _timeout: Optional[float] = None,
+        _refreshable: bool = False,
+        **kwargs: Any,
+    ) -> EasyConfigOrSubclass:
+        """Load configuration values like :meth:`load` without blocking the running event loop.
+
+        The sources and their priority are the same as for :meth:`load`. Every file and plugin source is read in an
+        executor, all of them concurrently. Cancelling the returned coroutine, or reaching the timeout, stops waiting
+        for them, though reads that have already started in the executor run to completion in the background.
+
+        :param _executor: the :class:`concurrent.futures.Executor` to read files in; defaults to the event loop's
+         default executor
+        :param _timeout: the maximum number of seconds to wait for all files to be read
+        :param kwargs: the other parameters are the same as for :meth:`load`
+
+        :returns: an instance of the configuration class loaded with the parsed values
+        :raises asyncio.TimeoutError: when the files were not read within the timeout
+        """
+        import asyncio  # deferred: importing asyncio is slow, and only this method needs it
+
+        if _metrics_sink is not None:
+            _metrics_sink.increment('easy_config_loads_total', {'config': cls.__qualname__})
+        loop = asyncio.get_running_loop()
+        additional_files = None if _additional_files is None else list(_additional_files)
+        load_kwargs: Dict[str, Any] = {
+            '_parse_files': _parse_files,
+            '_parse_environment': _parse_environment,
+            '_lookup_config_envvar': _lookup_config_envvar,
+        }
+        sources = list(cls._sources(additional_files, **load_kwargs, **kwargs))
+        # only files and plugin sources involve blocking I/O; keyword arguments and the environment are read in place
+        values: List[Dict[str, Any]] = [{} if source.kind in _BLOCKING_KINDS else source.read() for source in sources]
+        file_indices = [index for index, source in enumerate(sources) if source.kind in _BLOCKING_KINDS]
+        file_values = await asyncio.wait_for(
+            asyncio.gather(*(loop.run_in_executor(_executor, sources[index].read) for index in file_indices)),
+            _timeout,
+        )
+        for index, read_values in zip(file_indices, file_values):
+            values[index] = read_values
+        config = cls._create(ChainMap(*values))
+        if _refreshable:
+            _record_load(config, additional_files, load_kwargs, kwargs, zip(sources, values))
+        return config
+
+    @classmethod
+    def load_lazy(
+        cls: Type[EasyConfigOrSubclass],
+        _additional_files: Optional[Iterable[Union[str, 'Path', TextIO]]] = None,
+        *,
+        _parse_files: bool = True,
+        _parse_environment: bool = True,
+        _lookup_config_envvar: Optional[str] = None,
+        **kwargs: Any,
+    ) -> 'LazyConfig':
+        """Prepare to load configuration values like :meth:`load`, but only read and coerce each value when it is used.
+
+        Use :meth:`easy_config.lazy.LazyConfig.validate` to check for missing values up front, and
+        :meth:`easy_config.lazy.LazyConfig.resolve` to get a real instance of the configuration class.
+
+        :param kwargs: the parameters are the same as for :meth:`load`
+
+        :returns: a :class:`easy_config.lazy.LazyConfig` standing in for an instance of the configuration class
+        """
+        from easy_config.lazy import LazyConfig  # noqa: F811; deferred to avoid a circular import
+
+        return LazyConfig(
+            cls,
+            cls._sources(
+                _additional_files,
                 _parse_files=_parse_files,
                 _parse_environment=_parse_environment,
                 _lookup_config_envvar=_lookup_config_envvar,
                 **kwargs,
-            )
+            ),
         )
 
+    @classmethod
+    def resolve(
+        cls: Type[EasyConfigOrSubclass],
+        _additional_files: Optional[Iterable[Union[str, 'Path', TextIO]]] = None,
+        *,
+        _parse_files: bool = True,
+        _parse_environment: bool = True,
+        _lookup_config_envvar: Optional[str] = None,
+        _refreshable: bool = False,
+        **kwargs: Any,
+    ) -> Tuple[EasyConfigOrSubclass, List[str]]:
+        """Load configuration values like :meth:`load`, but stop reading sources once every value has been found.
+
+        Sources are read from the highest priority to the lowest, so as soon as every field has a value, the remaining
+        sources cannot change the result and are skipped. For example, when the keyword arguments and the environment
+        provide every value, no files are parsed at all. Fields with defaults still need a value from some source to
+        allow skipping, since a lower-priority source could otherwise override the default. Classes with nested
+        configuration classes always read every source.
+
+        :param kwargs: the parameters are the same as for :meth:`load`
+
+        :returns: an instance of the configuration class and descriptions of the sources that were skipped: the kinds
+         ``'kwargs'`` and ``'environment'``, or the paths of files (``'<UNKNOWN>'`` for open files)
+        """
+        if _metrics_sink is not None:
+            _metrics_sink.increment('easy_config_loads_total', {'config': cls.__qualname__})
+        plan = cls.__easy_config_plan__
+        field_names = plan.field_names
+        additional_files = None if _additional_files is None else list(_additional_files)
+        load_kwargs: Dict[str, Any] = {
+            '_parse_files': _parse_files,
+            '_parse_environment': _parse_environment,
+            '_lookup_config_envvar': _lookup_config_envvar,
+        }
+        found: Set[str] = set()
+        read: List[Tuple[_Source, Dict[str, Any]]] = []
+        skipped: List[str] = []
+        for source in cls._sources(additional_files, **load_kwargs, **kwargs):
+            # a source can have only some of the values of a nested class, so classes with them read every source
+            if not plan.nested_fields and found >= field_names:
+                skipped.append(source.description)
+                continue
+            values = source.read()
+            found.update(values)
+            read.append((source, values))
+
+        if skipped:
+            _debug('resolved `%s` without reading %s', cls.__qualname__, skipped)
+        config = cls._create(ChainMap(*(values for _, values in read)))
+        if _refreshable:
+            # the skipped sources have lower priority than those with a value for every field, so they hold no winners
+            _record_load(config, additional_files, load_kwargs, kwargs, read)
+        return config, skipped
+
+    def refresh(self: EasyConfigOrSubclass) -> Tuple[EasyConfigOrSubclass, Dict[str, 'FieldChange']]:
+        """Load an instance again from the same sources, only coercing the values that changed since the last refresh.
+
+        Only instances loaded with ``_refreshable=True`` can be refreshed, by :meth:`load`, :meth:`aload`,
+        :meth:`resolve`, :func:`load_many`, :func:`easy_config.bulk.iter_load`, or
+        :meth:`easy_config.snapshot.SnapshotCache.load`. The record of the load belongs to the instance itself, so
+        copies of it and instances unpickled from it cannot be refreshed. Every source is read again with the same
+        arguments that were given to the load. The raw value of each field in the source it comes from is compared with
+        that of the last refresh, or of the load before the first refresh, and only the values that changed are coerced
+        again; the others are taken from this instance. Values from JSON and TOML files, plugin sources, and fields of
+        nested configuration classes are compared after coercion. Instances from :func:`easy_config.bulk.iter_load` and
+        snapshots do not know the raw values of their load, so their first refresh coerces every value again.
+
+        :returns: the new instance, or this one if no values changed, and the changes keyed by field name, which is
+         empty if nothing changed
+        :raises ValueError: when the instance was not loaded with ``_refreshable=True``, e.g. it was created directly or
+         is a copy
+        :raises ConfigValueCoercionError: when an error occurs calling the type constructor on a changed value
+        """
+        from easy_config.refresh import refresh  # noqa: F811; deferred to avoid a circular import
+
+        record, _ = _load_records.get(id(self), (None, None))
+        if record is None:
+            raise ValueError(
+                f'this {self.__class__.__qualname__} was not loaded with _refreshable=True, so it cannot be refreshed'
+            )
+        config, changes, winners = refresh(self, record)
+        if config is self:
+            record.winners = winners
+        else:
+            # this instance keeps its own record, so that refreshing it again compares with its own values
+            _remember_load(config, _LoadRecord(record.additional_files, record.load_kwargs, record.kwargs, winners))
+        return config, changes
+
+    @classmethod
+    def from_rows(cls: Type[EasyConfigOrSubclass], rows: Iterable[Mapping[str, Any]]) -> Iterator[EasyConfigOrSubclass]:
+        """Create an instance of the configuration class from each of many mappings, such as database rows.
+
+        Each instance is the same as ``cls.load(_parse_files=False, _parse_environment=False, **row)``, but the
+        compiled reader is looked up once for all rows and no sources are listed or merged for each one.
+
+        :param rows: mappings from string configuration value names to their values; other keys are ignored
+
+        :returns: an iterator of instances of the configuration class, one for each row, created as they are needed
+        :raises ConfigValueCoercionError: when an error occurs calling the type constructor on an input value
+        :raises TypeError: when a row is missing a configuration value without a default
+        """
+        read_dict = cls.__easy_config_plan__.read_dict
+        create = cls._create
+        for row in rows:
+            yield create(read_dict(row))
+
+    @classmethod
+    def from_columns(
+        cls: Type[EasyConfigOrSubclass], columns: Mapping[str, Sequence[Any]]
+    ) -> List[EasyConfigOrSubclass]:
+        """Create instances of the configuration class from columns of values, such as those of a CSV export.
+
+        Each column is coerced in a single pass with the coercion function of its field, then the instances are created
+        from the coerced values at the same position in every column. This gives the same instances as
+        :meth:`from_rows`.
+
+        :param columns: a mapping from string configuration value names to the value for each instance; other keys are
+         ignored. Every column must have the same length.
+
+        :returns: an instance of the configuration class for each position in the columns
+        :raises ConfigValueCoercionError: when an error occurs calling the type constructor on an input value
+        :raises TypeError: when a configuration value without a default has no column
+        :raises ValueError: when the columns have different lengths
+        """
+        fields = cls.__easy_config_plan__.fields
+        names = [name for name in columns if name in fields]
+        lengths = {len(columns[name]) for name in names}
+        if len(lengths) > 1:
+            raise ValueError(f'columns have different lengths: {sorted(lengths)}')
+        if not names:
+            return []
+
+        coerced = []
+        for name in names:
+            field = fields[name]
+            try:
+                coerced.append(list(map(field.coerce_dict, columns[name])))
+            except (TypeError, ValueError) as e:
+                raise field.error('kwargs', '') from e
+
+        create = cls._create
+        return [create(dict(zip(names, values))) for values in zip(*coerced)]
+
+    @classmethod
+    def _create(cls: Type[EasyConfigOrSubclass], values: Mapping[str, Any]) -> EasyConfigOrSubclass:
+        """Create a new instance of the configuration class from the merged configuration values.
+
+        :param values: a mapping from string configuration value names to their values
+        :returns: an instance of the configuration class
+        :raises TypeError: when a configuration value without a default is missing from values
+        """
+        plan = cls.__easy_config_plan__
+        if plan.nested_fields:
+            values = _merge_nested(plan, values)
         try:
             return cls(**values)
         except TypeError as e:
-            if e.args[0].startswith('__init__() missing'):
+            # Python 3.10 started qualifying the name of __init__ in this message
+            if '__init__() missing' in e.args[0]:
                 raise TypeError('missing some configuration values') from e
             else:
                 raise e
@@ -239,36 +1896,189 @@ class EasyConfig(metaclass=_InheritDataclassForConfig):
     @classmethod
     def _load_helper(
         cls: Type[EasyConfigOrSubclass],
-        _additional_files: Optional[Iterable[Union[str, Path, TextIO]]] = None,
+        _additional_files: Optional[Iterable[Union[str, 'Path', TextIO]]] = None,
         *,
         _parse_files: bool = True,
         _parse_environment: bool = True,
         _lookup_config_envvar: Optional[str] = None,
+        _snapshot: Optional[_SourceSnapshot] = None,
+        _executor: Optional['Executor'] = None,
+        _read_sources: Optional[List[_Source]] = None,
         **kwargs: Any,
     ) -> Generator[Dict[str, Any], None, None]:
-        """Help load the dictionaries in .load()."""
-        yield cls._read_dict(kwargs)
+        """Help load the dictionaries in .load().
+
+        :param _snapshot: read the environment and files through this snapshot instead of directly
+        :param _executor: read all files concurrently in this executor
+        :param _read_sources: append the sources read to this list, in the same order as their dictionaries
+        """
+        sources = cls._sources(
+            _additional_files,
+            _parse_files=_parse_files,
+            _parse_environment=_parse_environment,
+            _lookup_config_envvar=_lookup_config_envvar,
+            _snapshot=_snapshot,
+            **kwargs,
+        )
+        if _executor is None:
+            for source in sources:
+                if _read_sources is not None:
+                    _read_sources.append(source)
+                yield source.read()
+            return
+
+        # submit every file before waiting on any of them, then yield the results in priority order
+        source_list = list(sources)
+        if _read_sources is not None:
+            _read_sources.extend(source_list)
+        futures = {
+            index: _executor.submit(source.read)
+            for index, source in enumerate(source_list)
+            if source.kind in _BLOCKING_KINDS
+        }
+        try:
+            for index, source in enumerate(source_list):
+                yield futures[index].result() if index in futures else source.read()
+        finally:
+            for future in futures.values():
+                future.cancel()
+
+    @classmethod
+    def _sources(
+        cls: Type[EasyConfigOrSubclass],
+        _additional_files: Optional[Iterable[Union[str, 'Path', TextIO]]] = None,
+        *,
+        _parse_files: bool = True,
+        _parse_environment: bool = True,
+        _lookup_config_envvar: Optional[str] = None,
+        _snapshot: Optional[_SourceSnapshot] = None,
+        **kwargs: Any,
+    ) -> Generator[_Source, None, None]:
+        """Help list the sources for .load(), from highest to lowest priority, without reading them.
+
+        The parameters are the same as those of :meth:`_load_helper`.
+        """
+        plan = cls.__easy_config_plan__
+        if _snapshot is None:
+            environ: Mapping[str, str] = os.environ
+            parse: Callable[[Any, Iterable[str]], Tuple[Dict[str, Optional[Mapping[str, str]]], str]] = (
+                _parse_ini_sections
+            )
+        else:
+            # every variable this class reads starts with its prefix, including the one naming a config file
+            environ = _snapshot.environ.prefixed(plan.environment_prefix)
+            parse = _snapshot.parse
+
+        yield _Source('kwargs', None, _measured(cls, 'kwargs', partial(cls._read_dict, kwargs)), lambda: kwargs)
         if _parse_environment:
-            yield cls._read_environment()
+            yield _Source(
+                'environment',
+                None,
+                _measured(cls, 'environment', partial(cls._read_environment, environ)),
+                None if plan.nested_fields else partial(_RawView, plan.fields, environ, 'environment'),
+            )
+        for config_source in reversed(cls.SOURCES):
+            yield _Source(
+                'plugin', config_source, _measured(cls, 'plugin', partial(cls._read_plugin, config_source)), None
+            )
         if _lookup_config_envvar is not None:
             envvar = f'{cls.NAME.upper()}_{_lookup_config_envvar.upper()}'
-            file_name = os.environ.get(envvar)
+            file_name = environ.get(envvar)
             if file_name:
-                yield cls._read_file(file_name)
+                yield cls._file_source(file_name, parse)
         if _additional_files:
             for files in _additional_files:
-                yield cls._read_file(files)
+                yield cls._file_source(files, parse)
         if _parse_files and cls.FILES:
             for file_paths in reversed(cls.FILES):
-                yield cls._read_file(file_paths)
+                yield cls._file_source(file_paths, parse)
+
+    @classmethod
+    def _file_source(
+        cls: Type[EasyConfigOrSubclass],
+        config_file: Union[str, 'Path', TextIO],
+        parse: Callable[[Any, Iterable[str]], Tuple[Dict[str, Optional[Mapping[str, str]]], str]],
+    ) -> _Source:
+        """Help describe a file source for ._sources().
+
+        :param config_file: the file, as a path or an open file
+        :param parse: the function that parses sections of an INI file, such as :meth:`_SourceSnapshot.parse`
+        """
+        overridden = getattr(cls._read_file, '__func__', None) is not EasyConfig._read_file.__func__  # type: ignore
+        if overridden or _file_format(cls.FORMAT, config_file) is not None:
+            # classes that override _read_file, and files in other formats than INI, can only be read whole
+            return _Source('file', config_file, _measured(cls, 'file', partial(cls._read_file, config_file)), None)
+
+        # open files can only be read once, so the parsed sections are shared between reading and getting the raw values
+        plan = cls.__easy_config_plan__
+        parsed = _once(partial(parse, config_file, plan.sections))
+        return _Source(
+            'file',
+            config_file,
+            _measured(cls, 'file', lambda: cls._read_sections(*parsed())),
+            # the values of nested classes are spread over several sections, so classes with them are only read whole
+            None if plan.nested_fields else lambda: _RawView(plan.fields, parsed()[0][plan.section] or {}, 'file'),
+        )
 
     def dump(self, fp: TextIO) -> None:
         """Serialize all current configuration values to fp as a ConfigParser-style INI.
 
-        Values will be placed in the section corresponding to the class value NAME.
+        Values will be placed in the section corresponding to the class value NAME, and the values of nested
+        configuration classes in sections of their own, e.g. ``[myprogram.db]``.
 
         :param fp: a write()-supporting file-like object
         """
+        import configparser
+
         config = configparser.ConfigParser()
-        config[self.NAME] = dataclasses.asdict(self)
+        _dump_section(config, self.__easy_config_plan__, dataclasses.asdict(self))
         config.write(fp)
+
+
+def load_many(
+    classes: Iterable[Type[EasyConfig]],
+    _additional_files: Optional[Iterable[Union[str, 'Path', TextIO]]] = None,
+    *,
+    _parse_files: bool = True,
+    _parse_environment: bool = True,
+    _lookup_config_envvar: Optional[str] = None,
+    _refreshable: bool = False,
+) -> List[EasyConfig]:
+    """Load several configuration classes at once, reading each source only once.
+
+    This is equivalent to calling :meth:`EasyConfig.load` on each class with the same arguments, except that the
+    environment is copied once and each distinct file (including open files passed in ``_additional_files``) is parsed
+    once, then the values for each class are read out of the shared copies. Classes that override
+    :meth:`EasyConfig._read_file` still read files themselves.
+
+    :param classes: the configuration classes to load
+    :param _additional_files: files to be parsed in addition to those named in the FILES class variable of each class
+    :param _parse_files: whether to parse files from the FILES class variable of each class
+    :param _parse_environment: whether to parse the environment for configuration values
+    :param _lookup_config_envvar: the environment variable that contains the config file location, as for
+     :meth:`EasyConfig.load`
+    :param _refreshable: whether the instances can be refreshed, as for :meth:`EasyConfig.load`
+
+    :returns: an instance of each configuration class, in the same order as classes
+    """
+    snapshot = _SourceSnapshot()
+    additional_files = None if _additional_files is None else list(_additional_files)
+    load_kwargs: Dict[str, Any] = {
+        '_parse_files': _parse_files,
+        '_parse_environment': _parse_environment,
+        '_lookup_config_envvar': _lookup_config_envvar,
+    }
+    configs = []
+    for cls in classes:
+        if _metrics_sink is not None:
+            _metrics_sink.increment('easy_config_loads_total', {'config': cls.__qualname__})
+        sources: Optional[List[_Source]] = [] if _refreshable else None
+        values = ChainMap(
+            *cls._load_helper(additional_files, _snapshot=snapshot, _read_sources=sources, **load_kwargs)
+        )
+        config = cls._create(values)
+        if sources is not None:
+            # refreshing loads the instance again on its own, without the snapshot shared by this call
+            _record_load(config, additional_files, load_kwargs, {}, zip(sources, values.maps))
+        configs.append(config)
+    return configs
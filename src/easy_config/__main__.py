@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+
+"""Command line tools for easy_config.
+
+Run ``python -m easy_config profile mypackage.config:MyProgramConfig`` to see how long loading a configuration takes,
+broken down by source and by field.
+"""
+
+import argparse
+import json
+import sys
+from typing import List, Optional
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run ``python -m easy_config``.
+
+    :param argv: the command line arguments, without the program name; defaults to :data:`sys.argv`
+    :returns: the exit status
+    """
+    parser = argparse.ArgumentParser(prog='python -m easy_config', description='Command line tools for easy_config.')
+    subparsers = parser.add_subparsers(dest='command', metavar='COMMAND')
+
+    profile_parser = subparsers.add_parser(
+        'profile', help='time loading a configuration class, by source and by field'
+    )
+    profile_parser.add_argument(
+        'cls', metavar='CLASS', help='the configuration class to load, e.g. mypackage.config:MyProgramConfig'
+    )
+    profile_parser.add_argument(
+        '--file', action='append', dest='files', metavar='FILE', help='an additional file to load; may be repeated'
+    )
+    profile_parser.add_argument(
+        '--no-files', action='store_true', help='do not parse the files in the FILES class variable'
+    )
+    profile_parser.add_argument('--no-environment', action='store_true', help='do not read the environment')
+    profile_parser.add_argument(
+        '--lookup-config-envvar', metavar='NAME', help='the environment variable that contains a config file location'
+    )
+    profile_parser.add_argument('--json', action='store_true', help='write the profile as JSON')
+
+    args = parser.parse_args(argv)
+    if args.command is None:
+        parser.print_help()
+        return 2
+
+    from easy_config import ConfigValueCoercionError
+    from easy_config.profiling import import_class, profile_load
+
+    try:
+        cls = import_class(args.cls)
+    except (ImportError, AttributeError, TypeError) as e:
+        profile_parser.error(f'cannot import `{args.cls}`: {e}')
+    try:
+        profile = profile_load(
+            cls,
+            args.files,
+            _parse_files=not args.no_files,
+            _parse_environment=not args.no_environment,
+            _lookup_config_envvar=args.lookup_config_envvar,
+        )
+    except (ConfigValueCoercionError, TypeError) as e:  # a value that cannot be coerced, or a missing value
+        profile_parser.error(f'cannot load `{args.cls}`: {e}')
+    if args.json:
+        json.dump(profile.as_dict(), sys.stdout, indent=2)
+        sys.stdout.write('\n')
+    else:
+        profile.write(sys.stdout)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
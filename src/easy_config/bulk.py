@@ -0,0 +1,184 @@
+# -*- coding: utf-8 -*-
+
+"""Load one configuration class from each of many files, such as one file per tenant.
+
+:func:`iter_load` is equivalent to calling ``cls.load([path])`` for every path, but the keyword arguments, the
+environment, and the files in FILES are read once for the whole batch, and only the per-path files are read for each
+instance. The files can be read in a :class:`concurrent.futures.ProcessPoolExecutor` to use several cores:
+
+.. code-block:: python
+
+    from concurrent.futures import ProcessPoolExecutor
+    from easy_config.bulk import iter_load
+
+    with ProcessPoolExecutor() as executor:
+        for result in iter_load(TenantConfig, tenant_dir.glob('*.ini'), executor=executor):
+            if result.error is not None:
+                log.warning('cannot load %s: %s', result.path, result.error)
+            else:
+                tenants[result.config.tenant_id] = result.config
+"""
+
+import itertools
+import os
+from collections import ChainMap, deque
+from concurrent.futures import Executor, FIRST_COMPLETED, Future, wait
+from pathlib import Path
+from typing import Any, Deque, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple, Type, Union
+
+from easy_config import EasyConfig, _record_load
+
+__all__ = [
+    'LoadResult',
+    'iter_load',
+]
+
+FilePath = Union[str, Path]
+# for each file of a chunk: its values, or the error raised reading it
+ChunkResult = List[Tuple[Optional[Dict[str, Any]], Optional[Exception]]]
+
+
+class LoadResult(NamedTuple):
+    """The outcome of loading the configuration for one file."""
+
+    #: the file, as given to :func:`iter_load`
+    path: FilePath
+    #: the loaded configuration, or None if loading failed
+    config: Optional[EasyConfig]
+    #: the error that prevented loading, or None if loading succeeded
+    error: Optional[Exception]
+
+
+def _read_files(cls: Type[EasyConfig], paths: List[FilePath]) -> ChunkResult:
+    """Read a chunk of files, catching the error for each file separately. Runs in the executor."""
+    results: ChunkResult = []
+    for path in paths:
+        try:
+            results.append((cls._read_file(path), None))
+        except Exception as e:
+            results.append((None, e))
+    return results
+
+
+def iter_load(
+    cls: Type[EasyConfig],
+    paths: Iterable[FilePath],
+    *,
+    executor: Optional[Executor] = None,
+    chunksize: int = 64,
+    ordered: bool = True,
+    max_pending: Optional[int] = None,
+    _parse_files: bool = True,
+    _parse_environment: bool = True,
+    _lookup_config_envvar: Optional[str] = None,
+    _refreshable: bool = False,
+    **kwargs: Any,
+) -> Iterator[LoadResult]:
+    """Load a configuration class once for each of many files, yielding the results as they are ready.
+
+    Errors that concern a single file, such as a value that cannot be coerced or a missing value, are reported in
+    its result and do not stop the others from loading. Errors reading the sources shared by every file are raised.
+
+    Only ``max_pending`` chunks of paths are read at a time, and paths are taken from the iterable as needed, so
+    memory use does not depend on the number of files.
+
+    :param cls: the configuration class to load
+    :param paths: the files to load the configuration from, by path
+    :param executor: read the files in this executor, such as a :class:`concurrent.futures.ProcessPoolExecutor`;
+     by default, they are read one at a time in this thread. With a process pool, the configuration class must be
+     importable by the worker processes.
+    :param chunksize: the number of files read by each task submitted to the executor
+    :param ordered: yield the results in the same order as the paths; otherwise, yield each chunk as soon as it is read
+    :param max_pending: the maximum number of chunks being read at once; defaults to twice the number of CPUs
+    :param kwargs: the remaining parameters are the same as for :meth:`easy_config.EasyConfig.load`
+
+    :returns: an iterator of results, one for each path
+    """
+    # list the sources of cls.load([path]) with a placeholder for the path, and read all the others once up front
+    placeholder = object()
+    load_kwargs: Dict[str, Any] = {
+        '_parse_files': _parse_files,
+        '_parse_environment': _parse_environment,
+        '_lookup_config_envvar': _lookup_config_envvar,
+    }
+    sources = list(cls._sources([placeholder], **load_kwargs, **kwargs))  # type: ignore
+    split = next(index for index, source in enumerate(sources) if source.location is placeholder)
+    higher = [source.read() for source in sources[:split]]
+    lower = [source.read() for source in sources[split + 1:]]
+
+    iterator = iter(paths)
+    chunks = iter(lambda: list(itertools.islice(iterator, chunksize)), [])
+    if executor is None:
+        read_chunks: Iterator[Tuple[List[FilePath], ChunkResult]] = (
+            (chunk, _read_files(cls, chunk)) for chunk in chunks
+        )
+    else:
+        if max_pending is None:
+            max_pending = 2 * (os.cpu_count() or 1)
+        read_chunks = (_in_order if ordered else _as_completed)(executor, cls, chunks, max_pending)
+
+    for chunk, read in read_chunks:
+        for path, (values, error) in zip(chunk, read):
+            config = None
+            if values is not None:
+                try:
+                    config = cls._create(ChainMap(*higher, values, *lower))
+                except Exception as e:  # missing values, or validation in __post_init__
+                    error = e
+            if _refreshable and config is not None:
+                _record_load(config, [path], load_kwargs, kwargs)
+            yield LoadResult(path, config, error)
+
+
+def _result(chunk: List[FilePath], future: 'Future[ChunkResult]') -> Tuple[List[FilePath], ChunkResult]:
+    """Get the result of reading a chunk of files, turning a failure of the whole chunk into an error for each file."""
+    try:
+        return chunk, future.result()
+    except Exception as e:  # the chunk could not be read at all, e.g. because a worker process died
+        return chunk, [(None, e)] * len(chunk)
+
+
+def _in_order(
+    executor: Executor,
+    cls: Type[EasyConfig],
+    chunks: Iterator[List[FilePath]],
+    max_pending: int,
+) -> Iterator[Tuple[List[FilePath], ChunkResult]]:
+    """Read chunks of files in executor with at most max_pending at once, yielding them in the same order as chunks."""
+    queue: Deque[Tuple[List[FilePath], 'Future[ChunkResult]']] = deque()
+    try:
+        for chunk in chunks:
+            queue.append((chunk, executor.submit(_read_files, cls, chunk)))
+            if len(queue) >= max_pending:
+                yield _result(*queue.popleft())
+        while queue:
+            yield _result(*queue.popleft())
+    finally:
+        for _, future in queue:
+            future.cancel()
+
+
+def _as_completed(
+    executor: Executor,
+    cls: Type[EasyConfig],
+    chunks: Iterator[List[FilePath]],
+    max_pending: int,
+) -> Iterator[Tuple[List[FilePath], ChunkResult]]:
+    """Read chunks of files in executor with at most max_pending at once, yielding each as soon as it is read."""
+    pending: Dict['Future[ChunkResult]', List[FilePath]] = {}
+    exhausted = False
+    try:
+        while not exhausted or pending:
+            while not exhausted and len(pending) < max_pending:
+                chunk = next(chunks, None)
+                if chunk is None:
+                    exhausted = True
+                else:
+                    pending[executor.submit(_read_files, cls, chunk)] = chunk
+            if pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield _result(pending.pop(future), future)
+    finally:
+        for future in pending:
+            future.cancel()
@@ -141,6 +141,8 @@ def args_from_config(cls: Type[EasyConfig], prompt: bool = False) -> Callable[[F
     def decorate(command: F) -> F:
         """Decorate the :mod:`click` command."""
         for field in reversed(dataclasses.fields(cls)):
+            if cls.__easy_config_plan__.fields[field.name].nested is not None:
+                continue  # nested configuration classes are read from their own sections and environment variables
             if prompt:
                 doc = field.metadata.get('doc') if field.metadata is not None else None
                 if doc is not None:
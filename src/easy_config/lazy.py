@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+
+"""Configurations whose values are only read and coerced when they are first used.
+
+Create them with :meth:`easy_config.EasyConfig.load_lazy`. This is useful for configuration classes with many fields,
+or with fields of types that are expensive to create, when most programs only use a few of them.
+"""
+
+import dataclasses
+from collections import ChainMap
+from typing import Any, Dict, Iterable, List, Mapping, Tuple, Type
+
+from easy_config import EasyConfig, _MISSING, _Source
+
+__all__ = [
+    'LazyConfig',
+]
+
+
+class LazyConfig:
+    """A stand-in for an instance of a configuration class that reads each value the first time it is accessed.
+
+    Accessing a field looks through the sources in the same order as :meth:`easy_config.EasyConfig.load`, stopping at
+    the first one that has a value for it. Only that value is coerced, and it is remembered for later accesses. Files
+    are parsed the first time a field is looked up in them. Attributes other than fields, such as ``NAME``, come from
+    the configuration class.
+
+    Because values are found one at a time, ``__init__`` and ``__post_init__`` of the configuration class do not run
+    until :meth:`resolve` creates a real instance. Instances are not safe to share between threads.
+    """
+
+    __slots__ = ('_cls', '_sources', '_raw', '_values')
+
+    def __init__(self, cls: Type[EasyConfig], sources: Iterable[_Source]) -> None:
+        """Prepare to read the configuration lazily.
+
+        :param cls: the configuration class
+        :param sources: the sources to read, from highest to lowest priority, as listed by ``cls._sources()``
+        """
+        self._cls = cls
+        self._sources = list(sources)
+        # index of source -> (its values, whether they are already coerced)
+        self._raw: Dict[int, Tuple[Mapping[str, Any], bool]] = {}
+        self._values: Dict[str, Any] = {}
+
+    def __getattr__(self, name: str) -> Any:
+        # only called when normal lookup fails; guard against recursion before the slots are set, e.g. when copying
+        if name in LazyConfig.__slots__:
+            raise AttributeError(name)
+        if name not in self._cls.__easy_config_plan__.fields:
+            return getattr(self._cls, name)
+
+        try:
+            return self._values[name]
+        except KeyError:
+            pass
+
+        value = self._find(name)
+        if value is _MISSING:
+            value = self._default(name)
+        self._values[name] = value
+        return value
+
+    def __dir__(self) -> List[str]:
+        return sorted(set(dir(self._cls)) | set(self._cls.__easy_config_plan__.fields))
+
+    def __repr__(self) -> str:
+        read = f'{len(self._values)} of {len(self._cls.__easy_config_plan__.fields)} values read'
+        return f'<{self.__class__.__name__} for {self._cls.__qualname__}: {read}>'
+
+    def validate(self) -> None:
+        """Check that every field without a default has a value in some source.
+
+        Files are parsed to look for the values, but the values are not coerced, except those of sources that do not
+        keep raw values, such as plugin sources and JSON or TOML files: those are read and coerced as a whole, and their
+        values are kept for later accesses.
+
+        :raises TypeError: when some values are missing; the message names them
+        """
+        missing = []
+        for name in self._cls.__easy_config_plan__.fields:
+            field = self._cls.__dataclass_fields__[name]  # type: ignore
+            if field.default is not dataclasses.MISSING or field.default_factory is not dataclasses.MISSING:
+                continue
+            if field.name in self._values:
+                continue
+            if not any(field.name in self._read(index)[0] for index in range(len(self._sources))):
+                missing.append(field.name)
+        if missing:
+            raise TypeError(f'missing some configuration values: {", ".join(missing)}')
+
+    def resolve(self) -> EasyConfig:
+        """Read all remaining values and create a real instance of the configuration class.
+
+        :returns: an instance equal to the one :meth:`easy_config.EasyConfig.load` would have returned
+        :raises TypeError: when a configuration value without a default is missing
+        """
+        values = {}
+        for name in self._cls.__easy_config_plan__.fields:
+            if name in self._values:
+                values[name] = self._values[name]
+                continue
+            value = self._find(name)
+            if value is not _MISSING:
+                values[name] = self._values[name] = value
+        return self._cls._create(values)
+
+    def _read(self, index: int) -> Tuple[Mapping[str, Any], bool]:
+        """Get the values of a source and whether they are already coerced, reading it the first time."""
+        try:
+            return self._raw[index]
+        except KeyError:
+            pass
+        source = self._sources[index]
+        result = (source.read(), True) if source.raw is None else (source.raw(), False)
+        self._raw[index] = result
+        return result
+
+    def _find(self, name: str) -> Any:
+        """Find and coerce the highest-priority value of a field, or return ``_MISSING``."""
+        field = self._cls.__easy_config_plan__.fields[name]
+        found = []
+        for index, source in enumerate(self._sources):
+            values, coerced = self._read(index)
+            if name in values:
+                found.append(values[name] if coerced else field.coerce(source.kind, values[name], source.description))
+                # each source can have some of the values of a nested class, so they are merged from every source
+                if field.nested is None:
+                    return found[0]
+        if not found:
+            return _MISSING
+        return field.type._create(ChainMap(*found))
+
+    def _default(self, name: str) -> Any:
+        """Get the default value of a field that has no value in any source."""
+        field = self._cls.__dataclass_fields__[name]  # type: ignore
+        if field.default is not dataclasses.MISSING:
+            return field.default
+        if field.default_factory is not dataclasses.MISSING:
+            return field.default_factory()
+        raise TypeError(f'missing configuration value `{name}`')
@@ -0,0 +1,215 @@
+# -*- coding: utf-8 -*-
+
+"""Report what easy_config is doing to a metrics system.
+
+Loading does not measure anything until a sink is set with :func:`set_metrics_sink`. After that, it reports:
+
+``easy_config_loads_total`` (counter; label ``config``)
+    calls to :meth:`easy_config.EasyConfig.load`, :meth:`~easy_config.EasyConfig.aload`,
+    :meth:`~easy_config.EasyConfig.resolve`, and :meth:`easy_config.snapshot.SnapshotCache.load`, and each class loaded
+    by :func:`easy_config.load_many`; instances created from rows, columns, or by :func:`easy_config.bulk.iter_load`
+    are not loads
+``easy_config_source_seconds`` (histogram; labels ``config`` and ``kind``)
+    the time taken to read each source: ``kwargs``, ``environment``, ``file``, or ``plugin`` for those in SOURCES
+``easy_config_coercion_errors_total`` (counter; labels ``config``, ``kind``, and ``field``)
+    values that could not be coerced to the type of their field
+``easy_config_file_cache_hits_total`` and ``easy_config_file_cache_misses_total`` (counters)
+    lookups in :class:`easy_config.ParsedFileCache`
+``easy_config_reload_seconds`` (histogram; label ``config``)
+    the time taken by :class:`easy_config.watch.ConfigWatcher` to reload a configuration
+``easy_config_reload_failures_total`` (counter; label ``config``)
+    reloads that failed, leaving the previous configuration in place
+
+To use these with a metrics library, subclass :class:`MetricsSink`. To expose them without one, use
+:class:`InMemoryMetricsSink` and serve the output of :func:`render_prometheus`:
+
+.. code-block:: python
+
+    from easy_config.metrics import InMemoryMetricsSink, render_prometheus, set_metrics_sink
+
+    sink = InMemoryMetricsSink()
+    set_metrics_sink(sink)
+    ...
+    body = render_prometheus(sink)  # e.g. as the response to GET /metrics
+"""
+
+import bisect
+import threading
+from typing import Dict, List, Mapping, NamedTuple, Optional, Sequence, Tuple
+
+import easy_config
+
+__all__ = [
+    'DEFAULT_BUCKETS',
+    'Histogram',
+    'InMemoryMetricsSink',
+    'MetricsSink',
+    'render_prometheus',
+    'set_metrics_sink',
+]
+
+#: the upper bounds of the histogram buckets used by :class:`InMemoryMetricsSink`, in seconds; the same as the
+#: defaults of the Prometheus client libraries
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.25, 0.5, 0.75, 1.0, 2.5, 5.0, 7.5, 10.0)
+
+_HELP = {
+    'easy_config_loads_total': 'Configuration loads.',
+    'easy_config_source_seconds': 'Time taken to read a configuration source.',
+    'easy_config_coercion_errors_total': 'Configuration values that could not be coerced to the type of their field.',
+    'easy_config_file_cache_hits_total': 'Configuration files found unchanged in the parsed file cache.',
+    'easy_config_file_cache_misses_total': 'Configuration files that had to be parsed.',
+    'easy_config_reload_seconds': 'Time taken to reload a watched configuration.',
+    'easy_config_reload_failures_total': 'Reloads of a watched configuration that failed.',
+}
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+class MetricsSink:
+    """Receives the metrics reported by easy_config. This base class discards them; subclass it to record them.
+
+    Methods may be called from any thread, and are called while loading, so they should return quickly.
+    """
+
+    def increment(self, name: str, labels: Mapping[str, str], value: float = 1.0) -> None:
+        """Add to a counter.
+
+        :param name: the name of the counter, such as ``'easy_config_loads_total'``
+        :param labels: the labels identifying the series
+        :param value: the amount to add
+        """
+
+    def observe(self, name: str, labels: Mapping[str, str], value: float) -> None:
+        """Record a measurement in a histogram.
+
+        :param name: the name of the histogram, such as ``'easy_config_source_seconds'``
+        :param labels: the labels identifying the series
+        :param value: the measurement, in seconds
+        """
+
+
+class Histogram(NamedTuple):
+    """A snapshot of one histogram series in an :class:`InMemoryMetricsSink`."""
+
+    #: the number of measurements at or below each bound in ``buckets``, not cumulative
+    bucket_counts: List[int]
+    #: the number of measurements
+    observations: int
+    #: the sum of the measurements
+    total: float
+
+
+class InMemoryMetricsSink(MetricsSink):
+    """Keeps counters and histograms in memory, for inspection or :func:`render_prometheus`."""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        """Create an empty sink.
+
+        :param buckets: the upper bounds of the histogram buckets, in increasing order
+        """
+        self.buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        self._counters: Dict[Tuple[str, Labels], float] = {}
+        # name and labels -> the number of measurements in each bucket, plus one for those above every bound, and sum
+        self._histograms: Dict[Tuple[str, Labels], Tuple[List[int], float]] = {}
+
+    def increment(self, name: str, labels: Mapping[str, str], value: float = 1.0) -> None:
+        """Add to a counter."""
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0.0) + value
+
+    def observe(self, name: str, labels: Mapping[str, str], value: float) -> None:
+        """Record a measurement in a histogram."""
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            counts, total = self._histograms.get(key) or ([0] * (len(self.buckets) + 1), 0.0)
+            counts[bisect.bisect_left(self.buckets, value)] += 1
+            self._histograms[key] = (counts, total + value)
+
+    def counter(self, name: str, **labels: str) -> float:
+        """Get the value of a counter series, which is 0 if it was never incremented."""
+        with self._lock:
+            return self._counters.get((name, tuple(sorted(labels.items()))), 0.0)
+
+    def histogram(self, name: str, **labels: str) -> Histogram:
+        """Get a snapshot of a histogram series, which is empty if nothing was observed."""
+        with self._lock:
+            counts, total = self._histograms.get(
+                (name, tuple(sorted(labels.items()))), ([0] * (len(self.buckets) + 1), 0.0)
+            )
+            return Histogram(counts[:-1], sum(counts), total)
+
+    def clear(self) -> None:
+        """Forget all metrics."""
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+    def _snapshot(self) -> Tuple[Dict[Tuple[str, Labels], float], Dict[Tuple[str, Labels], Tuple[List[int], float]]]:
+        """Copy all metrics at once, so that rendering sees a consistent state."""
+        with self._lock:
+            histograms = {key: (list(counts), total) for key, (counts, total) in self._histograms.items()}
+            return dict(self._counters), histograms
+
+
+def set_metrics_sink(sink: Optional[MetricsSink]) -> Optional[MetricsSink]:
+    """Report metrics to sink from now on, or stop measuring when sink is None.
+
+    Sources that were already listed, e.g. by a :class:`easy_config.lazy.LazyConfig`, keep reporting to the sink that
+    was set when they were listed.
+
+    :param sink: the sink to report to
+    :returns: the previous sink, so that it can be restored
+    """
+    previous = easy_config._metrics_sink
+    easy_config._metrics_sink = sink
+    return previous
+
+
+def _escape(value: str) -> str:
+    """Escape a label value for the Prometheus text format."""
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _series(name: str, labels: Labels) -> str:
+    """Format the name and labels of a sample in the Prometheus text format."""
+    pairs = ','.join(f'{key}="{_escape(value)}"' for key, value in labels)
+    return f'{name}{{{pairs}}}' if pairs else name
+
+
+def _number(value: float) -> str:
+    """Format a sample value or bucket bound, without a trailing ``.0`` for whole numbers."""
+    return str(int(value)) if float(value).is_integer() else repr(value)
+
+
+def render_prometheus(sink: InMemoryMetricsSink) -> str:
+    """Render the metrics in a sink in the Prometheus text exposition format, version 0.0.4.
+
+    Serve the result with the content type ``text/plain; version=0.0.4; charset=utf-8``.
+
+    :param sink: the sink to render
+    :returns: the metrics, one sample per line
+    """
+    counters, histograms = sink._snapshot()
+    lines: List[str] = []
+    for name in sorted({name for name, _ in counters}):
+        lines.append(f'# HELP {name} {_HELP.get(name, name)}')
+        lines.append(f'# TYPE {name} counter')
+        for (series_name, labels), value in sorted(counters.items()):
+            if series_name == name:
+                lines.append(f'{_series(name, labels)} {_number(value)}')
+    for name in sorted({name for name, _ in histograms}):
+        lines.append(f'# HELP {name} {_HELP.get(name, name)}')
+        lines.append(f'# TYPE {name} histogram')
+        for (series_name, labels), (counts, total) in sorted(histograms.items()):
+            if series_name != name:
+                continue
+            cumulative = 0
+            for bound, count in zip(sink.buckets, counts):
+                cumulative += count
+                lines.append(f'{_series(name + "_bucket", labels + (("le", _number(bound)),))} {cumulative}')
+            lines.append(f'{_series(name + "_bucket", labels + (("le", "+Inf"),))} {sum(counts)}')
+            lines.append(f'{_series(name + "_sum", labels)} {_number(total)}')
+            lines.append(f'{_series(name + "_count", labels)} {sum(counts)}')
+    return '\n'.join(lines) + '\n' if lines else ''
@@ -0,0 +1,181 @@
+# -*- coding: utf-8 -*-
+
+"""Find out where the time goes when a configuration is loaded.
+
+:func:`profile_load` loads a configuration class like :meth:`easy_config.EasyConfig.load`, timing how long each source
+takes to read and how long each value takes to coerce. The same report is available from the command line:
+
+.. code-block:: bash
+
+   $ python -m easy_config profile mypackage.config:MyProgramConfig
+   $ python -m easy_config profile mypackage.config:MyProgramConfig --json
+"""
+
+import importlib
+import os
+import time
+from collections import ChainMap
+from typing import Any, Dict, List, NamedTuple, Optional, TextIO, Type
+
+from easy_config import EasyConfig, file_cache
+
+__all__ = [
+    'LoadProfile',
+    'SourceProfile',
+    'import_class',
+    'profile_load',
+]
+
+
+class SourceProfile(NamedTuple):
+    """How long one source took to read."""
+
+    #: ``'kwargs'``, ``'environment'``, ``'file'``, or ``'plugin'``
+    kind: str
+    #: the kind of source, the path of a file, or the description of a plugin source
+    description: str
+    #: the total time spent reading the source, in seconds, including parsing and coercion
+    seconds: float
+    #: the size of the raw values read from the source, or None when it is not known, e.g. for keyword arguments
+    bytes_read: Optional[int]
+    #: the time spent coercing each value found in the source, in seconds; empty for files read by a class that
+    #: overrides ``_read_file``, since those can only be timed as a whole
+    fields: Dict[str, float]
+
+
+class LoadProfile(NamedTuple):
+    """The result of :func:`profile_load`."""
+
+    #: the loaded configuration
+    config: EasyConfig
+    #: the time spent loading, in seconds
+    seconds: float
+    #: the sources, from highest to lowest priority
+    sources: List[SourceProfile]
+    #: the description of the source each field's value came from, or None for fields left at their defaults
+    winners: Dict[str, Optional[str]]
+
+    def field_seconds(self) -> Dict[str, float]:
+        """Get the total time spent coercing each field's values across all sources, in seconds."""
+        totals = dict.fromkeys(self.winners, 0.0)
+        for source in self.sources:
+            for name, seconds in source.fields.items():
+                totals[name] += seconds
+        return totals
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Convert the profile to a JSON-serializable dictionary."""
+        field_seconds = self.field_seconds()
+        return {
+            'class': type(self.config).__qualname__,
+            'seconds': self.seconds,
+            'sources': [
+                {
+                    'kind': source.kind,
+                    'description': source.description,
+                    'seconds': source.seconds,
+                    'bytes_read': source.bytes_read,
+                    'fields': source.fields,
+                }
+                for source in self.sources
+            ],
+            'fields': {
+                name: {'seconds': field_seconds[name], 'source': winner} for name, winner in self.winners.items()
+            },
+        }
+
+    def write(self, fp: TextIO) -> None:
+        """Write the profile to fp as a table for humans.
+
+        :param fp: a write()-supporting file-like object
+        """
+        fp.write(f'Loaded {type(self.config).__qualname__} in {self.seconds * 1000:.3f} ms\n\n')
+        fp.write(f'{"source":<40} {"ms":>10} {"bytes":>10} {"values":>7}\n')
+        for source in self.sources:
+            bytes_read = '-' if source.bytes_read is None else str(source.bytes_read)
+            fp.write(
+                f'{source.description:<40} {source.seconds * 1000:>10.3f} {bytes_read:>10} {len(source.fields):>7}\n'
+            )
+        fp.write(f'\n{"field":<40} {"ms":>10}  source\n')
+        field_seconds = self.field_seconds()
+        for name, winner in self.winners.items():
+            fp.write(f'{name:<40} {field_seconds[name] * 1000:>10.3f}  {winner or "(default)"}\n')
+
+
+def import_class(path: str) -> Type[EasyConfig]:
+    """Import a configuration class by its dotted path.
+
+    :param path: the module and the class, separated by a colon or a dot, e.g. ``'mypackage.config:MyProgramConfig'``
+    :raises ImportError: when the module cannot be imported
+    :raises AttributeError: when the module has no such class
+    :raises TypeError: when the object is not a configuration class
+    """
+    module_name, _, qualname = path.partition(':') if ':' in path else path.rpartition('.')
+    obj: Any = importlib.import_module(module_name)
+    for attribute in qualname.split('.'):
+        obj = getattr(obj, attribute)
+    if not (isinstance(obj, type) and issubclass(obj, EasyConfig)):
+        raise TypeError(f'`{path}` is not an EasyConfig subclass')
+    return obj
+
+
+def _size(value: Any) -> int:
+    """Estimate the number of bytes a raw value took up in its source."""
+    if isinstance(value, str):
+        return len(value.encode())
+    if isinstance(value, dict):  # the values of a mapping field
+        return sum(_size(item) for item in value.values())
+    return 0
+
+
+def profile_load(cls: Type[EasyConfig], _additional_files: Any = None, **kwargs: Any) -> LoadProfile:
+    """Load a configuration class, timing each source and each coerced value.
+
+    Files given by path are removed from :data:`easy_config.file_cache` first, so their parsing is timed as it would
+    be the first time a program loads its configuration.
+
+    :param cls: the configuration class to load
+    :param kwargs: the remaining parameters are the same as for :meth:`easy_config.EasyConfig.load`
+
+    :returns: the loaded configuration and the timings
+    :raises TypeError: when a configuration value without a default is missing
+    :raises ConfigValueCoercionError: when a value cannot be coerced
+    """
+    fields = cls.__easy_config_plan__.fields
+    profiles: List[SourceProfile] = []
+    maps: List[Dict[str, Any]] = []
+    winners: Dict[str, Optional[str]] = dict.fromkeys(fields)
+
+    start = time.perf_counter()
+    for source in cls._sources(_additional_files, **kwargs):
+        path = os.fspath(source.location) if isinstance(source.location, (str, os.PathLike)) else None
+        if path is not None:
+            file_cache.invalidate(path)
+
+        source_start = time.perf_counter()
+        field_seconds: Dict[str, float] = {}
+        if source.raw is None:
+            values = source.read()
+            bytes_read: Optional[int] = None
+        else:
+            raw = source.raw()
+            values = {}
+            for name in fields:
+                if name not in raw:
+                    continue
+                field_start = time.perf_counter()
+                values[name] = fields[name].coerce(source.kind, raw[name], source.description)
+                field_seconds[name] = time.perf_counter() - field_start
+            bytes_read = sum(_size(raw[name]) for name in values) if source.kind == 'environment' else None
+        seconds = time.perf_counter() - source_start
+
+        if path is not None:
+            bytes_read = os.path.getsize(path) if os.path.isfile(path) else 0
+        for name in values:
+            if winners[name] is None:
+                winners[name] = source.description
+        maps.append(values)
+        profiles.append(SourceProfile(source.kind, source.description, seconds, bytes_read, field_seconds))
+
+    config = cls._create(ChainMap(*maps))
+    return LoadProfile(config, time.perf_counter() - start, profiles, winners)
@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+
+"""Load configurations again, only coercing the values that changed. Use :meth:`easy_config.EasyConfig.refresh`.
+
+.. code-block:: python
+
+    config = MyProgramConfig.load(_refreshable=True)
+    ...
+    config, changes = config.refresh()
+    if 'number' in changes:
+        print('number changed from', changes['number'].old, 'to', changes['number'].new)
+"""
+
+import dataclasses
+from collections import ChainMap
+from typing import Any, Dict, Iterable, List, Mapping, NamedTuple, Tuple, TypeVar
+
+from easy_config import EasyConfig, _FieldPlan, _LoadRecord, _MISSING, _Source
+
+__all__ = [
+    'FieldChange',
+]
+
+EasyConfigOrSubclass = TypeVar('EasyConfigOrSubclass', bound=EasyConfig)
+
+# the sources of a field with a value in them, from highest to lowest priority, and the values read from each
+_Found = List[Tuple[_Source, Mapping[str, Any]]]
+
+
+class FieldChange(NamedTuple):
+    """How the value of a field changed in a refresh."""
+
+    old: Any
+    new: Any
+    #: where the new value comes from: ``'kwargs'``, ``'environment'``, the path of a file, the description of a plugin
+    #: source, or ``'default'``
+    source: str
+
+
+def _read(source: _Source) -> Mapping[str, Any]:
+    """Get the values of a source, uncoerced when the source allows it."""
+    return source.read() if source.raw is None else dict(source.raw())
+
+
+def _find(fields: Mapping[str, _FieldPlan], sources: List[_Source], read: List[Mapping[str, Any]]) -> Dict[str, _Found]:
+    """Find the sources with a value for each field that has one, from the highest priority to the lowest."""
+    found = {}
+    for name in fields:
+        field_found = [(source, values) for source, values in zip(sources, read) if name in values]
+        if field_found:
+            found[name] = field_found
+    return found
+
+
+def _winner(field: _FieldPlan, found: _Found) -> Any:
+    """Identify the value of a field by where it comes from and its value there.
+
+    A source either keeps raw values or not, so its description also tells whether the value is coerced. Fields of
+    nested configuration classes merge the values of every source, so all of them identify the value.
+    """
+    if field.nested is not None:
+        return tuple((source.description, values[field.name]) for source, values in found)
+    source, values = found[0]
+    return source.description, values[field.name]
+
+
+def _coerce(field: _FieldPlan, found: _Found) -> Any:
+    """Coerce the value of a field that changed."""
+    if field.nested is not None:
+        return field.type._create(ChainMap(*(values[field.name] for _, values in found)))
+    source, values = found[0]
+    if source.raw is None:
+        return values[field.name]
+    return field.coerce(source.kind, values[field.name], source.description)
+
+
+def loaded_winners(
+    fields: Mapping[str, _FieldPlan], read: Iterable[Tuple[_Source, Mapping[str, Any]]]
+) -> Dict[str, Any]:
+    """Identify the value of each field as loaded, for the first refresh to compare with.
+
+    :param fields: the fields of the configuration class
+    :param read: the sources read by the load and the values read from each
+    """
+    sources: List[_Source] = []
+    values: List[Mapping[str, Any]] = []
+    for source, source_values in read:
+        sources.append(source)
+        # the raw view of a source of files is that of the sections parsed by the load
+        values.append(source_values if source.raw is None else dict(source.raw()))
+    return {name: _winner(fields[name], found) for name, found in _find(fields, sources, values).items()}
+
+
+def refresh(
+    config: EasyConfigOrSubclass, record: _LoadRecord
+) -> Tuple[EasyConfigOrSubclass, Dict[str, FieldChange], Dict[str, Any]]:
+    """Load an instance again for :meth:`easy_config.EasyConfig.refresh`.
+
+    :param config: the instance
+    :param record: how the instance was loaded
+    :returns: the new instance, or config if no values changed, the changes, and what identifies the value of each
+     field, to compare with in the next refresh
+    """
+    cls = type(config)
+    fields = cls.__easy_config_plan__.fields
+    sources = list(cls._sources(record.additional_files, **record.load_kwargs, **record.kwargs))
+    previous = record.winners
+    values: Dict[str, Any] = {}
+    winners: Dict[str, Any] = {}
+    origins: Dict[str, str] = {}
+    for name, found in _find(fields, sources, [_read(source) for source in sources]).items():
+        field = fields[name]
+        winners[name] = _winner(field, found)
+        origins[name] = found[0][0].description
+        values[name] = getattr(config, name) if previous.get(name, _MISSING) == winners[name] else _coerce(field, found)
+
+    new_config = cls._create(values)
+    changes = {}
+    for field in dataclasses.fields(cls):  # type: ignore
+        old, new = getattr(config, field.name), getattr(new_config, field.name)
+        if old != new:
+            changes[field.name] = FieldChange(old, new, origins.get(field.name, 'default'))
+    return (new_config if changes else config), changes, winners
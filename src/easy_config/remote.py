@@ -0,0 +1,203 @@
+# -*- coding: utf-8 -*-
+
+"""Read configuration values from an HTTP configuration service.
+
+List an :class:`HTTPSource` in the SOURCES class variable of a configuration class to read values from a service that
+answers ``GET`` requests with a JSON object. Its values override those of files, and are overridden by the environment
+and keyword arguments.
+
+.. code-block:: python
+
+    from easy_config.remote import HTTPSource
+
+    class MyProgramConfig(EasyConfig):
+        FILES = ['myprogram.ini']
+        NAME = 'MyProgram'
+        SOURCES = [HTTPSource('http://config.internal/v1/{name}', ttl=30)]
+
+        number: int
+
+Connections are kept alive and reused between loads, responses are cached for ``ttl`` seconds, and after that they are
+revalidated with ``If-None-Match``, so a configuration that has not changed costs a ``304 Not Modified`` without a body.
+"""
+
+import http.client
+import json
+import threading
+import time
+import urllib.parse
+from typing import Any, Dict, List, Mapping, NamedTuple, Optional, Tuple, Type
+
+from easy_config import ConfigSource, EasyConfig
+
+__all__ = [
+    'HTTPSource',
+]
+
+
+class _CachedResponse(NamedTuple):
+    """A response remembered by an :class:`HTTPSource`."""
+
+    document: Any
+    etag: Optional[str]
+    #: the :func:`time.monotonic` time after which the response has to be revalidated
+    expires: float
+
+
+class HTTPSource(ConfigSource):
+    """Read configuration values from the JSON documents served at a URL.
+
+    If the URL contains ``{name}``, it is replaced with the NAME of the configuration class being loaded, and the
+    document holds the values for that class. Otherwise, all classes share one document, in which the values for each
+    class are under its NAME, as in JSON files. A URL that answers ``404 Not Found`` has no values.
+
+    The statistics ``hits`` (responses used without a request), ``not_modified`` (responses revalidated by a ``304``),
+    and ``misses`` (documents downloaded) count the loads served by each.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        *,
+        ttl: float = 60.0,
+        timeout: float = 10.0,
+        headers: Optional[Mapping[str, str]] = None,
+        max_connections: int = 4,
+    ) -> None:
+        """Prepare to read from a URL, without connecting yet.
+
+        :param url: the ``http`` or ``https`` URL of the documents, optionally containing ``{name}``
+        :param ttl: the number of seconds a response is used for before it is revalidated
+        :param timeout: the number of seconds to wait for the service to connect or answer
+        :param headers: extra headers to send with each request, e.g. for authorization
+        :param max_connections: the maximum number of idle keep-alive connections to keep open
+        :raises ValueError: when the URL is not an ``http`` or ``https`` URL
+        """
+        parts = urllib.parse.urlsplit(url)
+        if parts.scheme not in ('http', 'https') or not parts.hostname:
+            raise ValueError(f'not an http or https URL: {url}')
+        self.url = url
+        self.ttl = ttl
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self._headers = dict(headers or {})
+        self._host = parts.hostname
+        self._port = parts.port
+        self._connection_class = http.client.HTTPSConnection if parts.scheme == 'https' else http.client.HTTPConnection
+        self._idle: List[http.client.HTTPConnection] = []
+        self._cache: Dict[str, _CachedResponse] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.not_modified = 0
+        self.misses = 0
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({self.url!r})'
+
+    @property
+    def description(self) -> str:
+        """The URL of the documents."""
+        return self.url
+
+    def fetch(self, config_class: Type[EasyConfig]) -> Optional[Mapping[str, Any]]:
+        """Get the values for a configuration class from the service, or from the cached response while it is fresh.
+
+        :param config_class: the configuration class being loaded
+        :returns: the values in the document for the class, or None if there are none
+        :raises OSError: when the service cannot be reached or answers with an error
+        :raises ValueError: when the document is not valid JSON
+        """
+        if '{name}' in self.url:
+            values = self._get(self.url.replace('{name}', urllib.parse.quote(config_class.NAME)))
+        else:
+            document = self._get(self.url)
+            values = document.get(config_class.NAME) if isinstance(document, Mapping) else None
+        return values if isinstance(values, Mapping) else None
+
+    def invalidate(self) -> None:
+        """Forget the cached responses, so that the next fetch downloads the documents again."""
+        with self._lock:
+            self._cache.clear()
+
+    def close(self) -> None:
+        """Close the idle connections. Later fetches open new ones."""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for connection in idle:
+            connection.close()
+
+    def _get(self, url: str) -> Any:
+        """Get the document at a URL, revalidating the cached response once it has expired."""
+        with self._lock:
+            cached = self._cache.get(url)
+            if cached is not None and time.monotonic() < cached.expires:
+                self.hits += 1
+                return cached.document
+
+        headers = dict(self._headers, Accept='application/json')
+        if cached is not None and cached.etag is not None:
+            headers['If-None-Match'] = cached.etag
+        status, etag, body = self._request(url, headers)
+        if status == http.client.NOT_MODIFIED and cached is not None:
+            document, etag = cached.document, cached.etag
+        elif status == http.client.NOT_FOUND:
+            document = None
+        elif status == http.client.OK:
+            document = json.loads(body.decode('utf-8'))
+        else:
+            raise OSError(f'GET {url} answered HTTP {status}')
+
+        with self._lock:
+            if status == http.client.NOT_MODIFIED:
+                self.not_modified += 1
+            else:
+                self.misses += 1
+            self._cache[url] = _CachedResponse(document, etag, time.monotonic() + self.ttl)
+        return document
+
+    def _request(self, url: str, headers: Dict[str, str]) -> Tuple[int, Optional[str], bytes]:
+        """Send a GET request on a pooled connection.
+
+        :returns: the status, the ETag header, and the body of the response
+        """
+        parts = urllib.parse.urlsplit(url)
+        target = parts.path or '/'
+        if parts.query:
+            target += '?' + parts.query
+        while True:
+            connection, reused = self._checkout()
+            try:
+                connection.request('GET', target, headers=headers)
+                response = connection.getresponse()
+                body = response.read()
+            except ConnectionError:
+                connection.close()
+                if reused:
+                    continue  # the service closed the idle connection; try the next one, or a new one
+                raise
+            except BaseException:
+                connection.close()
+                raise
+            if response.will_close:
+                connection.close()
+            else:
+                self._checkin(connection)
+            return response.status, response.getheader('ETag'), body
+
+    def _checkout(self) -> Tuple[http.client.HTTPConnection, bool]:
+        """Take an idle connection, or open a new one.
+
+        :returns: the connection and whether it was used before
+        """
+        with self._lock:
+            if self._idle:
+                return self._idle.pop(), True
+        return self._connection_class(self._host, self._port, timeout=self.timeout), False
+
+    def _checkin(self, connection: http.client.HTTPConnection) -> None:
+        """Keep a connection whose response has been read for the next request, unless enough are kept already."""
+        with self._lock:
+            if len(self._idle) < self.max_connections:
+                self._idle.append(connection)
+                return
+        connection.close()
@@ -0,0 +1,287 @@
+# -*- coding: utf-8 -*-
+
+"""Read secrets, such as passwords and API tokens, from a secrets backend without slowing down loading.
+
+Mark the fields that hold secrets with :func:`secret`, and list a :class:`SecretsSource` in the SOURCES class variable
+of the configuration class. The source looks each secret up with a :class:`SecretProvider` the first time it is
+loaded, then keeps it cached and refreshes it in a background thread shortly before its TTL runs out. Later loads only
+read the cache, so they never wait for the provider, and a secret that cannot be refreshed keeps its last value.
+
+.. code-block:: python
+
+    from easy_config.secrets import DirectoryProvider, SecretsSource, secret
+
+    class MyProgramConfig(EasyConfig):
+        FILES = ['myprogram.ini']
+        NAME = 'MyProgram'
+        SOURCES = [SecretsSource(DirectoryProvider('/var/run/secrets/myprogram'))]
+
+        db_host: str
+        db_password: str = secret('db-password')
+
+Like other sources, secrets are overridden by the environment and keyword arguments, so they can be given directly for
+local testing.
+"""
+
+import dataclasses
+import heapq
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, NamedTuple, Optional, Set, Tuple, Type, Union
+
+from easy_config import ConfigSource, EasyConfig
+
+__all__ = [
+    'DirectoryProvider',
+    'Secret',
+    'SecretProvider',
+    'SecretsSource',
+    'secret',
+]
+
+logger = logging.getLogger(__name__)
+
+
+def secret(name: Optional[str] = None, **kwargs: Any) -> Any:
+    """Mark a field of a configuration class as a secret read by :class:`SecretsSource`.
+
+    :param name: the name of the secret in the provider; defaults to the name of the field
+    :param kwargs: passed through to :func:`dataclasses.field`, e.g. ``default``
+    :returns: the field
+    """
+    metadata = dict(kwargs.pop('metadata', None) or {}, secret=name)
+    return dataclasses.field(metadata=metadata, **kwargs)
+
+
+class Secret(NamedTuple):
+    """The value of a secret, as looked up by a :class:`SecretProvider`."""
+
+    value: str
+    #: the number of seconds the value may be cached for, or None for the default TTL of the :class:`SecretsSource`
+    ttl: Optional[float] = None
+
+
+class SecretProvider:
+    """Looks up secrets in a secrets backend. Subclass it to support a backend."""
+
+    def get_secret(self, name: str) -> Secret:
+        """Look up a secret.
+
+        This may be slow; it is called from the background thread of the :class:`SecretsSource` after the first lookup.
+
+        :param name: the name of the secret
+        :returns: the value of the secret
+        :raises KeyError: when there is no such secret
+        """
+        raise NotImplementedError
+
+
+class DirectoryProvider(SecretProvider):
+    """Read each secret from a file named after it in a directory, like secrets mounted into a Kubernetes pod."""
+
+    def __init__(self, directory: Union[str, Path], *, ttl: Optional[float] = None) -> None:
+        """Prepare to read secrets from a directory.
+
+        :param directory: the directory containing one file per secret
+        :param ttl: the number of seconds to cache the secrets for, or None for the default of the source
+        """
+        self.directory = os.fspath(directory)
+        self.ttl = ttl
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({self.directory!r})'
+
+    def get_secret(self, name: str) -> Secret:
+        """Read a secret from its file, without the trailing newline.
+
+        :param name: the name of the secret, which may contain ``/`` to read from a subdirectory
+        :returns: the contents of the file
+        :raises KeyError: when there is no such file, or the name leads out of the directory
+        """
+        path = os.path.normpath(os.path.join(self.directory, name))
+        if os.path.commonpath([self.directory, path]) != os.path.normpath(self.directory):
+            raise KeyError(name)
+        try:
+            with open(path, encoding='utf-8') as f:
+                value = f.read()
+        except (FileNotFoundError, IsADirectoryError, NotADirectoryError):
+            raise KeyError(name) from None
+        return Secret(value[:-1] if value.endswith('\n') else value, self.ttl)
+
+
+class _CachedSecret(NamedTuple):
+    """What a :class:`SecretsSource` knows about a secret: its value, or None if the provider has no such secret."""
+
+    value: Optional[str]
+    #: the :func:`time.monotonic` time the value stops being valid
+    expires: float
+
+
+def _secret_names(config_class: Type[EasyConfig]) -> Dict[str, Any]:
+    """Get the name of the secret of each secret field of a class, and the same for each nested configuration class."""
+    names: Dict[str, Any] = {}
+    for field in dataclasses.fields(config_class):  # type: ignore
+        if 'secret' in field.metadata:
+            names[field.name] = field.metadata['secret'] or field.name
+    for nested_field in config_class.__easy_config_plan__.nested_fields:
+        nested_names = _secret_names(nested_field.type)
+        if nested_names:
+            names[nested_field.name] = nested_names
+    return names
+
+
+class SecretsSource(ConfigSource):
+    """Give the secret fields of configuration classes their values from a :class:`SecretProvider`, through a cache.
+
+    A secret is looked up the first time it is loaded, which waits for the provider. After that, it is refreshed in a
+    background thread once ``refresh_ahead`` of its TTL is left, and loads return the cached value without waiting.
+    When a refresh fails, it is retried every tenth of the default TTL (at most every minute), and the last value stays
+    in use even after it expires. Secrets the provider does not have are remembered as missing for the same TTL.
+
+    The statistics ``hits``, ``misses`` (lookups that waited for the provider), ``refreshes``, and ``errors`` (failed
+    refreshes) describe how the cache is used.
+    """
+
+    def __init__(self, provider: SecretProvider, *, ttl: float = 300.0, refresh_ahead: float = 0.2) -> None:
+        """Prepare to read secrets, without looking any up yet.
+
+        :param provider: looks up the secrets
+        :param ttl: the number of seconds to cache secrets whose provider does not give a TTL
+        :param refresh_ahead: the part of the TTL before expiry at which a secret is refreshed
+        """
+        self.provider = provider
+        self.ttl = ttl
+        self.refresh_ahead = refresh_ahead
+        self._cache: Dict[str, _CachedSecret] = {}
+        # (time to refresh, name) for each secret in the cache, and entries left behind when a secret is rescheduled
+        self._schedule: List[Tuple[float, str]] = []
+        # the time each secret is due to be refreshed, which tells the current entry of the schedule from stale ones
+        self._due: Dict[str, float] = {}
+        # the secrets being looked up for a load, which other loads wait for instead of asking the provider again
+        self._looking_up: Set[str] = set()
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+        self.hits = 0
+        self.misses = 0
+        self.refreshes = 0
+        self.errors = 0
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({self.provider!r})'
+
+    @property
+    def description(self) -> str:
+        """The provider of the secrets."""
+        return repr(self.provider)
+
+    def fetch(self, config_class: Type[EasyConfig]) -> Optional[Mapping[str, Any]]:
+        """Get the values of the secret fields of a configuration class, and of its nested configuration classes.
+
+        :param config_class: the configuration class being loaded
+        :returns: the value of each secret field whose secret the provider has
+        :raises Exception: whatever the provider raises when a secret is looked up for the first time
+        """
+        return self._values(_secret_names(config_class))
+
+    def get(self, name: str) -> Optional[str]:
+        """Get the value of a secret, only waiting for the provider the first time.
+
+        Concurrent loads of a secret that is not cached yet share a single lookup.
+
+        :param name: the name of the secret
+        :returns: the value, or None if the provider has no such secret
+        """
+        with self._condition:
+            while True:
+                cached = self._cache.get(name)
+                # once closed, nothing refreshes secrets in the background, so expired ones are looked up again
+                if cached is not None and (not self._closed or cached.expires > time.monotonic()):
+                    self.hits += 1
+                    return cached.value
+                if name not in self._looking_up:
+                    break
+                self._condition.wait()
+            self.misses += 1
+            self._looking_up.add(name)
+        try:
+            return self._lookup(name)
+        finally:
+            with self._condition:
+                self._looking_up.discard(name)
+                self._condition.notify_all()
+
+    def close(self) -> None:
+        """Stop refreshing secrets in the background. Secrets are then looked up when they expire."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        if self._thread is not None:
+            self._thread.join()
+
+    def _values(self, names: Mapping[str, Any]) -> Dict[str, Any]:
+        """Get the values of the secrets of each field, or a mapping of them for nested classes."""
+        values = {}
+        for field_name, name in names.items():
+            value = self._values(name) if isinstance(name, Mapping) else self.get(name)
+            if value is not None:
+                values[field_name] = value
+        return values
+
+    def _lookup(self, name: str) -> Optional[str]:
+        """Look a secret up with the provider, cache it, and schedule its refresh."""
+        try:
+            found: Optional[Secret] = self.provider.get_secret(name)
+        except KeyError:
+            found = None
+        ttl = self.ttl if found is None or found.ttl is None else found.ttl
+        value = None if found is None else found.value
+        now = time.monotonic()
+        with self._condition:
+            self._cache[name] = _CachedSecret(value, now + ttl)
+            self._schedule_refresh(name, now + ttl * (1 - self.refresh_ahead))
+        return value
+
+    def _schedule_refresh(self, name: str, when: float) -> None:
+        """Refresh a secret at a time instead of when it was due before, starting the background thread if needed.
+
+        Call with the lock held.
+        """
+        if self._closed:
+            return
+        self._due[name] = when
+        heapq.heappush(self._schedule, (when, name))
+        self._condition.notify_all()  # loads waiting for a lookup share the condition with the background thread
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name='easy_config secrets', daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        """Refresh each secret when it is due, until closed."""
+        while True:
+            with self._condition:
+                while not self._closed and (not self._schedule or self._schedule[0][0] > time.monotonic()):
+                    self._condition.wait(self._schedule[0][0] - time.monotonic() if self._schedule else None)
+                if self._closed:
+                    return
+                when, name = heapq.heappop(self._schedule)
+                if self._due.get(name) != when:
+                    continue  # the secret was rescheduled since
+                del self._due[name]
+            self._refresh(name)
+
+    def _refresh(self, name: str) -> None:
+        """Look up a secret again, keeping its last value and retrying later when that fails."""
+        try:
+            self._lookup(name)
+        except Exception:
+            logger.warning('could not refresh secret `%s` from %r', name, self.provider, exc_info=True)
+            with self._condition:
+                self.errors += 1
+                self._schedule_refresh(name, time.monotonic() + min(self.ttl / 10, 60.0))
+        else:
+            with self._condition:
+                self.refreshes += 1
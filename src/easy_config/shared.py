@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+
+"""Load a configuration once in a pre-fork master process and share it with the workers.
+
+The master publishes a loaded configuration to a file, ideally on a memory-backed filesystem such as ``/dev/shm``.
+Workers unpickle it through a read-only memory map, straight from the page cache they all share, so none of them
+parses files or coerces values itself. When the master reloads, it publishes the new configuration as a new
+generation, and each worker switches to it the next time it calls :meth:`SharedConfig.get`:
+
+.. code-block:: python
+
+    from easy_config.shared import SharedConfig
+
+    shared = SharedConfig('/dev/shm/myprogram.config')
+    shared.publish(MyProgramConfig.load())  # in the master, before forking and after every reload
+
+    config = shared.get()  # in a worker, whenever the configuration is needed
+
+Configurations are stored as pickles, so the file must only be writable by trusted users, and the configuration
+class must be importable by the workers.
+"""
+
+import mmap
+import os
+import pickle
+import struct
+import threading
+from pathlib import Path
+from typing import Optional, Tuple, Union
+
+from easy_config import EasyConfig, _replace_file
+
+__all__ = [
+    'SharedConfig',
+]
+
+# magic, generation, length of the pickled configuration that follows
+_HEADER = struct.Struct('<8sQQ')
+_MAGIC = b'EZCFGSHM'
+
+
+class SharedConfig:
+    """A configuration published to a file by one process and read by others through shared memory.
+
+    Every publication replaces the file atomically with :func:`os.replace`, so a reader always sees one complete
+    generation. A reader keeps using the generation it last read until it next calls :meth:`get`.
+    """
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        """Share a configuration through a file.
+
+        :param path: the file to publish to and read from; its directory must exist
+        """
+        self.path = os.fspath(path)
+        self._lock = threading.Lock()
+        # (device, inode) of the file that config was read from
+        self._identity: Optional[Tuple[int, int]] = None
+        self._generation = 0
+        self._config: Optional[EasyConfig] = None
+
+    @property
+    def generation(self) -> int:
+        """The generation of the configuration most recently returned by :meth:`get`, or published by this process."""
+        return self._generation
+
+    def publish(self, config: EasyConfig) -> int:
+        """Make config the configuration that readers get, replacing any earlier generation.
+
+        :param config: the configuration to share
+        :returns: the generation of the published configuration, one more than the previous one
+        """
+        data = pickle.dumps(config, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            generation = self._read_generation() + 1
+            _replace_file(self.path, _HEADER.pack(_MAGIC, generation, len(data)), data)
+            self._generation = generation
+            self._config = config
+            stat = os.stat(self.path)
+            self._identity = (stat.st_dev, stat.st_ino)
+        return generation
+
+    def get(self) -> EasyConfig:
+        """Get the most recently published configuration.
+
+        The file is only mapped and unpickled when a new generation was published since the last call; otherwise this
+        costs one ``stat()``.
+
+        :raises FileNotFoundError: when nothing has been published yet
+        :raises ValueError: when the file is not a published configuration
+        """
+        stat = os.stat(self.path)
+        with self._lock:
+            if self._config is None or self._identity != (stat.st_dev, stat.st_ino):
+                self._attach()
+            assert self._config is not None
+            return self._config
+
+    def _attach(self) -> None:
+        """Map the published file and read the configuration in it. Call with the lock held."""
+        with open(self.path, 'rb') as f:
+            stat = os.fstat(f.fileno())
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                magic, generation, length = _HEADER.unpack_from(mapped)
+                if magic != _MAGIC:
+                    raise ValueError(f'`{self.path}` is not a shared configuration')
+                # unpickle straight from the shared pages instead of copying them into a bytes object first
+                with memoryview(mapped)[_HEADER.size:_HEADER.size + length] as payload:
+                    config = pickle.loads(payload)
+        self._identity = (stat.st_dev, stat.st_ino)
+        self._generation = generation
+        self._config = config
+
+    def _read_generation(self) -> int:
+        """Get the generation of the published file, or 0 if there is none."""
+        try:
+            with open(self.path, 'rb') as f:
+                header = f.read(_HEADER.size)
+        except FileNotFoundError:
+            return 0
+        if len(header) < _HEADER.size:
+            return 0
+        magic, generation, _ = _HEADER.unpack(header)
+        return generation if magic == _MAGIC else 0
@@ -0,0 +1,179 @@
+# -*- coding: utf-8 -*-
+
+"""Keep the values read from files and the environment on disk, so that new processes can skip reading them.
+
+When many short-lived processes load the same configuration, each of them parses the same files and coerces the same
+values. A :class:`SnapshotCache` does this once and saves the coerced values in a snapshot. Later loads check that
+nothing the values came from has changed--the contents of the files, the environment variables of the class, and the
+fields of the class--and then read the snapshot instead.
+
+.. code-block:: python
+
+    from easy_config.snapshot import SnapshotCache
+
+    snapshots = SnapshotCache('/var/cache/myprogram')
+    config = snapshots.load(MyProgramConfig)
+
+Snapshots are pickles, so the directory must only be writable by trusted users. They contain the coerced values,
+including any secrets, so the cache creates them readable only by their owner.
+"""
+
+import hashlib
+import logging
+import os
+import pickle
+from collections import ChainMap
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, TextIO, Type, Union
+
+import easy_config
+from easy_config import EasyConfig, __version__, _record_load, _replace_file
+
+__all__ = [
+    'SnapshotCache',
+]
+
+logger = logging.getLogger(__name__)
+
+
+def _digest(*parts: Any) -> str:
+    """Hash the repr of some values."""
+    return hashlib.sha256(repr(parts).encode()).hexdigest()
+
+
+def _file_fingerprint(path: str) -> Any:
+    """Identify the contents of a file by its path, modification time, size, and hash; None if it cannot be read."""
+    try:
+        stat = os.stat(path)
+        with open(path, 'rb') as f:
+            contents = f.read()
+    except OSError:
+        return None
+    return path, stat.st_mtime_ns, stat.st_size, hashlib.sha256(contents).hexdigest()
+
+
+class SnapshotCache:
+    """A directory of snapshots of the values loaded for configuration classes.
+
+    There is one snapshot for each combination of a configuration class and the files it is loaded from. Any number
+    of processes may share the directory: snapshots are replaced atomically, so readers see either the old or the
+    new snapshot, never part of one.
+    """
+
+    def __init__(self, directory: Union[str, Path]) -> None:
+        """Use the snapshots in a directory, which is created when the first snapshot is written.
+
+        :param directory: the directory to keep the snapshots in
+        """
+        self.directory = os.fspath(directory)
+        #: the number of loads that used a snapshot
+        self.hits = 0
+        #: the number of loads that read the files and the environment
+        self.misses = 0
+
+    def load(
+        self,
+        cls: Type[EasyConfig],
+        _additional_files: Optional[Iterable[Union[str, Path, TextIO]]] = None,
+        *,
+        _parse_files: bool = True,
+        _parse_environment: bool = True,
+        _lookup_config_envvar: Optional[str] = None,
+        _refreshable: bool = False,
+        **kwargs: Any,
+    ) -> EasyConfig:
+        """Load a configuration class like :meth:`easy_config.EasyConfig.load`, reusing a snapshot when possible.
+
+        Keyword arguments are never part of a snapshot; they are read on every load and take priority as usual. Files
+        given as open files and the plugin sources in the SOURCES class variable cannot be fingerprinted, so loads with
+        them always read everything and are not saved.
+
+        :param cls: the configuration class to load
+        :param kwargs: the remaining parameters are the same as for :meth:`easy_config.EasyConfig.load`
+
+        :returns: an instance of the configuration class loaded with the parsed values
+        """
+        load_kwargs: Dict[str, Any] = {
+            '_parse_files': _parse_files,
+            '_parse_environment': _parse_environment,
+            '_lookup_config_envvar': _lookup_config_envvar,
+        }
+        additional_files = None if _additional_files is None else list(_additional_files)
+        sources = [source for source in cls._sources(additional_files, **load_kwargs) if source.kind != 'kwargs']
+        if not all(
+            source.kind == 'environment' or source.kind == 'file' and isinstance(source.location, (str, os.PathLike))
+            for source in sources
+        ):
+            return cls.load(additional_files, **load_kwargs, _refreshable=_refreshable, **kwargs)
+        sink = easy_config._metrics_sink
+        if sink is not None:
+            sink.increment('easy_config_loads_total', {'config': cls.__qualname__})
+
+        paths = [os.path.abspath(source.location) for source in sources if source.kind == 'file']
+        snapshot_path = os.path.join(
+            self.directory, _digest(cls.__module__, cls.__qualname__, paths, load_kwargs) + '.pickle'
+        )
+        # taken before reading, so that a change made while reading makes the snapshot stale rather than wrong
+        fingerprint = self._fingerprint(cls, paths, _parse_environment or _lookup_config_envvar is not None)
+
+        maps = self._read(snapshot_path, fingerprint)
+        if maps is None:
+            self.misses += 1
+            maps = [source.read() for source in sources]
+            self._write(snapshot_path, fingerprint, maps)
+        else:
+            self.hits += 1
+        config = cls._create(ChainMap(cls._read_dict(kwargs), *maps))
+        if _refreshable:
+            # the files of a snapshot may have changed since it was taken, so the first refresh coerces every value
+            _record_load(config, additional_files, load_kwargs, kwargs)
+        return config
+
+    def clear(self) -> None:
+        """Delete all snapshots in the directory."""
+        try:
+            names = os.listdir(self.directory)
+        except FileNotFoundError:
+            return
+        for name in names:
+            if name.endswith('.pickle'):
+                try:
+                    os.remove(os.path.join(self.directory, name))
+                except FileNotFoundError:  # removed by another process
+                    pass
+
+    @staticmethod
+    def _fingerprint(config_class: Type[EasyConfig], paths: List[str], read_environment: bool) -> str:
+        """Identify everything a snapshot depends on: the files, the environment variables, and the fields."""
+        plan = config_class.__easy_config_plan__
+        environment = (
+            sorted((key, value) for key, value in os.environ.items() if key.startswith(plan.environment_prefix))
+            if read_environment
+            else None
+        )
+        schema = [(field.name, repr(field.type)) for field in plan.fields.values()]
+        files = [_file_fingerprint(path) for path in paths]
+        return _digest(__version__, config_class.NAME, schema, files, environment)
+
+    @staticmethod
+    def _read(snapshot_path: str, fingerprint: str) -> Optional[List[Dict[str, Any]]]:
+        """Read a snapshot, or return None if there is none or it does not match the fingerprint."""
+        try:
+            with open(snapshot_path, 'rb') as f:
+                stored_fingerprint, maps = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception:  # anything can go wrong unpickling a truncated or outdated snapshot
+            logger.debug('ignoring unreadable snapshot `%s`', snapshot_path, exc_info=True)
+            return None
+        return maps if stored_fingerprint == fingerprint else None
+
+    def _write(self, snapshot_path: str, fingerprint: str, maps: List[Dict[str, Any]]) -> None:
+        """Save a snapshot, replacing any previous one at once."""
+        try:
+            data = pickle.dumps((fingerprint, maps), protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:  # values of custom types may not be picklable
+            logger.debug('cannot snapshot `%s`', snapshot_path, exc_info=True)
+            return
+        os.makedirs(self.directory, mode=0o700, exist_ok=True)
+        _replace_file(snapshot_path, data)
@@ -0,0 +1,274 @@
+# -*- coding: utf-8 -*-
+
+"""Reload a configuration when the files it was loaded from change.
+
+On Linux, changes are detected with inotify, so an idle watcher costs nothing until one of the directories containing a
+configuration file is modified. Elsewhere, or when inotify is unavailable, the files are polled with ``stat()``. Either
+way, the configuration is only reloaded when the inode, modification time, or size of one of its files has changed.
+
+.. code-block:: python
+
+    from easy_config.watch import ConfigWatcher
+
+    watcher = ConfigWatcher(MyProgramConfig)
+    watcher.add_callback(lambda config: print('reloaded', config))
+    with watcher:
+        ...  # watcher.config is always the most recently loaded configuration
+"""
+
+import ctypes
+import ctypes.util
+import logging
+import os
+import select
+import struct
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple, Type, Union
+
+import easy_config
+from easy_config import EasyConfig, _file_version
+
+__all__ = [
+    'ConfigWatcher',
+]
+
+logger = logging.getLogger(__name__)
+
+Callback = Callable[[EasyConfig], Any]
+Fingerprint = Optional[Tuple[int, int, int]]
+
+# from <sys/inotify.h>
+_IN_MODIFY = 0x00000002
+_IN_ATTRIB = 0x00000004
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_CLOEXEC = 0o2000000
+_WATCH_MASK = _IN_MODIFY | _IN_ATTRIB | _IN_CLOSE_WRITE | _IN_MOVED_FROM | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE
+_EVENT_HEADER = struct.Struct('iIII')
+
+
+class _Inotify:
+    """A minimal inotify binding that watches the directories containing a set of files."""
+
+    def __init__(self) -> None:
+        """Create a new inotify instance.
+
+        :raises OSError: when inotify is not available
+        """
+        libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+        self._add_watch = libc.inotify_add_watch
+        self._add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        self._fd = libc.inotify_init1(_IN_CLOEXEC)
+        if self._fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+        # watch descriptor -> names of the watched files in that directory
+        self._names: Dict[int, Set[bytes]] = {}
+
+    def watch(self, paths: Iterable[str]) -> None:
+        """Start watching the directories containing paths, in addition to any already watched.
+
+        :raises OSError: when a directory cannot be watched, e.g. because it does not exist
+        """
+        for path in paths:
+            directory, name = os.path.split(path)
+            wd = self._add_watch(self._fd, os.fsencode(directory), _WATCH_MASK)
+            if wd < 0:
+                errno = ctypes.get_errno()
+                raise OSError(errno, os.strerror(errno), directory)
+            self._names.setdefault(wd, set()).add(os.fsencode(name))
+
+    def wait(self, timeout: float) -> bool:
+        """Wait for events in the watched directories.
+
+        :param timeout: the maximum number of seconds to wait
+        :returns: whether any of the events concerned one of the watched files
+        """
+        readable, _, _ = select.select([self._fd], [], [], timeout)
+        if not readable:
+            return False
+
+        buffer = os.read(self._fd, 64 * 1024)
+        relevant = False
+        offset = 0
+        while offset < len(buffer):
+            wd, _mask, _cookie, length = _EVENT_HEADER.unpack_from(buffer, offset)
+            offset += _EVENT_HEADER.size
+            name = buffer[offset:offset + length].rstrip(b'\0')
+            offset += length
+            relevant = relevant or name in self._names.get(wd, ())
+        return relevant
+
+    def close(self) -> None:
+        """Release the inotify file descriptor."""
+        os.close(self._fd)
+
+
+class ConfigWatcher:
+    """Load a configuration class and reload it whenever one of the files it came from changes.
+
+    The watched files are those :meth:`easy_config.EasyConfig.load` read: the FILES class variable, any
+    ``_additional_files``, and the file named by ``_lookup_config_envvar``. They are re-determined after every reload.
+    """
+
+    def __init__(
+        self,
+        cls: Type[EasyConfig],
+        _additional_files: Optional[Iterable[Union[str, Path]]] = None,
+        *,
+        poll_interval: float = 1.0,
+        use_inotify: bool = True,
+        **load_kwargs: Any,
+    ) -> None:
+        """Load the configuration for the first time.
+
+        :param cls: the configuration class to load
+        :param _additional_files: passed through to :meth:`easy_config.EasyConfig.load`; only paths can be watched,
+            not open files
+        :param poll_interval: how often, in seconds, to check the files when polling and the longest :meth:`stop` can
+            take to notice it was called
+        :param use_inotify: whether to use inotify when it is available; otherwise the files are always polled
+        :param load_kwargs: the remaining arguments to :meth:`easy_config.EasyConfig.load`
+
+        :raises TypeError: when one of the additional files is not a path
+        """
+        self.cls = cls
+        self._additional_files = None if _additional_files is None else list(_additional_files)
+        for config_file in self._additional_files or ():
+            if not isinstance(config_file, (str, Path, os.PathLike)):
+                raise TypeError(f'only files given by path can be watched, not {config_file!r}')
+        self._load_kwargs = load_kwargs
+        self.poll_interval = poll_interval
+        self._use_inotify = use_inotify
+
+        self._callbacks: List[Callback] = []
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._inotify: Optional[_Inotify] = None
+
+        self._fingerprints: Dict[str, Fingerprint] = {}
+        self.config = self._load()
+
+    @property
+    def paths(self) -> List[str]:
+        """The absolute paths of the files the current configuration was loaded from."""
+        return list(self._fingerprints)
+
+    def add_callback(self, callback: Callback) -> None:
+        """Call callback with the new configuration after every reload.
+
+        :param callback: a function accepting an instance of the configuration class
+        """
+        self._callbacks.append(callback)
+
+    def remove_callback(self, callback: Callback) -> None:
+        """Stop calling a callback added with :meth:`add_callback`.
+
+        :param callback: the callback to remove
+        """
+        self._callbacks.remove(callback)
+
+    def check(self) -> bool:
+        """Reload the configuration if any of its files changed since it was last loaded.
+
+        This is called automatically by the watcher thread, but may also be called directly to poll without a thread.
+        When reloading fails, the error is logged and the previous configuration is kept until the files change again.
+
+        :returns: whether the configuration was reloaded
+        """
+        with self._lock:
+            if all(_file_version(path) == fingerprint for path, fingerprint in self._fingerprints.items()):
+                return False
+            sink = easy_config._metrics_sink
+            labels = {'config': self.cls.__qualname__}
+            start = time.perf_counter()
+            try:
+                config = self._load()
+            except Exception:
+                logger.exception('failed to reload configuration for `%s`', self.cls.__qualname__)
+                if sink is not None:
+                    sink.increment('easy_config_reload_failures_total', labels)
+                return False
+            finally:
+                if sink is not None:
+                    sink.observe('easy_config_reload_seconds', labels, time.perf_counter() - start)
+            self.config = config
+
+        for callback in list(self._callbacks):
+            callback(config)
+        return True
+
+    def start(self) -> None:
+        """Start watching for changes in a background thread."""
+        if self._thread is not None:
+            raise RuntimeError('the watcher has already been started')
+        if self._use_inotify and sys.platform.startswith('linux'):
+            try:
+                self._inotify = _Inotify()
+                self._inotify.watch(self._fingerprints)
+            except (OSError, AttributeError):  # AttributeError: libc has no inotify functions
+                logger.debug('inotify is unavailable; polling for changes instead', exc_info=True)
+                self._close_inotify()
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run, name=f'ConfigWatcher-{self.cls.__qualname__}', daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the background thread and wait for it to exit."""
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self._close_inotify()
+
+    def __enter__(self) -> 'ConfigWatcher':
+        self.start()
+        return self
+
+    def __exit__(self, *_exc_info: Any) -> None:
+        self.stop()
+
+    def _load(self) -> EasyConfig:
+        """Load the configuration and record the files it was loaded from.
+
+        Call with the lock held or before starting.
+        """
+        sources = self.cls._sources(self._additional_files, **self._load_kwargs)
+        paths = [
+            os.path.abspath(source.location)
+            for source in sources
+            if source.kind == 'file' and isinstance(source.location, (str, Path, os.PathLike))
+        ]
+        # fingerprint before loading so that a change made during the load triggers another reload
+        self._fingerprints = {path: _file_version(path) for path in paths}
+        if self._inotify is not None:
+            try:
+                self._inotify.watch(paths)
+            except OSError:
+                logger.debug('cannot watch the new configuration files; polling for changes instead', exc_info=True)
+                self._close_inotify()
+        return self.cls.load(self._additional_files, **self._load_kwargs)
+
+    def _run(self) -> None:
+        """Wait for changes and reload until stopped."""
+        while True:
+            if self._inotify is not None:
+                changed = self._inotify.wait(self.poll_interval)
+            else:
+                changed = not self._stopped.wait(self.poll_interval)
+            if self._stopped.is_set():
+                return
+            if changed:
+                self.check()
+
+    def _close_inotify(self) -> None:
+        if self._inotify is not None:
+            self._inotify.close()
+            self._inotify = None
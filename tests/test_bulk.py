@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+
+"""Tests for loading many files with :mod:`easy_config.bulk`."""
+
+import itertools
+import multiprocessing
+import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+
+from easy_config import ConfigValueCoercionError, EasyConfig
+from easy_config.bulk import iter_load
+
+
+class TenantConfig(EasyConfig):
+    """Example EasyConfig subclass to test with."""
+
+    FILES = None
+    NAME = 'MyProgram'
+
+    number: int
+    word: str = 'default'
+    flag: bool = False
+
+
+@pytest.fixture
+def tenant_paths(tmp_path):
+    """Write ten tenant files; the fourth has a bad value and the seventh is missing its number."""
+    paths = []
+    for index in range(10):
+        path = tmp_path / f'tenant{index}.ini'
+        if index == 3:
+            path.write_text('[MyProgram]\nnumber = apple')
+        elif index == 6:
+            path.write_text('[MyProgram]\nword = lonely')
+        else:
+            path.write_text(f'[MyProgram]\nnumber = {index}')
+        paths.append(path)
+    return paths
+
+
+def check_results(results, paths):
+    """Check the results for the files written by tenant_paths, in order."""
+    assert [result.path for result in results] == paths
+    for index, result in enumerate(results):
+        if index == 3:
+            assert result.config is None
+            assert isinstance(result.error, ConfigValueCoercionError)
+            assert result.error.field == 'number'
+        elif index == 6:
+            assert result.config is None
+            assert isinstance(result.error, TypeError)
+        else:
+            assert result.error is None
+            assert result.config == TenantConfig(number=index, word='from kwargs', flag=True)
+
+
+def test_serial(tenant_paths, monkeypatch):
+    """Test loading in this thread, with the shared sources applied to every file."""
+    monkeypatch.setenv('MYPROGRAM_FLAG', 'true')
+    results = list(iter_load(TenantConfig, tenant_paths, chunksize=3, word='from kwargs'))
+    check_results(results, tenant_paths)
+
+
+@pytest.mark.parametrize('ordered', [True, False])
+def test_thread_pool(tenant_paths, ordered):
+    """Test loading in an executor, in order or as completed."""
+    with ThreadPoolExecutor(4) as executor:
+        results = list(
+            iter_load(
+                TenantConfig,
+                tenant_paths,
+                executor=executor,
+                chunksize=2,
+                ordered=ordered,
+                max_pending=2,
+                _parse_environment=False,
+                word='from kwargs',
+                flag=True,
+            )
+        )
+    if not ordered:
+        results.sort(key=lambda result: tenant_paths.index(result.path))
+    check_results(results, tenant_paths)
+
+
+@pytest.mark.skipif(sys.platform != 'linux', reason='forking workers is only reliable on Linux')
+def test_process_pool(tenant_paths):
+    """Test reading the files in worker processes."""
+    with ProcessPoolExecutor(2, mp_context=multiprocessing.get_context('fork')) as executor:
+        results = list(
+            iter_load(
+                TenantConfig,
+                tenant_paths,
+                executor=executor,
+                chunksize=4,
+                _parse_environment=False,
+                word='from kwargs',
+                flag=True,
+            )
+        )
+    check_results(results, tenant_paths)
+
+
+def test_bounded(tmp_path):
+    """Test that paths are only taken from the iterable as they are needed."""
+    path = tmp_path / 'tenant.ini'
+    path.write_text('[MyProgram]\nnumber = 1')
+    taken = []
+
+    def paths():
+        for index in itertools.count():
+            taken.append(index)
+            yield path
+
+    with ThreadPoolExecutor(2) as executor:
+        results = iter_load(TenantConfig, paths(), executor=executor, chunksize=5, max_pending=3)
+        for _ in range(100):
+            assert next(results).config.number == 1
+        results.close()
+    assert len(taken) <= 100 + 3 * 5 + 1
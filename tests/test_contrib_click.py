@@ -128,3 +128,28 @@ def test_prompt():  # noqa: D202
     runner = CliRunner()
     result = runner.invoke(main, input='2\n\n')
     assert result.output == 'A number.\nNumber: 2\nFloaty number [5.0]: \nnumber: 2\nfloaty_number: 5.0\n'
+
+
+def test_slots():  # noqa: D202
+    """Test that slotted, frozen configuration classes work with :func:`easy_config_option`."""
+
+    class ExampleConfig(EasyConfig):
+        """Example EasyConfig subclass to test with."""
+
+        FILES = None
+        NAME = 'MyProgram'
+        SLOTS = True
+        FROZEN = True
+
+        number: int
+        floaty_number: float = 5.0
+
+    @click.command()
+    @easy_config_option(ExampleConfig)
+    def main(config):
+        """Print the example configuration."""
+        click.echo(repr(config))
+
+    runner = CliRunner()
+    result = runner.invoke(main, ['4'])
+    assert result.output.endswith('ExampleConfig(number=4, floaty_number=5.0)\n')
@@ -2,12 +2,30 @@
 
 """Tests for the EasyConfig class."""
 
+import asyncio
+import dataclasses
 import os
+import pickle
+import sys
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 from io import StringIO
+from typing import Dict
 
 import pytest
 
-from easy_config import ConfigValueCoercionError, EasyConfig
+import easy_config
+from easy_config import (
+    CacheInfo,
+    ConfigValueCoercionError,
+    EasyConfig,
+    ParsedFileCache,
+    coercion_memo,
+    file_cache,
+    load_many,
+    register_format,
+)
 
 
 class ExampleConfig(EasyConfig):
@@ -44,11 +62,142 @@ def test_read_file(example_ini):
     assert ExampleConfig._read_file(empty_section) == {}
 
 
+def test_parsed_file_cache(tmp_path):
+    """Test that ParsedFileCache re-parses files only when they change and honors its size limit."""
+    cache = ParsedFileCache(maxsize=2)
+    first = tmp_path / 'first.ini'
+    first.write_text('[MyProgram]\nnumber = 1')
+    second = tmp_path / 'second.ini'
+    second.write_text('[MyProgram]\nnumber = 2')
+
+    parsed = cache.parse(first)
+    assert parsed.get('MyProgram', 'number') == '1'
+    assert cache.parse(str(first)) is parsed
+    assert cache.info() == (1, 1, 2, 1)
+
+    first.write_text('[MyProgram]\nnumber = 10')  # a different size guarantees a different fingerprint
+    assert cache.parse(first).get('MyProgram', 'number') == '10'
+    assert cache.info() == (1, 2, 2, 1)
+
+    cache.parse(second)
+    cache.parse(tmp_path / 'third.ini')  # missing files are not cached
+    assert cache.info().currsize == 2
+
+    cache.maxsize = 1
+    assert cache.info().currsize == 1
+    cache.parse(first)
+    assert cache.info().misses == 4, 'the least recently used file should have been evicted'
+
+    cache.invalidate(first)
+    assert cache.info().currsize == 0
+
+    cache.maxsize = 0
+    cache.parse(first)
+    assert cache.info().currsize == 0
+
+    cache.clear()
+    assert cache.info() == (0, 0, 0, 0)
+
+
+def test_read_file_uses_file_cache(example_ini):
+    """Test that EasyConfig._read_file only parses a path once while it is unchanged."""
+    file_cache.clear()
+    ExampleConfig._read_file(example_ini)
+    ExampleConfig._read_file(str(example_ini))
+    assert file_cache.info().hits == 1
+    assert file_cache.info().misses == 1
+
+
+def test_read_file_formats(tmp_path, monkeypatch):
+    """Test reading JSON, TOML, and registered formats, chosen by extension or by the FORMAT class variable."""
+    result = {'number': 3, 'floaty_number': 5.0, 'flag': False, 'word': 'hello'}
+    json_path = tmp_path / 'config.json'
+    json_path.write_text('{"MyProgram": {"number": 3, "floaty_number": 5, "flag": "no", "word": "hello"}, "Other": 1}')
+    assert ExampleConfig._read_file(json_path) == result
+    assert ExampleConfig.load([json_path], _parse_environment=False) == ExampleConfig(**result)
+    assert ExampleConfig._read_file(tmp_path / 'missing.json') == {}
+    json_path.write_text('{"MyProgram": {"number": "apple"}}')
+    with pytest.raises(ConfigValueCoercionError) as excinfo:
+        ExampleConfig._read_file(json_path)
+    assert str(excinfo.value) == (
+        f"While reading the configuration file `{json_path}`, could not coerce value for field `number` to type "
+        "`<class 'int'>`"
+    )
+
+    class JSONConfig(ExampleConfig):
+        FORMAT = 'json'
+
+    assert JSONConfig._read_file(StringIO('{"MyProgram": {"number": "3"}}')) == {'number': 3}
+    with pytest.raises(ConfigValueCoercionError) as excinfo:
+        JSONConfig._read_file(StringIO('{"MyProgram": {"flag": "maybe"}}'))
+    assert str(excinfo.value) == (
+        "While reading the configuration file `<UNKNOWN>`, could not coerce value for field `flag` to type "
+        "`<class 'bool'>`"
+    )
+
+    if sys.version_info >= (3, 11):
+        toml_path = tmp_path / 'config.toml'
+        toml_path.write_text('[MyProgram]\nnumber = 3\nfloaty_number = 5.0\nflag = false\nword = "hello"')
+        assert ExampleConfig._read_file(toml_path) == result
+
+    class JSONMappingConfig(EasyConfig):
+        FILES = None
+        NAME = 'Mapped'
+        FORMAT = 'json'
+
+        limits: Dict[str, int]
+
+    assert JSONMappingConfig._read_file(StringIO('{"Mapped": {"limits": {"cpu": "4"}}}')) == {'limits': {'cpu': 4}}
+
+    # typed values are only converted when nothing is lost
+    assert JSONConfig._read_file(StringIO('{"MyProgram": {"floaty_number": 2}}')) == {'floaty_number': 2.0}
+    for document in '{"number": 1.9}', '{"word": [1, 2]}', '{"flag": 0.5}', '{"number": true}':
+        with pytest.raises(ConfigValueCoercionError):
+            JSONConfig._read_file(StringIO(f'{{"MyProgram": {document}}}'))
+
+    monkeypatch.setattr(easy_config, '_formats', dict(easy_config._formats))
+    monkeypatch.setattr(easy_config, '_extensions', dict(easy_config._extensions))
+    register_format(
+        'lines',
+        lambda text: {'MyProgram': dict(line.split('=') for line in text.split())},
+        extensions=['.LINES'],
+        typed=False,
+    )
+    lines_path = tmp_path / 'config.lines'
+    lines_path.write_text('number=3\nflag=off')
+    assert ExampleConfig._read_file(lines_path) == {'number': 3, 'flag': False}
+
+    class UnknownFormatConfig(ExampleConfig):
+        FORMAT = 'yaml'
+
+    with pytest.raises(ValueError):
+        UnknownFormatConfig._read_file(json_path)
+
+
 def test_read_environment(example_env):
     """Test EasyConfig._read_environment."""
     assert ExampleConfig._read_environment() == {'number': 4, 'flag': True}
 
 
+def test_environment_boolean(monkeypatch):
+    """Test that boolean environment variables accept the same spellings distutils.util.strtobool did."""
+    class FlagConfig(EasyConfig):
+        FILES = None
+        NAME = 'Flags'
+
+        flag: bool
+
+    for value in 'y', 'YES', 't', 'True', 'on', '1':
+        monkeypatch.setenv('FLAGS_FLAG', value)
+        assert FlagConfig.load().flag is True
+    for value in 'n', 'No', 'f', 'FALSE', 'off', '0':
+        monkeypatch.setenv('FLAGS_FLAG', value)
+        assert FlagConfig.load().flag is False
+    monkeypatch.setenv('FLAGS_FLAG', 'maybe')
+    with pytest.raises(ConfigValueCoercionError):
+        FlagConfig.load()
+
+
 def test_load_from_env(example_config_env):
     """Test EasyConfig.load with _lookup_config_envvar."""
     assert (
@@ -127,6 +276,42 @@ def test_bad_reads(bad_typed_ini, bad_typed_env):
         ExampleConfig._read_dict({'number': 'apple'})
 
 
+def test_bad_read_messages(bad_typed_ini, bad_typed_env):
+    """Test that coercion errors name the source and the field that could not be read."""
+    with pytest.raises(ConfigValueCoercionError) as excinfo:
+        ExampleConfig._read_file(bad_typed_ini)
+    assert str(excinfo.value) == (
+        f"While reading the configuration file `{bad_typed_ini}`, could not coerce value for field `number` to type "
+        "`<class 'int'>`"
+    )
+
+    with pytest.raises(ConfigValueCoercionError) as excinfo:
+        ExampleConfig._read_file(StringIO('[MyProgram]\nflag = maybe'))
+    assert str(excinfo.value) == (
+        "While reading the configuration file `<UNKNOWN>`, could not coerce value for field `flag` to type "
+        "`<class 'bool'>`"
+    )
+
+    with pytest.raises(ConfigValueCoercionError) as excinfo:
+        ExampleConfig._read_environment()
+    assert str(excinfo.value) == (
+        "While reading environment variable `MYPROGRAM_NUMBER`, could not coerce value for field `number` to type "
+        "`<class 'int'>`"
+    )
+
+
+def test_readers_follow_subclass_name(monkeypatch):
+    """Test that a subclass overriding only NAME reads from its own section and environment variables."""
+    class RenamedConfig(ExampleConfig):
+        NAME = 'Renamed'
+
+    monkeypatch.setenv('MYPROGRAM_NUMBER', '1')
+    monkeypatch.setenv('RENAMED_NUMBER', '2')
+    assert ExampleConfig._read_environment() == {'number': 1}
+    assert RenamedConfig._read_environment() == {'number': 2}
+    assert RenamedConfig._read_file(StringIO('[MyProgram]\nword = a\n[Renamed]\nword = b')) == {'word': 'b'}
+
+
 def test_load(example_ini, example_env):
     """Test EasyConfig.load."""
     a = ExampleConfig.load([example_ini], _parse_environment=False)
@@ -158,6 +343,36 @@ def test_load(example_ini, example_env):
     assert str(excinfo.value) == 'missing some configuration values'
 
 
+def test_load_with_executor(example_ini, bad_typed_ini, example_env):
+    """Test that reading files in an executor keeps the precedence of reading them one after another."""
+    class ExampleWithFiles(ExampleConfig):
+        FILES = [StringIO('[MyProgram]\nword = lowest\nfloaty_number = 1'), example_ini]
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        a = ExampleWithFiles.load([StringIO('[MyProgram]\nword = highest')], _executor=executor)
+        assert a == ExampleWithFiles(number=4, floaty_number=5.0, flag=True, word='highest')
+
+        with pytest.raises(ConfigValueCoercionError):
+            ExampleConfig.load([bad_typed_ini], _executor=executor)
+
+
+def test_resolve(example_ini, example_env):
+    """Test that EasyConfig.resolve skips the sources that cannot change the result."""
+    class ExampleWithFiles(ExampleConfig):
+        FILES = [example_ini]
+
+    a, skipped = ExampleWithFiles.resolve([StringIO()], floaty_number=1.0, word='kwarg')
+    assert a == ExampleWithFiles(number=4, floaty_number=1.0, flag=True, word='kwarg')
+    assert skipped == ['<UNKNOWN>', str(example_ini)]
+
+    b, skipped = ExampleWithFiles.resolve(floaty_number=1.0)
+    assert b == ExampleWithFiles.load(floaty_number=1.0)
+    assert skipped == []
+
+    with pytest.raises(TypeError):
+        ExampleConfig.resolve(_parse_environment=False)
+
+
 def test_load_with_default_files(example_ini):
     """Test EasyConfig.load when the class FILES variable is populated."""
     class ExampleWithFiles(ExampleConfig):
@@ -181,6 +396,256 @@ def test_load_raises_plain_type_error():
     assert str(excinfo.value) == 'testing type error'
 
 
+def test_load_many(tmp_path, example_env):
+    """Test that load_many loads each class like EasyConfig.load does while parsing each file only once."""
+    class OtherConfig(EasyConfig):
+        FILES = None
+        NAME = 'Other'
+
+        number: int
+        word: str = 'default'
+
+    shared_ini = tmp_path / 'shared.ini'
+    shared_ini.write_text('[MyProgram]\nnumber = 3\nfloaty_number = 5\nflag = False\nword = hello\n[Other]\nnumber = 9')
+    extra = '[MyProgram]\nword = extra\n[Other]\nword = extra'
+
+    file_cache.clear()
+    example, other = load_many([ExampleConfig, OtherConfig], [StringIO(extra), shared_ini])
+    assert file_cache.info().misses == 1
+    assert file_cache.info().hits == 0
+
+    assert example == ExampleConfig(number=4, floaty_number=5.0, flag=True, word='extra')
+    assert other == OtherConfig(number=9, word='extra'), 'the open file should have been shared between the classes'
+    assert example == ExampleConfig.load([StringIO(extra), shared_ini])
+
+    with pytest.raises(TypeError) as excinfo:
+        load_many([ExampleConfig, OtherConfig], _parse_environment=False)
+    assert str(excinfo.value) == 'missing some configuration values'
+
+
+def test_from_rows_and_columns():
+    """Test that from_rows and from_columns create the same instances as loading each row."""
+    rows = [
+        {'number': '1', 'floaty_number': 1.5, 'flag': True, 'word': 'one', 'unused': 'ignored'},
+        {'number': 2, 'floaty_number': '2.5', 'flag': False, 'word': 'two'},
+    ]
+    expected = [ExampleConfig.load(_parse_files=False, _parse_environment=False, **row) for row in rows]
+    assert list(ExampleConfig.from_rows(rows)) == expected
+
+    columns = {'number': ['1', 2], 'floaty_number': [1.5, '2.5'], 'flag': [True, False], 'word': ['one', 'two']}
+    assert ExampleConfig.from_columns(dict(columns, unused=['x', 'y'])) == expected
+    assert ExampleConfig.from_columns({}) == []
+
+    with pytest.raises(ConfigValueCoercionError) as excinfo:
+        list(ExampleConfig.from_rows([{'number': 'apple', 'floaty_number': 1, 'flag': True, 'word': 'w'}]))
+    assert excinfo.value.field == 'number'
+    with pytest.raises(ConfigValueCoercionError) as excinfo:
+        ExampleConfig.from_columns(dict(columns, number=[1, 'apple']))
+    assert excinfo.value.field == 'number'
+    with pytest.raises(TypeError) as excinfo:
+        ExampleConfig.from_columns({'number': [1], 'flag': [True]})
+    assert str(excinfo.value) == 'missing some configuration values'
+    with pytest.raises(ValueError):
+        ExampleConfig.from_columns(dict(columns, floaty_number=[1.0]))
+
+
+def test_mapping_fields(monkeypatch):
+    """Test that Dict[str, T] fields gather every value whose name starts with the field name."""
+    class MappingConfig(EasyConfig):
+        FILES = None
+        NAME = 'Mapped'
+
+        limits: Dict[str, int]
+        flags: Dict[str, bool] = dataclasses.field(default_factory=dict)
+
+    monkeypatch.setenv('MAPPED_LIMITS_CPU', '2')
+    monkeypatch.setenv('MAPPED_LIMITS_MEMORY', '512')
+    monkeypatch.setenv('MAPPED_FLAGS_DEBUG', 'yes')
+    monkeypatch.setenv('MAPPED_LIMITS_', 'ignored')
+    # keys are lowercased, the same as those of INI files
+    assert MappingConfig._read_environment() == {'limits': {'cpu': 2, 'memory': 512}, 'flags': {'debug': True}}
+
+    ini = StringIO('[Mapped]\nlimits_cpu = 4\nlimits_disk = 10\nflags_debug = off')
+    assert MappingConfig._read_file(ini) == {'limits': {'cpu': 4, 'disk': 10}, 'flags': {'debug': False}}
+
+    config = load_many([MappingConfig], _parse_environment=True)[0]
+    assert config == MappingConfig.load() == MappingConfig(limits={'cpu': 2, 'memory': 512}, flags={'debug': True})
+    assert MappingConfig.load(limits={'cpu': '1'}).limits == {'cpu': 1}
+    assert MappingConfig.load_lazy(_parse_environment=True).limits == {'cpu': 2, 'memory': 512}
+
+    output = StringIO()
+    config.dump(output)
+    assert 'limits_cpu = 2\n' in output.getvalue().splitlines(keepends=True)
+    output.seek(0)
+    assert MappingConfig.load([output], _parse_environment=False) == config
+
+    monkeypatch.setenv('MAPPED_LIMITS_CPU', 'many')
+    with pytest.raises(ConfigValueCoercionError) as excinfo:
+        MappingConfig.load()
+    assert 'environment variables `MAPPED_LIMITS_*`' in str(excinfo.value)
+
+
+def test_nested_fields(tmp_path, monkeypatch):
+    """Test that fields whose types are configuration classes are read from dotted sections and nested prefixes."""
+    class DatabaseConfig(EasyConfig):
+        FILES = None
+        NAME = 'Database'
+
+        host: str
+        port: int = 5432
+        options: Dict[str, str] = dataclasses.field(default_factory=dict)
+
+    class ReplicaConfig(EasyConfig):
+        FILES = None
+        NAME = 'Replica'
+
+        db: DatabaseConfig
+        lag: float = 0.0
+
+    class AppConfig(EasyConfig):
+        FILES = None
+        NAME = 'App'
+
+        name: str
+        db: DatabaseConfig
+        replica: ReplicaConfig
+
+    assert AppConfig.__easy_config_plan__.sections == ('App', 'App.db', 'App.replica', 'App.replica.db')
+    ini_path = tmp_path / 'app.ini'
+    ini_path.write_text('[App]\nname = app\n[App.db]\nhost = primary\noptions_ssl = on\n[App.replica.db]\nhost = copy')
+    assert AppConfig._read_file(ini_path) == {
+        'name': 'app',
+        'db': {'host': 'primary', 'options': {'ssl': 'on'}},
+        'replica': {'db': {'host': 'copy'}},
+    }
+
+    monkeypatch.setenv('APP_DB_PORT', '6432')
+    monkeypatch.setenv('APP_REPLICA_LAG', '1.5')
+    assert AppConfig._read_environment() == {'db': {'port': 6432}, 'replica': {'lag': 1.5}}
+    expected = AppConfig(
+        name='app',
+        db=DatabaseConfig(host='primary', port=6432, options={'ssl': 'on'}),
+        replica=ReplicaConfig(db=DatabaseConfig(host='copy'), lag=1.5),
+    )
+    assert AppConfig.load([ini_path]) == expected
+    assert AppConfig.load_lazy([ini_path]).db == expected.db
+    assert AppConfig.load_lazy([ini_path]).resolve() == expected
+    assert AppConfig.resolve([ini_path]) == (expected, [])
+    assert load_many([AppConfig], [ini_path]) == [expected]
+
+    # keyword arguments can give some of the values of a nested class, or a whole instance
+    assert AppConfig.load([ini_path], db={'host': 'other'}).db == DatabaseConfig(
+        host='other', port=6432, options={'ssl': 'on'}
+    )
+    assert AppConfig.load([ini_path], db=DatabaseConfig(host='given')).db == DatabaseConfig(
+        host='given', port=5432, options={}
+    )
+    with pytest.raises(ConfigValueCoercionError) as excinfo:
+        AppConfig.load([ini_path], db='primary')
+    assert excinfo.value.field == 'db'
+
+    output = StringIO()
+    expected.dump(output)
+    assert AppConfig.load([StringIO(output.getvalue())], _parse_environment=False) == expected
+
+    json_path = tmp_path / 'app.json'
+    json_path.write_text('{"App": {"name": "app", "db": {"host": "primary", "port": "1"}}}')
+    assert AppConfig._read_file(json_path) == {'name': 'app', 'db': {'host': 'primary', 'port': 1}}
+    assert AppConfig.load([json_path, ini_path]).db.port == 6432
+
+    monkeypatch.delenv('APP_DB_PORT')
+    with pytest.raises(TypeError, match='missing some configuration values'):
+        AppConfig.load(name='app', db={'port': 1})
+
+
+class SlottedConfig(EasyConfig):
+    """Example slotted and frozen EasyConfig subclass to test with."""
+
+    FILES = None
+    NAME = 'MyProgram'
+    SLOTS = True
+    FROZEN = True
+
+    number: int
+    word: str = 'default'
+
+    @classmethod
+    def _read_dict(cls, d):
+        """Check that super() still works after the class is rebuilt with slots."""
+        return super()._read_dict(d)
+
+
+def test_slots(example_ini):
+    """Test that SLOTS and FROZEN create compact, immutable instances that still load, dump, and pickle."""
+    config = SlottedConfig.load([example_ini], _parse_environment=False, word='kwarg')
+    assert config == SlottedConfig(number=3, word='kwarg')
+    assert not hasattr(config, '__dict__')
+    assert SlottedConfig.__slots__ == ('number', 'word', '__weakref__')
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        config.number = 4
+
+    assert pickle.loads(pickle.dumps(config)) == config
+    assert weakref.ref(config)() is config
+    output = StringIO()
+    config.dump(output)
+    assert 'word = kwarg\n' in output.getvalue()
+
+    class SlottedSubclass(SlottedConfig):
+        FILES = None
+        NAME = 'MyProgram'
+
+        flag: bool = False
+
+    assert SlottedSubclass.__slots__ == ('flag',)
+    assert not hasattr(SlottedSubclass.load(number=1, flag='true'), '__dict__')
+    assert SlottedSubclass.load(number=1, flag='true').flag is True
+    assert hasattr(ExampleConfig.load(number=1, floaty_number=1, flag=True, word='a'), '__dict__')
+
+
+def test_memoize(monkeypatch):
+    """Test that MEMOIZE coerces equal raw values once and shares the result, except for mutable types."""
+    coerced = []
+
+    class Region(str):
+        def __new__(cls, value):
+            coerced.append(value)
+            return super().__new__(cls, value)
+
+    class TenantConfig(EasyConfig):
+        FILES = None
+        NAME = 'Tenant'
+        MEMOIZE = True
+
+        region: Region
+        ports: list = dataclasses.field(default_factory=list)
+        quota: int = 1
+
+    coercion_memo.clear()
+    ini = '[Tenant]\nregion = us-east-1\nports = 12'
+    a = TenantConfig.load([StringIO(ini)], _parse_environment=False)
+    b = TenantConfig.load([StringIO(ini)], _parse_environment=False)
+    assert a == b == TenantConfig(region=Region('us-east-1'), ports=['1', '2'])
+    assert a.region is b.region
+    assert a.ports is not b.ports
+    assert coerced == ['us-east-1', 'us-east-1']  # once for the memo, once for the expected value above
+    assert coercion_memo.info() == CacheInfo(hits=1, misses=1, maxsize=4096, currsize=1)
+
+    # raw values of different types are remembered separately, and values that cannot be coerced are not remembered
+    rows = [{'region': 'eu-west-1', 'quota': '5'}, {'region': 'eu-west-1', 'quota': 5}, {'region': 'eu-west-1'}]
+    c, d, e = TenantConfig.from_rows(rows)
+    assert c.region is d.region is e.region
+    assert (c.quota, d.quota) == (5, 5)
+    with pytest.raises(ConfigValueCoercionError):
+        TenantConfig.load(_parse_files=False, _parse_environment=False, region='a', quota='many')
+    assert coercion_memo.info().currsize == 5
+
+    monkeypatch.setattr(coercion_memo, 'maxsize', 2)
+    list(TenantConfig.from_rows({'region': str(i)} for i in range(10)))
+    assert coercion_memo.info() == CacheInfo(hits=0, misses=10, maxsize=2, currsize=2)
+    monkeypatch.undo()
+    assert coercion_memo.info().maxsize == 4096
+
+
 def test_dump():
     """Test EasyConfig.dump to a file."""
     a = ExampleConfig.load(number=3, floaty_number=5.0, flag=False, word='hello')
@@ -192,3 +657,39 @@ def test_dump():
     assert 'floaty_number = 5.0\n' in output_lines
     assert 'flag = False\n' in output_lines
     assert 'word = hello\n' in output_lines
+
+
+def test_aload(example_ini, example_env):
+    """Test that EasyConfig.aload gives the same results as EasyConfig.load."""
+    loop = asyncio.new_event_loop()
+    try:
+        a = loop.run_until_complete(ExampleConfig.aload([StringIO('[MyProgram]\nword = first'), example_ini]))
+        assert a == ExampleConfig.load([StringIO('[MyProgram]\nword = first'), example_ini])
+        assert a == ExampleConfig(number=4, floaty_number=5.0, flag=True, word='first')
+
+        b = loop.run_until_complete(ExampleConfig.aload([example_ini], _parse_environment=False, number=10))
+        assert b == ExampleConfig(number=10, floaty_number=5.0, flag=False, word='hello')
+
+        with pytest.raises(TypeError):
+            loop.run_until_complete(ExampleConfig.aload(_parse_environment=False))
+    finally:
+        loop.close()
+
+
+def test_aload_timeout(example_ini):
+    """Test that EasyConfig.aload gives up on files that take too long to read."""
+    release = threading.Event()
+
+    class SlowFileConfig(ExampleConfig):
+        @classmethod
+        def _read_file(cls, config_file):
+            release.wait(5)
+            return super()._read_file(config_file)
+
+    loop = asyncio.new_event_loop()
+    try:
+        with pytest.raises(asyncio.TimeoutError):
+            loop.run_until_complete(SlowFileConfig.aload([example_ini], _timeout=0.01))
+    finally:
+        release.set()
+        loop.close()
@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+
+"""Tests that importing easy_config stays fast enough for short-lived programs.
+
+The import time is checked against that of the imports every interpreter does at startup, measured on the same machine
+with ``python -X importtime``, so that the check does not depend on how fast the machine is. The time itself is
+recorded by ``benchmarks/test_import.py``.
+"""
+
+import logging
+import subprocess
+import sys
+from typing import Dict, Set
+
+import easy_config
+
+#: modules that must only be imported when they are used, not by ``import easy_config``
+DEFERRED_MODULES = ['distutils', 'configparser', 'logging', 'asyncio', 'concurrent.futures']
+
+#: how many times as long as the imports of interpreter startup ``import easy_config`` may take; it takes about 5 times
+#: as long, and took over 20 times as long when it imported distutils, configparser, and logging up front
+IMPORT_TIME_RATIO = 10
+
+
+def import_times(code: str) -> Dict[str, int]:
+    """Run code in a fresh interpreter and get the cumulative time of each top-level import in microseconds."""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package, indented once more for each level of nesting
+        if line.startswith('import time:') and 'imported package' not in line:
+            _self, cumulative, name = line[len('import time:'):].split('|')
+            if not name.startswith('  '):
+                times[name.strip()] = int(cumulative)
+    return times
+
+
+def imported_modules(module: str) -> Set[str]:
+    """Import module in a fresh interpreter and get the names of all modules that are imported then."""
+    result = subprocess.run(
+        [sys.executable, '-c', f'import sys; import {module}; print("\\n".join(sys.modules))'],
+        stdout=subprocess.PIPE,
+        universal_newlines=True,
+        check=True,
+    )
+    return set(result.stdout.splitlines())
+
+
+def test_deferred_imports():
+    """Test that importing easy_config does not import the modules it only needs for some features."""
+    modules = imported_modules('easy_config')
+    assert 'easy_config' in modules
+    for module in DEFERRED_MODULES:
+        assert module not in modules, f'`import easy_config` should not import {module}'
+
+
+def test_logger():
+    """Test that the logger of the module is still available, created when it is first used."""
+    assert easy_config.logger is logging.getLogger('easy_config')
+
+
+def test_import_time():
+    """Test that importing easy_config takes no more than a few times as long as starting the interpreter does."""
+    # the fastest of a few runs, since a busy machine can only make an import slower
+    startup = min(sum(import_times('pass').values()) for _ in range(3))
+    import_time = min(import_times('import easy_config')['easy_config'] for _ in range(3))
+    assert import_time < IMPORT_TIME_RATIO * startup, f'`import easy_config` took {import_time} microseconds'
@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+
+"""Conformance tests for reading single sections of INI files without :mod:`configparser`."""
+
+import configparser
+from io import StringIO
+
+import pytest
+
+from easy_config import ConfigSource, EasyConfig, ParsedFileCache, _IniSectionScanner, _parse_ini_sections
+
+CASES = {
+    'simple': '[Target]\nnumber = 3\nword = hello\n[Other]\nnumber = 4',
+    'delimiters': '[Target]\ncolon: 1\nspaced   =   2  \nempty =\nequals = a = b\ncolon_first : x = y',
+    'case': '[target]\nnumber = 1\n[Target]\nNumber = 2\nWORD = Hello',
+    'comments': '# leading\n[Target]\n; semicolon\n  # indented\nword = hello # not a comment\nnumber = 1 ; nor this',
+    'multiline': '[Target]\nlines = first\n  second\n\n    third\n\n\nnext = value\n[Other]\na = b',
+    'blank continuation': '[Target]\nword =\n  continued\n\nnext=1',
+    'comment in value': '[Target]\nlines = first\n# comment\n  second',
+    'defaults before': '[DEFAULT]\nword = default\nextra = 1\n[Target]\nnumber = 3\nword = own',
+    'defaults after': '[Target]\nnumber = 3\n[Other]\na = b\n[DEFAULT]\nword = late',
+    'defaults split': '[DEFAULT]\na = 1\n[Target]\nnumber = 3\n[DEFAULT]\nb = 2',
+    'indented header continues': '[Other]\nvalue = 1\n  [Target]\n[Target]\nnumber = 2',
+    'indented header after header': '[Other]\n  [Target]\nnumber = 2',
+    'indented header after comment': '[Other]\nvalue = 1\n# comment\n  [Target]\nnumber = 2',
+    'skipped continuation': '[Other]\nvalue = 1\n  more\n[Target]\nnumber = 2\n  and more',
+    'target last': '[Other]\na = b\n[Target]\nnumber = 3\n\n\n',
+    'missing': '[Other]\nnumber = 3',
+    'empty': '',
+    'interpolation': '[DEFAULT]\nbase = /srv\n[Target]\npath = %(base)s/app\npercent = 100%%',
+    'brackets in value': '[Target]\nlist = [1, 2]\n[Other]\nx = ]',
+    'crlf': '[Target]\r\nnumber = 3\r\nlines = a\r\n  b\r\n',
+    'tabs': '[Target]\nlines = a\n\tb\n\t\tc',
+}
+
+ERRORS = {
+    'duplicate option': ('[Target]\nnumber = 1\nNUMBER = 2', configparser.DuplicateOptionError),
+    'duplicate section': ('[Other]\n[Other]\n[Target]\nnumber = 1', configparser.DuplicateSectionError),
+    'missing header': ('number = 1\n[Target]', configparser.MissingSectionHeaderError),
+    'bad line': ('[Target]\nnot an option', configparser.ParsingError),
+    'empty option name': ('[Target]\n= value', configparser.ParsingError),
+    'bad interpolation': ('[Target]\nvalue = %(missing)s', configparser.InterpolationMissingOptionError),
+}
+
+
+def expected_section(text, section='Target'):
+    """Read a section with ConfigParser."""
+    config = configparser.ConfigParser()
+    config.read_string(text)
+    return list(config[section].items()) if config.has_section(section) else None
+
+
+def as_items(section):
+    """Get the options of a section in order, or None."""
+    return None if section is None else list(section.items())
+
+
+@pytest.mark.parametrize('text', CASES.values(), ids=list(CASES))
+def test_open_file(text):
+    """Test reading a section of an open file, which is scanned to the end."""
+    sections, description = _parse_ini_sections(StringIO(text), ['Target', 'Other'])
+    assert as_items(sections['Target']) == expected_section(text)
+    assert as_items(sections['Other']) == expected_section(text, 'Other')
+    assert description == '<UNKNOWN>'
+
+
+@pytest.mark.parametrize('text', CASES.values(), ids=list(CASES))
+def test_path(text, tmp_path):
+    """Test reading a section of a file by path, which stops at the end of the section when it can."""
+    path = tmp_path / 'case.ini'
+    path.write_bytes(text.encode())
+    cache = ParsedFileCache()
+    assert as_items(cache.parse_section(path, 'Target')) == expected_section(text)
+    assert as_items(cache.parse_section(path, 'Target')) == expected_section(text)
+    assert as_items(cache.parse_section(path, 'Other')) == expected_section(text, 'Other')
+    assert cache.parse_section(path, 'DEFAULT') is None
+
+
+@pytest.mark.parametrize(('text', 'error'), ERRORS.values(), ids=list(ERRORS))
+def test_errors(text, error, tmp_path):
+    """Test that files with errors in the section raise the same errors as ConfigParser."""
+    with pytest.raises(error):
+        expected_section(text)
+    with pytest.raises(error):
+        as_items(_parse_ini_sections(StringIO(text), ['Target'])[0]['Target'])
+    path = tmp_path / 'error.ini'
+    path.write_text(text)
+    with pytest.raises(error):
+        as_items(ParsedFileCache().parse_section(path, 'Target'))
+
+
+def test_stops_early():
+    """Test that scanning stops at the end of the section when no defaults follow, ignoring any errors after it."""
+    read = []
+
+    def lines():
+        for line in ['[Target]', 'number = 3', '[Other]', 'not an option']:
+            read.append(line)
+            yield line
+
+    assert _IniSectionScanner(['Target']).scan(lines(), -1) == {'Target': {'number': '3'}}
+    assert read == ['[Target]', 'number = 3', '[Other]']
+
+
+def test_several_sections(tmp_path):
+    """Test reading several sections in one pass, which stops once every section has been read."""
+    text = '[a]\nx = 1\n[a.b]\ny = 2\n[c]\nz = 3\n[a.b.c]\nw = 4\n[d]\nnot an option'
+    expected = {'a': {'x': '1'}, 'a.b': {'y': '2'}, 'a.b.c': {'w': '4'}, 'missing': None}
+    assert _IniSectionScanner(['a', 'a.b', 'a.b.c']).scan(text.split('\n'), -1) == {
+        name: value for name, value in expected.items() if name != 'missing'
+    }
+    path = tmp_path / 'nested.ini'
+    path.write_text(text)
+    cache = ParsedFileCache()
+    assert cache.parse_sections(path, ['a', 'a.b', 'a.b.c', 'missing']) == expected
+    assert cache.parse_sections(path, ['a.b', 'a']) == {'a.b': {'y': '2'}, 'a': {'x': '1'}}
+    assert cache.info() == (1, 1, 128, 1)
+
+
+def test_mixed_case_fields(tmp_path):
+    """Test that fields with upper case letters read the lowercased options, however the file is parsed."""
+    class StaticSource(ConfigSource):
+        typed = False
+
+        def fetch(self, config_class):
+            return {'maxConn': '9'}
+
+    class MixedCaseConfig(EasyConfig):
+        FILES = None
+        NAME = 'r'
+
+        maxConn: int = 1  # noqa: N815
+
+    assert MixedCaseConfig._read_file(StringIO('[r]\nmaxConn = 7')) == {'maxConn': 7}
+    scanned = tmp_path / 'scanned.ini'
+    scanned.write_text('[r]\nMAXCONN = 5')
+    parsed = tmp_path / 'parsed.ini'
+    parsed.write_text('[DEFAULT]\nbase = 6\n[r]\nmaxconn = %(base)s')  # interpolation needs ConfigParser
+    for path, expected in (scanned, 5), (parsed, 6):
+        assert MixedCaseConfig.load([path], _parse_environment=False).maxConn == expected
+        assert MixedCaseConfig.load_lazy([path], _parse_environment=False).maxConn == expected
+
+    class SourcedConfig(MixedCaseConfig):
+        SOURCES = [StaticSource()]
+
+    assert SourcedConfig.load(_parse_environment=False).maxConn == 9  # other sources keep their case
+
+
+def test_cache(tmp_path):
+    """Test that sections are cached with the file, and that whole parses answer for any section."""
+    path = tmp_path / 'cached.ini'
+    path.write_text('[Target]\nnumber = 3\n[Other]\nnumber = 4')
+    cache = ParsedFileCache()
+    assert cache.parse_section(path, 'Target') == {'number': '3'}
+    assert cache.parse_section(path, 'Target') == {'number': '3'}
+    assert cache.info() == (1, 1, 128, 1)
+    assert cache.parse_section(path, 'Other') == {'number': '4'}
+    assert cache.info() == (1, 2, 128, 1)
+
+    cache.parse(path)
+    assert dict(cache.parse_section(path, 'Nothing') or {}) == {}
+    assert cache.info() == (2, 3, 128, 1)
+
+    path.write_text('[Target]\nnumber = 30')
+    assert cache.parse_section(path, 'Target') == {'number': '30'}
+    assert cache.parse_section(tmp_path / 'missing.ini', 'Target') is None
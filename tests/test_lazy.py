@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+
+"""Tests for lazily loaded configurations."""
+
+from io import StringIO
+
+import pytest
+
+from easy_config import ConfigValueCoercionError, EasyConfig
+
+
+class Counted(str):
+    """A string type that counts how many times it has been created."""
+
+    created = 0
+
+    def __new__(cls, value):
+        """Count the new instance."""
+        cls.created += 1
+        return super().__new__(cls, value)
+
+
+class LazyExampleConfig(EasyConfig):
+    """Example EasyConfig subclass to test with."""
+
+    FILES = None
+    NAME = 'MyProgram'
+
+    number: int
+    word: Counted
+    flag: bool = False
+
+
+def test_lazy_values(example_env):
+    """Test that values are only read and coerced when accessed, and only once."""
+    Counted.created = 0
+    extra = StringIO('[MyProgram]\nword = from file')
+    lazy = LazyExampleConfig.load_lazy([extra])
+    assert lazy.number == 4
+    assert lazy.flag is True
+    assert extra.tell() == 0, 'the file should not be read while the environment has the values'
+    assert lazy.NAME == 'MyProgram'
+
+    assert Counted.created == 0
+    assert lazy.word == 'from file'
+    assert lazy.word == 'from file'
+    assert Counted.created == 1
+
+    assert lazy.resolve() == LazyExampleConfig(number=4, word=Counted('from file'), flag=True)
+
+
+def test_lazy_defaults_and_missing():
+    """Test that defaults apply and that missing values can be reported eagerly."""
+    lazy = LazyExampleConfig.load_lazy(_parse_environment=False, word='kwarg')
+    assert lazy.flag is False
+    with pytest.raises(TypeError) as excinfo:
+        lazy.validate()
+    assert str(excinfo.value) == 'missing some configuration values: number'
+    with pytest.raises(TypeError):
+        lazy.number
+
+    LazyExampleConfig.load_lazy(_parse_environment=False, word='kwarg', number='1').validate()
+
+
+def test_lazy_coercion_error():
+    """Test that coercion errors are raised when the bad value is accessed."""
+    lazy = LazyExampleConfig.load_lazy([StringIO('[MyProgram]\nnumber = apple')], _parse_environment=False)
+    with pytest.raises(ConfigValueCoercionError) as excinfo:
+        lazy.number
+    assert str(excinfo.value).startswith('While reading the configuration file `<UNKNOWN>`')
@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+
+"""Tests for reporting metrics with :mod:`easy_config.metrics`."""
+
+import pytest
+
+import easy_config
+from easy_config import ConfigValueCoercionError, EasyConfig, ParsedFileCache
+from easy_config.metrics import InMemoryMetricsSink, MetricsSink, render_prometheus, set_metrics_sink
+from easy_config.watch import ConfigWatcher
+
+
+class MeasuredConfig(EasyConfig):
+    """Example EasyConfig subclass to test with."""
+
+    FILES = None
+    NAME = 'MyProgram'
+
+    number: int
+    word: str = 'default'
+
+
+@pytest.fixture
+def sink():
+    """Report metrics to a new in-memory sink during the test."""
+    sink = InMemoryMetricsSink(buckets=[0.5, 1.0])
+    previous = set_metrics_sink(sink)
+    yield sink
+    set_metrics_sink(previous)
+
+
+def test_disabled_by_default():
+    """Test that nothing is measured until a sink is set."""
+    assert easy_config._metrics_sink is None
+    assert set_metrics_sink(None) is None
+
+
+def test_load_metrics(sink, tmp_path):
+    """Test that loading reports loads, source latencies, cache lookups, and coercion errors."""
+    path = tmp_path / 'measured.ini'
+    path.write_text('[MyProgram]\nnumber = 1')
+    easy_config.file_cache.clear()
+
+    MeasuredConfig.load([path], _parse_environment=False)
+    MeasuredConfig.load([path], _parse_environment=False)
+    assert sink.counter('easy_config_loads_total', config='MeasuredConfig') == 2
+    assert sink.histogram('easy_config_source_seconds', config='MeasuredConfig', kind='file').observations == 2
+    assert sink.histogram('easy_config_source_seconds', config='MeasuredConfig', kind='kwargs').observations == 2
+    assert sink.counter('easy_config_file_cache_misses_total') == 1
+    assert sink.counter('easy_config_file_cache_hits_total') == 1
+
+    path.write_text('[MyProgram]\nnumber = apple')
+    with pytest.raises(ConfigValueCoercionError) as excinfo:
+        MeasuredConfig.load([path], _parse_environment=False)
+    assert excinfo.value.field == 'number'
+    labels = {'config': 'MeasuredConfig', 'kind': 'file', 'field': 'number'}
+    assert sink.counter('easy_config_coercion_errors_total', **labels) == 1
+
+
+def test_load_count(sink, monkeypatch):
+    """Test that only loads are counted, not instances created from rows or of nested configuration classes."""
+    class OuterConfig(EasyConfig):
+        FILES = None
+        NAME = 'Outer'
+
+        inner: MeasuredConfig
+
+    list(MeasuredConfig.from_rows([{'number': 1}, {'number': 2}]))
+    MeasuredConfig.from_columns({'number': [1, 2]})
+    assert sink.counter('easy_config_loads_total', config='MeasuredConfig') == 0
+
+    OuterConfig.load(_parse_environment=False, inner={'number': 1})
+    MeasuredConfig.resolve(_parse_environment=False, number=1)
+    monkeypatch.setenv('MYPROGRAM_NUMBER', '1')
+    easy_config.load_many([MeasuredConfig])
+    assert sink.counter('easy_config_loads_total', config=OuterConfig.__qualname__) == 1
+    assert sink.counter('easy_config_loads_total', config='MeasuredConfig') == 2
+
+
+def test_reload_metrics(sink, tmp_path):
+    """Test that ConfigWatcher reports reload durations and failures."""
+    path = tmp_path / 'watched.ini'
+    path.write_text('[MyProgram]\nnumber = 1')
+    watcher = ConfigWatcher(MeasuredConfig, [path], _parse_environment=False)
+
+    path.write_text('[MyProgram]\nnumber = 22')
+    assert watcher.check()
+    path.write_text('[MyProgram]\nnumber = apple')
+    assert not watcher.check()
+    assert sink.histogram('easy_config_reload_seconds', config='MeasuredConfig').observations == 2
+    assert sink.counter('easy_config_reload_failures_total', config='MeasuredConfig') == 1
+
+
+def test_custom_sink(tmp_path):
+    """Test that a MetricsSink subclass receives metrics from a custom cache."""
+    class RecordingSink(MetricsSink):
+        def __init__(self):
+            self.names = []
+
+        def increment(self, name, labels, value=1.0):
+            self.names.append(name)
+
+    recording = RecordingSink()
+    previous = set_metrics_sink(recording)
+    try:
+        path = tmp_path / 'cached.ini'
+        path.write_text('[MyProgram]\nnumber = 1')
+        cache = ParsedFileCache()
+        cache.parse(path)
+        cache.parse(path)
+    finally:
+        set_metrics_sink(previous)
+    assert recording.names == ['easy_config_file_cache_misses_total', 'easy_config_file_cache_hits_total']
+
+
+def test_render_prometheus():
+    """Test rendering in the Prometheus text exposition format."""
+    sink = InMemoryMetricsSink(buckets=[0.5, 1.0])
+    assert render_prometheus(sink) == ''
+
+    sink.increment('easy_config_loads_total', {'config': 'A "quoted" name'})
+    sink.observe('easy_config_source_seconds', {'config': 'A', 'kind': 'file'}, 0.25)
+    sink.observe('easy_config_source_seconds', {'config': 'A', 'kind': 'file'}, 2.0)
+    assert render_prometheus(sink).splitlines() == [
+        '# HELP easy_config_loads_total Configuration loads.',
+        '# TYPE easy_config_loads_total counter',
+        'easy_config_loads_total{config="A \\"quoted\\" name"} 1',
+        '# HELP easy_config_source_seconds Time taken to read a configuration source.',
+        '# TYPE easy_config_source_seconds histogram',
+        'easy_config_source_seconds_bucket{config="A",kind="file",le="0.5"} 1',
+        'easy_config_source_seconds_bucket{config="A",kind="file",le="1"} 1',
+        'easy_config_source_seconds_bucket{config="A",kind="file",le="+Inf"} 2',
+        'easy_config_source_seconds_sum{config="A",kind="file"} 2.25',
+        'easy_config_source_seconds_count{config="A",kind="file"} 2',
+    ]
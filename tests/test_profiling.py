@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+
+"""Tests for profiling configuration loading."""
+
+import json
+import sys
+from io import StringIO
+
+import pytest
+
+from easy_config import EasyConfig
+from easy_config.__main__ import main
+from easy_config.profiling import import_class, profile_load
+
+
+class ProfiledConfig(EasyConfig):
+    """Example EasyConfig subclass to test with."""
+
+    FILES = None
+    NAME = 'MyProgram'
+
+    number: int
+    floaty_number: float
+    flag: bool
+    word: str = 'default'
+
+
+def test_profile_load(example_ini, example_env):
+    """Test that profile_load loads like EasyConfig.load and reports each source and the source of each value."""
+    profile = profile_load(ProfiledConfig, [example_ini], word='kwarg')
+    assert profile.config == ProfiledConfig.load([example_ini], word='kwarg')
+
+    assert [(source.kind, source.description) for source in profile.sources] == [
+        ('kwargs', 'kwargs'),
+        ('environment', 'environment'),
+        ('file', str(example_ini)),
+    ]
+    kwargs, environment, file = profile.sources
+    assert kwargs.bytes_read is None
+    assert environment.bytes_read == len('4') + len('true')
+    assert file.bytes_read == example_ini.stat().st_size
+    assert set(file.fields) == {'number', 'floaty_number', 'flag', 'word'}
+
+    assert profile.winners == {
+        'number': 'environment',
+        'floaty_number': str(example_ini),
+        'flag': 'environment',
+        'word': 'kwargs',
+    }
+    assert set(profile.field_seconds()) == set(profile.winners)
+
+
+def test_profile_load_default():
+    """Test that fields left at their defaults have no winning source."""
+    profile = profile_load(ProfiledConfig, _parse_environment=False, number=1, floaty_number=1.0, flag=True)
+    assert profile.winners['word'] is None
+    assert profile.as_dict()['fields']['word'] == {'seconds': 0.0, 'source': None}
+
+
+def test_import_class():
+    """Test importing configuration classes by dotted path."""
+    assert import_class(f'{__name__}:ProfiledConfig') is ProfiledConfig
+    assert import_class(f'{__name__}.ProfiledConfig') is ProfiledConfig
+    with pytest.raises(TypeError):
+        import_class(f'{__name__}:test_import_class')
+
+
+def test_main(monkeypatch, example_ini, capsys):
+    """Test the profile command."""
+    monkeypatch.setattr(sys, 'path', [str(example_ini.parent)] + sys.path)
+    example_ini.with_name('profiled_config_module.py').write_text(
+        'from easy_config import EasyConfig\n'
+        'class Config(EasyConfig):\n'
+        '    FILES = None\n'
+        '    NAME = "MyProgram"\n'
+        '    number: int\n'
+    )
+    assert main(['profile', 'profiled_config_module:Config', '--file', str(example_ini), '--json']) == 0
+    report = json.loads(capsys.readouterr().out)
+    assert report['class'] == 'Config'
+    assert report['fields']['number']['source'] == str(example_ini)
+
+    assert main(['profile', 'profiled_config_module:Config', '--file', str(example_ini)]) == 0
+    output = StringIO(capsys.readouterr().out).readlines()
+    assert output[0].startswith('Loaded Config in ')
+
+    with pytest.raises(SystemExit):
+        main(['profile', 'profiled_config_module:Missing'])
+
+    with pytest.raises(SystemExit):
+        main(['profile', 'profiled_config_module:Config', '--no-environment'])
+    assert 'cannot load `profiled_config_module:Config`: ' in capsys.readouterr().err
+    bad_ini = example_ini.with_name('bad_profiled.ini')
+    bad_ini.write_text('[MyProgram]\nnumber = many')
+    with pytest.raises(SystemExit):
+        main(['profile', 'profiled_config_module:Config', '--file', str(bad_ini)])
+    assert 'could not coerce value for field `number`' in capsys.readouterr().err
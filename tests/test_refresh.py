@@ -0,0 +1,195 @@
+# -*- coding: utf-8 -*-
+
+"""Tests for refreshing configurations with :meth:`easy_config.EasyConfig.refresh`."""
+
+import asyncio
+import copy
+import gc
+from io import StringIO
+
+import pytest
+
+import easy_config
+from easy_config import EasyConfig, file_cache, load_many
+from easy_config.bulk import iter_load
+from easy_config.refresh import FieldChange
+from easy_config.snapshot import SnapshotCache
+
+
+class Counted(str):
+    """A string type that counts how many values are coerced to it."""
+
+    created = 0
+
+    def __new__(cls, value):
+        """Count the value."""
+        cls.created += 1
+        return super().__new__(cls, value)
+
+
+class Opaque:
+    """A type without __eq__, so that its values are only equal to themselves."""
+
+    def __init__(self, value):
+        """Keep the value."""
+        self.value = value
+
+
+class DatabaseConfig(EasyConfig):
+    """A nested configuration class."""
+
+    FILES = None
+    NAME = 'Database'
+
+    host: str
+    port: int = 5432
+
+
+class RefreshedConfig(EasyConfig):
+    """Example EasyConfig subclass to test with."""
+
+    FILES = None
+    NAME = 'Refreshed'
+    FROZEN = True
+    SLOTS = True
+
+    first: Counted
+    second: Counted
+    number: int = 1
+
+
+@pytest.fixture
+def refreshed_ini(tmp_path):
+    """Create an INI file to change between refreshes."""
+    path = tmp_path / 'refreshed.ini'
+    path.write_text('[Refreshed]\nfirst = a\nsecond = b\nnumber = 2')
+    return path
+
+
+def rewrite(path, text):
+    """Change a file, making sure the cache sees the change even if its size and modification time stay the same."""
+    path.write_text(text)
+    file_cache.invalidate(path)
+
+
+def test_refresh(refreshed_ini, monkeypatch):
+    """Test that refreshing only coerces the changed values and reports them."""
+    config = RefreshedConfig.load([refreshed_ini], _refreshable=True)
+    assert config.refresh() == (config, {})
+
+    rewrite(refreshed_ini, '[Refreshed]\nfirst = changed\nsecond = b\nnumber = 2')
+    Counted.created = 0
+    refreshed, changes = config.refresh()
+    assert refreshed == RefreshedConfig(first='changed', second='b', number=2)
+    assert changes == {'first': FieldChange('a', 'changed', str(refreshed_ini))}
+    assert Counted.created == 1
+
+    monkeypatch.setenv('REFRESHED_NUMBER', '3')
+    rewrite(refreshed_ini, '[Refreshed]\nfirst = changed\nsecond = b')
+    refreshed, changes = refreshed.refresh()
+    assert changes == {'number': FieldChange(2, 3, 'environment')}
+    assert Counted.created == 1
+
+    monkeypatch.delenv('REFRESHED_NUMBER')
+    refreshed, changes = refreshed.refresh()
+    assert changes == {'number': FieldChange(3, 1, 'default')}
+    assert refreshed.refresh() == (refreshed, {})
+
+
+def test_refresh_keeps_arguments(refreshed_ini):
+    """Test that refreshing reads the sources given to load() again, with keyword arguments taking priority."""
+    config = RefreshedConfig.load(
+        iter([refreshed_ini]), _parse_environment=False, _refreshable=True, second='given'
+    )
+    rewrite(refreshed_ini, '[Refreshed]\nfirst = a\nsecond = b\nnumber = 5')
+    refreshed, changes = config.refresh()
+    assert refreshed == RefreshedConfig(first='a', second='given', number=5)
+    assert list(changes) == ['number']
+
+
+def test_first_refresh(tmp_path, monkeypatch):
+    """Test that the first refresh compares with the raw values of the load."""
+    class OpaqueConfig(EasyConfig):
+        FILES = None
+        NAME = 'Opaque'
+
+        pattern: Opaque
+        number: int = 1
+
+    path = tmp_path / 'opaque.ini'
+    path.write_text('[Opaque]\npattern = a.*')
+    config = OpaqueConfig.load([path], _refreshable=True)
+    assert config.refresh() == (config, {})
+    rewrite(path, '[Opaque]\npattern = b.*')
+    refreshed, changes = config.refresh()
+    assert list(changes) == ['pattern']
+    assert refreshed.pattern.value == 'b.*'
+
+    monkeypatch.setenv('OPAQUE_PATTERN', 'c.*')
+    config = OpaqueConfig.load([path], _refreshable=True)
+    assert config.refresh() == (config, {})
+
+
+def test_refresh_entry_points(refreshed_ini, tmp_path):
+    """Test that the instances created by every way of loading can be refreshed."""
+    loop = asyncio.new_event_loop()
+    try:
+        loaded = loop.run_until_complete(
+            RefreshedConfig.aload([refreshed_ini], _parse_environment=False, _refreshable=True)
+        )
+    finally:
+        loop.close()
+    configs = [
+        loaded,
+        RefreshedConfig.resolve([refreshed_ini], _parse_environment=False, _refreshable=True)[0],
+        load_many([RefreshedConfig], [refreshed_ini], _parse_environment=False, _refreshable=True)[0],
+        next(iter_load(RefreshedConfig, [refreshed_ini], _parse_environment=False, _refreshable=True)).config,
+        SnapshotCache(tmp_path / 'snapshots').load(
+            RefreshedConfig, [refreshed_ini], _parse_environment=False, _refreshable=True
+        ),
+    ]
+    rewrite(refreshed_ini, '[Refreshed]\nfirst = a\nsecond = b\nnumber = 5')
+    for config in configs:
+        refreshed, changes = config.refresh()
+        assert refreshed == RefreshedConfig(first='a', second='b', number=5)
+        assert list(changes) == ['number']
+
+
+def test_refresh_nested(tmp_path):
+    """Test refreshing fields of nested configuration classes, whose values are merged from every source."""
+    class AppConfig(EasyConfig):
+        FILES = None
+        NAME = 'App'
+
+        db: DatabaseConfig
+
+    path = tmp_path / 'app.ini'
+    path.write_text('[App.db]\nhost = primary')
+    config = AppConfig.load([path], _parse_environment=False, _refreshable=True)
+    assert config.refresh() == (config, {})
+    rewrite(path, '[App.db]\nhost = primary\nport = 1')
+    refreshed, changes = config.refresh()
+    assert changes == {'db': FieldChange(DatabaseConfig('primary'), DatabaseConfig('primary', 1), str(path))}
+
+
+def test_refresh_errors(refreshed_ini):
+    """Test that only instances loaded from paths to be refreshed can be, and that they are forgotten when collected."""
+    with pytest.raises(ValueError):
+        RefreshedConfig(first='a', second='b').refresh()
+    with pytest.raises(ValueError):
+        RefreshedConfig.load([StringIO('[Refreshed]\nfirst = a\nsecond = b')], _refreshable=True)
+
+    gc.collect()
+    records = len(easy_config._load_records)
+    config = RefreshedConfig.load([refreshed_ini])
+    assert len(easy_config._load_records) == records
+    with pytest.raises(ValueError):
+        config.refresh()
+    config = RefreshedConfig.load([refreshed_ini], _refreshable=True)
+    config.refresh()
+    assert len(easy_config._load_records) == records + 1
+    with pytest.raises(ValueError):
+        copy.copy(config).refresh()
+    del config
+    gc.collect()
+    assert len(easy_config._load_records) == records
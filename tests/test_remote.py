@@ -0,0 +1,210 @@
+# -*- coding: utf-8 -*-
+
+"""Tests for reading configuration values from a local stand-in for a configuration service."""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from io import StringIO
+
+import pytest
+
+from easy_config import ConfigSource, ConfigValueCoercionError, EasyConfig
+from easy_config.remote import HTTPSource
+
+
+class ConfigService(ThreadingHTTPServer):
+    """Serve JSON documents by path, with an ETag for each version, and count what the clients do."""
+
+    daemon_threads = True
+
+    def __init__(self) -> None:
+        """Listen on a free port."""
+        super().__init__(('127.0.0.1', 0), ConfigHandler)
+        self.documents = {}
+        self.versions = {}
+        self.connections = 0
+        self.statuses = []
+        #: close each connection after answering, without telling the client
+        self.drop_connections = False
+
+    @property
+    def url(self):
+        """The URL of the service."""
+        return f'http://127.0.0.1:{self.server_address[1]}'
+
+    def publish(self, path, document):
+        """Serve a new version of a document."""
+        self.documents[path] = json.dumps(document).encode()
+        self.versions[path] = self.versions.get(path, 0) + 1
+
+
+class ConfigHandler(BaseHTTPRequestHandler):
+    """Answer with the current version of a document, or 304 if the client has it already."""
+
+    protocol_version = 'HTTP/1.1'  # keep connections alive
+
+    def setup(self):
+        """Count the connections."""
+        super().setup()
+        self.server.connections += 1
+
+    def do_GET(self):  # noqa: N802
+        """Answer a request."""
+        if self.path not in self.server.documents:
+            self.answer(404)
+            return
+        etag = f'"v{self.server.versions[self.path]}"'
+        if self.headers.get('If-None-Match') == etag:
+            self.answer(304, etag=etag)
+        else:
+            self.answer(200, self.server.documents[self.path], etag=etag)
+
+    def answer(self, status, body=b'', etag=None):
+        """Send a response and record its status."""
+        self.server.statuses.append(status)
+        # read before answering, since the client may go on to change it as soon as it has the response
+        self.close_connection = self.server.drop_connections
+        self.send_response(status)
+        if etag is not None:
+            self.send_header('ETag', etag)
+        if status != 304:
+            self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        """Keep the test output quiet."""
+
+
+@pytest.fixture
+def service():
+    """Run a configuration service in a background thread."""
+    server = ConfigService()
+    thread = threading.Thread(target=server.serve_forever, args=(0.01,), daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+class RemoteConfig(EasyConfig):
+    """Example EasyConfig subclass to test with."""
+
+    FILES = None
+    NAME = 'Remote'
+
+    number: int
+    word: str = 'default'
+
+
+def test_conditional_fetches(service):
+    """Test that unchanged documents are revalidated with a 304 over the same connection, and changes are seen."""
+    service.publish('/v1/Remote', {'number': '3', 'word': 'hello'})
+    source = HTTPSource(service.url + '/v1/{name}', ttl=0)
+
+    class Config(RemoteConfig):
+        SOURCES = [source]
+
+    assert Config.load(_parse_environment=False) == Config(number=3, word='hello')
+    assert Config.load(_parse_environment=False) == Config(number=3, word='hello')
+    assert service.statuses == [200, 304]
+    assert (source.misses, source.not_modified, source.hits) == (1, 1, 0)
+
+    service.publish('/v1/Remote', {'number': 4})
+    assert Config.load(_parse_environment=False) == Config(number=4)
+    assert service.statuses == [200, 304, 200]
+    assert service.connections == 1
+    source.close()
+
+
+def test_ttl(service):
+    """Test that fresh responses are used without a request, and that documents without {name} are shared."""
+    service.publish('/all', {'Remote': {'number': 1}, 'Other': {'number': 2}})
+    source = HTTPSource(service.url + '/all', ttl=60)
+
+    class Config(RemoteConfig):
+        SOURCES = [source]
+
+    class OtherConfig(RemoteConfig):
+        NAME = 'Other'
+        SOURCES = [source]
+
+    assert Config.load(_parse_environment=False).number == 1
+    assert OtherConfig.load(_parse_environment=False).number == 2
+    assert service.statuses == [200]
+    assert source.hits == 1
+
+    service.publish('/all', {'Remote': {'number': 5}})
+    assert Config.load(_parse_environment=False).number == 1
+    source.invalidate()
+    assert Config.load(_parse_environment=False).number == 5
+    assert OtherConfig.SOURCES[0].fetch(OtherConfig) is None
+
+
+def test_precedence(service, monkeypatch):
+    """Test that sources override files, are overridden by the environment, and that later sources win."""
+    service.publish('/low/Remote', {'number': 1, 'word': 'low'})
+    service.publish('/high/Remote', {'word': 'high'})
+
+    class Config(RemoteConfig):
+        SOURCES = [HTTPSource(service.url + '/low/{name}'), HTTPSource(service.url + '/high/{name}')]
+
+    ini = '[Remote]\nnumber = 0\nword = file'
+    assert Config.load([StringIO(ini)], _parse_environment=False) == Config(number=1, word='high')
+    monkeypatch.setenv('REMOTE_NUMBER', '2')
+    assert Config.load([StringIO(ini)]) == Config(number=2, word='high')
+    assert Config.resolve(number=7) == (Config(number=7, word='high'), [Config.SOURCES[0].url])
+    assert Config.load_lazy([StringIO(ini)]).word == 'high'
+
+
+def test_missing_and_errors(service):
+    """Test documents that are not found, values that cannot be coerced, and error responses."""
+    class Config(RemoteConfig):
+        SOURCES = [HTTPSource(service.url + '/missing/{name}')]
+
+    assert Config.load(_parse_environment=False, number=1) == Config(number=1)
+
+    service.publish('/bad/Remote', {'number': 'many'})
+    source = HTTPSource(service.url + '/bad/{name}')
+    Config.SOURCES = [source]
+    with pytest.raises(ConfigValueCoercionError) as excinfo:
+        Config.load(_parse_environment=False)
+    assert str(excinfo.value) == (
+        f"While reading the configuration source `{source.url}`, could not coerce value for field `number` to type "
+        "`<class 'int'>`"
+    )
+
+    service.documents['/broken/Remote'] = b'not json'
+    service.versions['/broken/Remote'] = 1
+    with pytest.raises(ValueError):
+        HTTPSource(service.url + '/broken/{name}').fetch(Config)
+    with pytest.raises(ValueError):
+        HTTPSource('ftp://example.com/config')
+
+
+def test_reconnects(service):
+    """Test that a keep-alive connection closed by the service is replaced transparently."""
+    service.publish('/v1/Remote', {'number': 3})
+    source = HTTPSource(service.url + '/v1/{name}', ttl=0)
+    service.drop_connections = True  # as if the service timed out the idle connection
+    assert source.fetch(RemoteConfig) == {'number': 3}
+    service.drop_connections = False
+    assert source.fetch(RemoteConfig) == {'number': 3}
+    assert source.fetch(RemoteConfig) == {'number': 3}
+    assert service.connections == 2
+
+
+def test_custom_source():
+    """Test a source of string values, which are coerced like those of INI files."""
+    class StaticSource(ConfigSource):
+        typed = False
+
+        def fetch(self, config_class):
+            return {'number': '5', 'unknown': 'ignored'}
+
+    class Config(RemoteConfig):
+        SOURCES = [StaticSource()]
+
+    assert Config.load(_parse_environment=False) == Config(number=5)
+    assert list(Config._sources(_parse_environment=False))[1].description == 'test_custom_source.<locals>.StaticSource'
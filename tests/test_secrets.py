@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+
+"""Tests for reading secrets with :mod:`easy_config.secrets`."""
+
+import threading
+import time
+
+import pytest
+
+from easy_config import EasyConfig
+from easy_config.secrets import DirectoryProvider, Secret, SecretProvider, SecretsSource, secret
+
+
+class ScriptedProvider(SecretProvider):
+    """Give out numbered versions of each secret, optionally waiting for permission or failing."""
+
+    def __init__(self, ttl=None):
+        """Start at version 1 of every secret."""
+        self.ttl = ttl
+        self.calls = 0
+        self.allowed = threading.Event()
+        self.allowed.set()
+        self.fail = False
+
+    def get_secret(self, name):
+        """Look up the next version of a secret."""
+        self.allowed.wait()
+        if self.fail:
+            raise RuntimeError('backend unavailable')
+        if name == 'missing':
+            raise KeyError(name)
+        self.calls += 1
+        return Secret(f'{name}-{self.calls}', self.ttl)
+
+
+def wait_for(condition, timeout=5.0):
+    """Wait until condition() is true."""
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, 'timed out'
+        time.sleep(0.005)
+
+
+def test_directory_provider(tmp_path):
+    """Test reading mounted secrets, one per file."""
+    (tmp_path / 'password').write_text('hunter2\n')
+    (tmp_path / 'api').mkdir()
+    (tmp_path / 'api' / 'token').write_text('abc')
+    (tmp_path.parent / 'outside').write_text('no')
+    provider = DirectoryProvider(tmp_path, ttl=10)
+    assert provider.get_secret('password') == Secret('hunter2', 10)
+    assert provider.get_secret('api/token') == Secret('abc', 10)
+    for name in 'missing', 'api', '../outside':
+        with pytest.raises(KeyError):
+            provider.get_secret(name)
+
+
+def test_load_secrets(tmp_path, monkeypatch):
+    """Test that secret fields are read from the provider, and can be overridden like other values."""
+    (tmp_path / 'db-password').write_text('hunter2\n')
+    (tmp_path / 'token').write_text('abc')
+
+    class DatabaseConfig(EasyConfig):
+        FILES = None
+        NAME = 'Database'
+
+        password: str = secret('db-password')
+        host: str = 'localhost'
+
+    class SecretConfig(EasyConfig):
+        FILES = None
+        NAME = 'Secret'
+        SOURCES = [SecretsSource(DirectoryProvider(tmp_path))]
+
+        db: DatabaseConfig
+        token: str = secret()
+        missing: str = secret(default='none')
+
+    assert SecretConfig.load() == SecretConfig(db=DatabaseConfig(password='hunter2'), token='abc')
+    monkeypatch.setenv('SECRET_TOKEN', 'from the environment')
+    assert SecretConfig.load().token == 'from the environment'
+
+    source = SecretConfig.SOURCES[0]
+    (tmp_path / 'token').write_text('changed')
+    assert SecretConfig.load(_parse_environment=False).token == 'abc'  # until it is refreshed
+    assert (source.misses, source.hits) == (3, 6)
+    source.close()
+
+
+def test_background_refresh():
+    """Test that secrets are refreshed before they expire, without loads ever waiting for the provider."""
+    provider = ScriptedProvider(ttl=0.2)
+    source = SecretsSource(provider, refresh_ahead=0.5)
+    assert source.get('token') == 'token-1'
+    wait_for(lambda: source.refreshes >= 1)
+    assert source.get('token') == 'token-2'
+
+    provider.allowed.clear()
+    wait_for(lambda: source.refreshes >= 2 or source._cache['token'].expires < time.monotonic())
+    start = time.monotonic()
+    assert source.get('token') == 'token-2'  # the refresh is waiting for the provider, so the last value is used
+    assert time.monotonic() - start < 0.05
+    provider.allowed.set()
+    wait_for(lambda: source.get('token') == 'token-3')
+    assert source.misses == 1
+    source.close()
+
+
+def test_concurrent_first_loads():
+    """Test that loads waiting for the first lookup of a secret share it, and that it is scheduled to refresh once."""
+    provider = ScriptedProvider()
+    provider.allowed.clear()
+    source = SecretsSource(provider)
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(source.get('token')), daemon=True) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    try:
+        wait_for(lambda: source.misses == 1)
+        time.sleep(0.05)  # let the other loads reach the lookup
+    finally:
+        provider.allowed.set()
+    for thread in threads:
+        thread.join()
+    assert results == ['token-1'] * 8
+    assert provider.calls == 1
+    assert (source.misses, source.hits) == (1, 7)
+    assert source._schedule == [(source._due['token'], 'token')]
+    source.close()
+
+
+def test_refresh_errors():
+    """Test that failed refreshes keep the last value and are retried, and that closed sources look secrets up again."""
+    provider = ScriptedProvider(ttl=0.02)
+    source = SecretsSource(provider, ttl=0.1, refresh_ahead=0.5)
+    assert source.get('token') == 'token-1'
+    assert source.get('missing') is None
+    provider.fail = True
+    wait_for(lambda: source.errors >= 2)
+    assert source.get('token') == 'token-1'
+    provider.fail = False
+    wait_for(lambda: source.get('token') != 'token-1')
+
+    source.close()
+    calls = provider.calls
+    time.sleep(0.03)
+    assert source.get('token') == f'token-{calls + 1}'
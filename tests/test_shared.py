@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+
+"""Tests for sharing configurations between processes with :mod:`easy_config.shared`."""
+
+import multiprocessing
+import sys
+
+import pytest
+
+from easy_config import EasyConfig
+from easy_config.shared import SharedConfig
+
+
+class SharedExampleConfig(EasyConfig):
+    """Example EasyConfig subclass to test with."""
+
+    FILES = None
+    NAME = 'MyProgram'
+
+    number: int
+    word: str = 'default'
+
+
+def test_publish_and_get(tmp_path):
+    """Test that readers get the latest published generation."""
+    path = tmp_path / 'shared.config'
+    master = SharedConfig(path)
+    worker = SharedConfig(path)
+    with pytest.raises(FileNotFoundError):
+        worker.get()
+
+    assert master.publish(SharedExampleConfig(number=1)) == 1
+    first = worker.get()
+    assert first == SharedExampleConfig(number=1)
+    assert worker.generation == 1
+    assert worker.get() is first, 'an unchanged generation should not be read again'
+
+    assert master.publish(SharedExampleConfig(number=2, word='reloaded')) == 2
+    assert worker.get() == SharedExampleConfig(number=2, word='reloaded')
+    assert worker.generation == 2
+    assert SharedConfig(path).publish(SharedExampleConfig(number=3)) == 3, 'generations continue across publishers'
+
+
+def test_not_shared_config(tmp_path):
+    """Test that other files are rejected."""
+    path = tmp_path / 'other'
+    path.write_bytes(b'x' * 64)
+    with pytest.raises(ValueError):
+        SharedConfig(path).get()
+
+
+def get_numbers(shared, queue, published):
+    """Report the number of the shared configuration before and after the master publishes again."""
+    queue.put(shared.get().number)
+    published.wait(10)
+    queue.put(shared.get().number)
+
+
+@pytest.mark.skipif(sys.platform != 'linux', reason='forking workers is only reliable on Linux')
+def test_forked_worker(tmp_path):
+    """Test that a forked worker switches to a generation published after it started."""
+    context = multiprocessing.get_context('fork')
+    shared = SharedConfig(tmp_path / 'shared.config')
+    shared.publish(SharedExampleConfig(number=1))
+    queue = context.Queue()
+    published = context.Event()
+
+    worker = context.Process(target=get_numbers, args=(shared, queue, published))
+    worker.start()
+    assert queue.get(timeout=10) == 1
+    shared.publish(SharedExampleConfig(number=2))
+    published.set()
+    assert queue.get(timeout=10) == 2
+    worker.join()
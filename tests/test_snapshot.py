@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+
+"""Tests for on-disk snapshots with :mod:`easy_config.snapshot`."""
+
+import os
+import stat
+import threading
+from io import StringIO
+
+import pytest
+
+from easy_config import EasyConfig
+from easy_config.snapshot import SnapshotCache
+
+
+class SnapshotConfig(EasyConfig):
+    """Example EasyConfig subclass to test with."""
+
+    FILES = None
+    NAME = 'MyProgram'
+
+    number: int
+    word: str = 'default'
+
+
+@pytest.fixture
+def snapshot_ini(tmp_path):
+    """Create a small INI file to snapshot."""
+    path = tmp_path / 'snapshot.ini'
+    path.write_text('[MyProgram]\nnumber = 1')
+    return path
+
+
+@pytest.fixture
+def snapshots(tmp_path):
+    """Create an empty snapshot cache."""
+    return SnapshotCache(tmp_path / 'snapshots')
+
+
+def test_load(snapshots, snapshot_ini, monkeypatch):
+    """Test that a snapshot is reused until a file, the environment, or the class changes."""
+    assert snapshots.load(SnapshotConfig, [snapshot_ini]) == SnapshotConfig(number=1)
+    assert (snapshots.hits, snapshots.misses) == (0, 1)
+
+    def fail(*_args):
+        raise AssertionError('the file should not have been read')
+
+    with monkeypatch.context() as patch:
+        patch.setattr(SnapshotConfig, '_read_section', fail)
+        assert snapshots.load(SnapshotConfig, [snapshot_ini], word='kwarg') == SnapshotConfig(number=1, word='kwarg')
+    assert (snapshots.hits, snapshots.misses) == (1, 1)
+
+    # same size, and possibly the same modification time, but different contents
+    snapshot_ini.write_text('[MyProgram]\nnumber = 2')
+    assert snapshots.load(SnapshotConfig, [snapshot_ini]) == SnapshotConfig(number=2)
+    assert (snapshots.hits, snapshots.misses) == (1, 2)
+
+    monkeypatch.setenv('MYPROGRAM_WORD', 'environment')
+    assert snapshots.load(SnapshotConfig, [snapshot_ini]) == SnapshotConfig(number=2, word='environment')
+    assert (snapshots.hits, snapshots.misses) == (1, 3)
+
+    class SnapshotConfig2(SnapshotConfig):
+        FILES = None
+        NAME = 'MyProgram'
+
+        number: float
+
+    assert snapshots.load(SnapshotConfig2, [snapshot_ini]) == SnapshotConfig2(number=2.0, word='environment')
+    assert (snapshots.hits, snapshots.misses) == (1, 4)
+
+    assert len(os.listdir(snapshots.directory)) == 2
+    assert stat.S_IMODE(os.stat(os.path.join(snapshots.directory, os.listdir(snapshots.directory)[0])).st_mode) == 0o600
+    snapshots.clear()
+    assert os.listdir(snapshots.directory) == []
+
+
+def test_unreadable_snapshot(snapshots, snapshot_ini):
+    """Test that a corrupt snapshot is replaced."""
+    snapshots.load(SnapshotConfig, [snapshot_ini])
+    (name,) = os.listdir(snapshots.directory)
+    with open(os.path.join(snapshots.directory, name), 'wb') as f:
+        f.write(b'not a pickle')
+    assert snapshots.load(SnapshotConfig, [snapshot_ini]) == SnapshotConfig(number=1)
+    assert snapshots.load(SnapshotConfig, [snapshot_ini]) == SnapshotConfig(number=1)
+    assert (snapshots.hits, snapshots.misses) == (1, 2)
+
+
+def test_open_files_not_snapshotted(snapshots):
+    """Test that loads with open files bypass the cache."""
+    assert snapshots.load(SnapshotConfig, [StringIO('[MyProgram]\nnumber = 3')]) == SnapshotConfig(number=3)
+    assert (snapshots.hits, snapshots.misses) == (0, 0)
+    assert not os.path.exists(snapshots.directory)
+
+
+def test_concurrent_writers(snapshots, snapshot_ini):
+    """Test that concurrent writers leave a single complete snapshot and no temporary files."""
+    errors = []
+
+    def load():
+        try:
+            for _ in range(20):
+                assert SnapshotCache(snapshots.directory).load(SnapshotConfig, [snapshot_ini]).number == 1
+        except Exception as e:  # pragma: no cover
+            errors.append(e)
+
+    threads = [threading.Thread(target=load) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == []
+    assert len(os.listdir(snapshots.directory)) == 1
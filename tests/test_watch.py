@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+
+"""Tests for reloading configurations with :mod:`easy_config.watch`."""
+
+import threading
+from io import StringIO
+
+import pytest
+
+from easy_config import EasyConfig
+from easy_config.watch import ConfigWatcher
+
+
+class WatchedConfig(EasyConfig):
+    """Example EasyConfig subclass to test with."""
+
+    FILES = None
+    NAME = 'MyProgram'
+
+    number: int
+    word: str = 'default'
+
+
+@pytest.fixture
+def watched_ini(tmp_path):
+    """Create a small INI file to watch."""
+    path = tmp_path / 'watched.ini'
+    path.write_text('[MyProgram]\nnumber = 1')
+    return path
+
+
+def test_check(watched_ini):
+    """Test that ConfigWatcher.check only reloads when a file changed."""
+    watcher = ConfigWatcher(WatchedConfig, [watched_ini], _parse_environment=False, word='kwarg')
+    assert watcher.config == WatchedConfig(number=1, word='kwarg')
+    assert watcher.paths == [str(watched_ini)]
+
+    reloaded = []
+    watcher.add_callback(reloaded.append)
+    assert not watcher.check()
+    assert reloaded == []
+
+    watched_ini.write_text('[MyProgram]\nnumber = 22')
+    assert watcher.check()
+    assert reloaded == [WatchedConfig(number=22, word='kwarg')]
+    assert watcher.config == reloaded[0]
+    assert not watcher.check()
+
+
+def test_check_keeps_config_on_error(watched_ini):
+    """Test that a failed reload keeps the previous configuration."""
+    watcher = ConfigWatcher(WatchedConfig, [watched_ini], _parse_environment=False)
+    watched_ini.write_text('[MyProgram]\nnumber = apple')
+    assert not watcher.check()
+    assert watcher.config == WatchedConfig(number=1)
+
+
+def test_open_files_rejected():
+    """Test that open files, which cannot be re-read, are rejected."""
+    with pytest.raises(TypeError):
+        ConfigWatcher(WatchedConfig, [StringIO('[MyProgram]\nnumber = 1')])
+
+
+@pytest.mark.parametrize('use_inotify', [True, False])
+def test_background_reload(watched_ini, use_inotify):
+    """Test that the background thread delivers a reloaded configuration to the callbacks."""
+    reloaded = threading.Event()
+    watcher = ConfigWatcher(
+        WatchedConfig, [watched_ini], _parse_environment=False, poll_interval=0.05, use_inotify=use_inotify
+    )
+    watcher.add_callback(lambda config: reloaded.set())
+    with watcher:
+        replacement = watched_ini.with_name('replacement.ini')
+        replacement.write_text('[MyProgram]\nnumber = 333')
+        replacement.replace(watched_ini)  # the way most editors save files
+        assert reloaded.wait(5)
+    assert watcher.config.number == 333